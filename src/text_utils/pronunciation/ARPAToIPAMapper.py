@@ -1,5 +1,6 @@
 from typing import Dict, Optional, Set
 
+import numpy as np
 from text_utils.pronunciation.arpa_symbols import (AA, AE, AH,
                                                    ALL_ARPA_INCL_STRESSES, AO,
                                                    AW, AX, AXR, AY, CH)
@@ -24,6 +25,7 @@ from text_utils.pronunciation.ipa_symbols import \
     STRESS_PRIMARY as IPA_STRESS_PRIMARY
 from text_utils.pronunciation.ipa_symbols import \
     STRESS_SECONDARY as IPA_STRESS_SECONDARY
+from text_utils.symbol_id_dict import SymbolIdDict
 from text_utils.types import Symbol, Symbols
 
 __ARPABET_IPA_MAP_STRESSLESS: Dict[Symbol, Symbol] = {
@@ -128,3 +130,71 @@ def symbol_map_arpa_to_ipa(arpa_symbol: Symbol, ignore: Set[Symbol], replace_unk
 def symbols_remove_non_arpa_symbols(symbols: Symbols) -> Symbols:
   result = tuple(symbol for symbol in symbols if symbol in ALL_ARPA_INCL_STRESSES)
   return result
+
+
+# markers in the id table
+DROP_ID = -1
+INVALID_ID = -2
+
+
+class ARPAToIPAIdMapper():
+  """maps ARPA symbol ids to IPA symbol ids with one NumPy indexing operation; the result is the same as encoding the result of symbols_map_arpa_to_ipa. Ids which are not in arpa_symbol_ids are treated like unknown symbols. If ipa_symbol_ids is None, it is created from the mapped symbols and replace_unknown_with."""
+
+  def __init__(self, arpa_symbol_ids: SymbolIdDict, ipa_symbol_ids: Optional[SymbolIdDict], ignore: Set[Symbol], replace_unknown: bool, replace_unknown_with: Optional[Symbol]):
+    super().__init__()
+    n_ids = max(arpa_symbol_ids.get_all_symbol_ids(), default=-1) + 1
+    arpa_symbols = [arpa_symbol_ids.get_symbol(symbol_id) if arpa_symbol_ids.id_exists(symbol_id)
+                    else None for symbol_id in range(n_ids)]
+    ipa_symbols = [
+      None if arpa_symbol is None else symbol_map_arpa_to_ipa(
+        arpa_symbol, ignore, replace_unknown, replace_unknown_with)
+      for arpa_symbol in arpa_symbols
+    ]
+    if ipa_symbol_ids is None:
+      new_ipa_symbols = {ipa_symbol for ipa_symbol in ipa_symbols if ipa_symbol is not None}
+      # ids which are not in arpa_symbol_ids are replaced, too
+      if replace_unknown and replace_unknown_with is not None and replace_unknown_with != "":
+        new_ipa_symbols.add(replace_unknown_with)
+      ipa_symbol_ids = SymbolIdDict.init_from_symbols(new_ipa_symbols)
+    self.ipa_symbol_ids = ipa_symbol_ids
+
+    if not replace_unknown:
+      self._unknown_id = INVALID_ID
+    elif replace_unknown_with is None or replace_unknown_with == "":
+      self._unknown_id = DROP_ID
+    elif ipa_symbol_ids.symbol_exists(replace_unknown_with):
+      self._unknown_id = ipa_symbol_ids.get_id(replace_unknown_with)
+    else:
+      self._unknown_id = INVALID_ID
+
+    table = np.full(n_ids, self._unknown_id, dtype=np.int64)
+    for arpa_id, (arpa_symbol, ipa_symbol) in enumerate(zip(arpa_symbols, ipa_symbols)):
+      if arpa_symbol is None:
+        continue
+      if ipa_symbol is None:
+        table[arpa_id] = DROP_ID
+      elif ipa_symbol_ids.symbol_exists(ipa_symbol):
+        table[arpa_id] = ipa_symbol_ids.get_id(ipa_symbol)
+      else:
+        # the IPA symbol can not be encoded
+        table[arpa_id] = self._unknown_id
+    self._table = table
+    self._has_markers = bool((table < 0).any()) or self._unknown_id < 0
+
+  def map_ids(self, arpa_ids: np.ndarray) -> np.ndarray:
+    """maps a sequence of ids; dropped ids are removed, so the result can be shorter"""
+    arpa_ids = np.asarray(arpa_ids, dtype=np.int64)
+    assert arpa_ids.ndim == 1
+    is_known = (arpa_ids >= 0) & (arpa_ids < len(self._table))
+    if is_known.all():
+      result = self._table[arpa_ids]
+    else:
+      result = np.full(len(arpa_ids), self._unknown_id, dtype=np.int64)
+      result[is_known] = self._table[arpa_ids[is_known]]
+    if not self._has_markers:
+      return result
+    if (result == INVALID_ID).any():
+      invalid_ids = sorted(set(arpa_ids[result == INVALID_ID].tolist()))
+      raise ValueError(f"The ids {invalid_ids} can not be mapped to IPA ids!")
+    result = result[result != DROP_ID]
+    return result
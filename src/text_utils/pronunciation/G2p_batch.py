@@ -0,0 +1,62 @@
+from typing import TYPE_CHECKING, List
+
+import numpy as np
+from text_utils.types import Symbols
+
+if TYPE_CHECKING:
+  from g2p_en import G2p
+
+DEFAULT_BATCH_SIZE = 512
+MAX_DECODING_STEPS = 20
+
+
+def predict_batch(model: "G2p", words: List[str], batch_size: int = DEFAULT_BATCH_SIZE) -> List[Symbols]:
+  """does the same greedy decoding as G2p.predict but for many words in one forward pass per batch; the words are sorted by length to keep the padding small"""
+  assert batch_size > 0
+  result: List[Symbols] = [None] * len(words)
+  order = sorted(range(len(words)), key=lambda index: len(words[index]))
+  for start in range(0, len(order), batch_size):
+    batch_indices = order[start:start + batch_size]
+    batch_words = [words[index] for index in batch_indices]
+    batch_predictions = predict_batch_core(model, batch_words)
+    for index, prediction in zip(batch_indices, batch_predictions):
+      result[index] = prediction
+  return result
+
+
+def predict_batch_core(model: "G2p", words: List[str]) -> List[Symbols]:
+  if len(words) == 0:
+    return []
+
+  # encoder
+  lengths = np.array([len(word) + 1 for word in words])
+  max_length = int(lengths.max())
+  x = np.full((len(words), max_length), model.g2idx["<pad>"], dtype=np.int64)
+  for i, word in enumerate(words):
+    chars = list(word) + ["</s>"]
+    x[i, :len(chars)] = [model.g2idx.get(char, model.g2idx["<unk>"]) for char in chars]
+  enc = np.take(model.enc_emb, x, axis=0)
+  # the gru is causal, so the padding does not influence the hidden state at the last real step
+  enc = model.gru(enc, max_length, model.enc_w_ih, model.enc_w_hh, model.enc_b_ih, model.enc_b_hh,
+                  h0=np.zeros((len(words), model.enc_w_hh.shape[-1]), np.float32))
+  last_hidden = enc[np.arange(len(words)), lengths - 1, :]
+
+  # decoder
+  dec = np.take(model.dec_emb, np.full(len(words), 2), axis=0)  # 2: <s>
+  h = last_hidden
+
+  preds: List[List[int]] = [[] for _ in words]
+  finished = np.zeros(len(words), dtype=bool)
+  for _ in range(MAX_DECODING_STEPS):
+    h = model.grucell(dec, h, model.dec_w_ih, model.dec_w_hh, model.dec_b_ih, model.dec_b_hh)
+    logits = np.matmul(h, model.fc_w.T) + model.fc_b
+    pred = logits.argmax(axis=-1)
+    finished |= pred == 3  # 3: </s>
+    for i in np.flatnonzero(~finished):
+      preds[i].append(int(pred[i]))
+    if finished.all():
+      break
+    dec = np.take(model.dec_emb, pred, axis=0)
+
+  result = [tuple(model.idx2p.get(idx, "<unk>") for idx in word_preds) for word_preds in preds]
+  return result
@@ -1,11 +1,17 @@
-from g2p_en import G2p
+from typing import TYPE_CHECKING
 
-CACHE: G2p = None
+if TYPE_CHECKING:
+  from g2p_en import G2p
 
+CACHE: "G2p" = None
 
-def get_eng_g2p() -> G2p:
+
+def get_eng_g2p() -> "G2p":
   # pylint: disable=global-statement
   global CACHE
   if CACHE is None:
+    # g2p_en is imported on first use because loading it is slow
+    # pylint: disable=import-outside-toplevel
+    from g2p_en import G2p
     CACHE = G2p()
   return CACHE
@@ -1,15 +1,33 @@
 from text_utils.pronunciation.ARPAToIPAMapper import (
-    symbols_map_arpa_to_ipa, symbols_remove_non_arpa_symbols)
+    ARPAToIPAIdMapper, symbols_map_arpa_to_ipa,
+    symbols_remove_non_arpa_symbols)
+from text_utils.pronunciation.corpus import (symbols_to_ipa_corpus,
+                                             symbols_to_ipa_corpus_iterable)
+from text_utils.pronunciation.disk_lookup_cache import (
+    DiskLookupCache, get_lookup_cache_namespace)
+from text_utils.pronunciation.epitran_cache import (
+    clear_transliteration_cache, set_transliteration_cache_size)
 from text_utils.pronunciation.ipa2symb import (break_n_thongs,
                                                parse_ipa_to_symbols,
                                                remove_arcs, remove_stress,
                                                remove_tones)
+from text_utils.pronunciation.lru_lookup_cache import (LookupCacheStatistics,
+                                                       LRULookupCache)
 from text_utils.pronunciation.main import (EngToIPAMode, change_ipa,
-                                           chn_to_ipa, eng_to_arpa, eng_to_ipa,
+                                           chn_to_ipa, eng_to_arpa,
+                                           eng_to_arpa_batch, eng_to_ipa,
                                            ger_to_ipa, prepare_symbols_to_ipa,
                                            symbols_to_arpa,
                                            symbols_to_arpa_pronunciation_dict,
                                            symbols_to_ipa)
-from text_utils.pronunciation.stress_detection import (StressType,
+from text_utils.pronunciation.oov_collector import (OOVCollector,
+                                                    get_oov_collector,
+                                                    set_oov_logging,
+                                                    start_oov_collection,
+                                                    stop_oov_collection)
+from text_utils.pronunciation.stress_detection import (StressIdSplitter,
+                                                       StressType,
                                                        split_stress_arpa,
-                                                       split_stress_ipa)
+                                                       split_stress_ipa,
+                                                       split_stresses_arpa,
+                                                       split_stresses_ipa)
@@ -1,15 +1,21 @@
+import json
+import os
 import string
 from copy import copy
-from typing import Optional, Set, Tuple
+from importlib.metadata import version
+from logging import getLogger
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
 
-from dragonmapper import hanzi
 from sentence2pronunciation.core import sentence2pronunciation_cached
 from sentence2pronunciation.lookup_cache import LookupCache
+from text_utils.cache_dir import get_cache_dir
 from text_utils.pronunciation.ipa2symb import (parse_ipa_to_symbols,
                                                reparse_ipa_symbols_to_symbols)
 from text_utils.pronunciation.ipa_symbols import SCHWAS, TONES, VOWELS
+from text_utils.symbol_mapper import SymbolMapper
 from text_utils.types import Symbol, Symbols
-from text_utils.utils import symbols_map
+from text_utils.validation import is_trusted_mode
 
 CHN_PUNCTUATION_MAPPING = {
   "。": ".",
@@ -28,6 +34,8 @@ CHN_PUNCTUATION_MAPPING = {
   '·': "-",
 }
 
+CHN_PUNCTUATION_MAPPER = SymbolMapper(CHN_PUNCTUATION_MAPPING)
+
 CHN_PUNCTUATION: Set[Symbol] = set(CHN_PUNCTUATION_MAPPING.keys()) | set(string.punctuation)
 
 
@@ -42,9 +50,21 @@ def split_into_ipa_and_tones(word: str) -> Tuple[str, str]:
   return word_ipa, word_tones
 
 
+VOWELS_AND_SCHWAS: Set[Symbol] = VOWELS | SCHWAS
+
+CHN_SYLLABLES_FILENAME = "chn_syllables_ipa.json"
+DRAGONMAPPER_TONES = ("1", "2", "3", "4", "5")
+
+# maps the IPA syllables of dragonmapper to their symbols with the tone attached to the vowel
+CHN_SYLLABLES: Optional[Dict[str, Symbols]] = None
+
+DEFAULT_MAX_UNKNOWN_SYLLABLES = 10000
+# syllables which are not in CHN_SYLLABLES, e.g. non Chinese characters which are returned untouched by dragonmapper
+CHN_UNKNOWN_SYLLABLES: Dict[str, Symbols] = {}
+
+
 def is_vowel(symbol: Symbol) -> bool:
-  vowels = VOWELS | SCHWAS
-  result = all(sub_symbol in vowels for sub_symbol in tuple(symbol))
+  result = all(sub_symbol in VOWELS_AND_SCHWAS for sub_symbol in tuple(symbol))
   return result
 
 
@@ -53,40 +73,134 @@ def get_vowel_count(symbols: Symbols) -> int:
   return result
 
 
+def get_syllable_ipa_symbols_with_tones(hanzi_syllable_ipa: str) -> Symbols:
+  syllable_ipa, tone_ipa = split_into_ipa_and_tones(hanzi_syllable_ipa)
+  assert hanzi_syllable_ipa.endswith(tone_ipa)
+  syllable_ipa_symbols = parse_ipa_to_symbols(syllable_ipa)
+  syllable_vowel_count = get_vowel_count(syllable_ipa_symbols)
+  assert tone_ipa == "" or syllable_vowel_count >= 1
+  if syllable_vowel_count == 0:
+    assert hanzi_syllable_ipa == "ɻ"
+
+  if len(tone_ipa) == 0:
+    syllable_ipa_symbols_with_tones = syllable_ipa_symbols
+  else:
+    if syllable_vowel_count <= 1:
+      syllable_ipa_symbols_with_tones = tuple(
+          symbol + tone_ipa if is_vowel(symbol) else symbol for symbol in syllable_ipa_symbols)
+    else:
+      syllable_ipa_symbols_with_tones = [symbol for symbol in syllable_ipa_symbols]
+      for i in range(len(syllable_ipa_symbols)):
+        current_symbol = syllable_ipa_symbols[-i - 1]
+        if is_vowel(current_symbol):
+          syllable_ipa_symbols_with_tones[-i - 1] += tone_ipa
+          break
+      syllable_ipa_symbols_with_tones = tuple(syllable_ipa_symbols_with_tones)
+  return syllable_ipa_symbols_with_tones
+
+
+def get_dragonmapper_version() -> str:
+  return version("dragonmapper")
+
+
+def get_chn_syllables_path() -> Path:
+  return get_cache_dir() / CHN_SYLLABLES_FILENAME
+
+
+def build_chn_syllables() -> Dict[str, Symbols]:
+  """converts every Pinyin syllable in every tone known to dragonmapper"""
+  # pylint: disable=import-outside-toplevel
+  from dragonmapper.data import load_data_file
+  from dragonmapper.transcriptions import pinyin_syllable_to_ipa
+
+  result = {}
+  for line in load_data_file("transcriptions.csv"):
+    pinyin_syllable = line.split(",")[0]
+    for tone in DRAGONMAPPER_TONES:
+      try:
+        hanzi_syllable_ipa = pinyin_syllable_to_ipa(pinyin_syllable + tone)
+      except ValueError:
+        # e.g. the header
+        continue
+      try:
+        result[hanzi_syllable_ipa] = get_syllable_ipa_symbols_with_tones(hanzi_syllable_ipa)
+      except AssertionError:
+        # e.g. "ŋ˥", these syllables are not supported and raise the error on lookup
+        continue
+  return result
+
+
+def save_chn_syllables(syllables: Dict[str, Symbols], path: Path) -> None:
+  data = {
+    "dragonmapper_version": get_dragonmapper_version(),
+    "syllables": syllables,
+  }
+  path.parent.mkdir(parents=True, exist_ok=True)
+  tmp_path = path.parent / f"{path.name}.{os.getpid()}.tmp"
+  with tmp_path.open(mode="w", encoding="utf-8") as f:
+    json.dump(data, f, ensure_ascii=False)
+  os.replace(tmp_path, path)
+
+
+def load_chn_syllables(path: Path) -> Optional[Dict[str, Symbols]]:
+  """returns None if the table was created with another version of dragonmapper"""
+  with path.open(mode="r", encoding="utf-8") as f:
+    data = json.load(f)
+  if data["dragonmapper_version"] != get_dragonmapper_version():
+    return None
+  result = {
+    hanzi_syllable_ipa: tuple(symbols) for hanzi_syllable_ipa, symbols in data["syllables"].items()
+  }
+  return result
+
+
+def get_chn_syllables() -> Dict[str, Symbols]:
+  # pylint: disable=global-statement
+  global CHN_SYLLABLES
+  if CHN_SYLLABLES is None:
+    path = get_chn_syllables_path()
+    if path.is_file():
+      CHN_SYLLABLES = load_chn_syllables(path)
+    if CHN_SYLLABLES is None:
+      CHN_SYLLABLES = build_chn_syllables()
+      try:
+        save_chn_syllables(CHN_SYLLABLES, path)
+      except OSError as error:
+        logger = getLogger(__name__)
+        logger.warning(f"Saving the Chinese syllables failed ({error}), therefore they are kept in memory.")
+  return CHN_SYLLABLES
+
+
+def get_chn_syllable_ipa(hanzi_syllable_ipa: str) -> Symbols:
+  syllables = get_chn_syllables()
+  result = syllables.get(hanzi_syllable_ipa)
+  if result is not None:
+    return result
+  if hanzi_syllable_ipa in CHN_UNKNOWN_SYLLABLES:
+    return CHN_UNKNOWN_SYLLABLES[hanzi_syllable_ipa]
+  result = get_syllable_ipa_symbols_with_tones(hanzi_syllable_ipa)
+  if len(CHN_UNKNOWN_SYLLABLES) >= DEFAULT_MAX_UNKNOWN_SYLLABLES:
+    CHN_UNKNOWN_SYLLABLES.clear()
+  CHN_UNKNOWN_SYLLABLES[hanzi_syllable_ipa] = result
+  return result
+
+
 def __get_chn_ipa(word: Symbols) -> Symbols:
   # e.g. -> 北风 = peɪ˧˩˧ fɤ˥ŋ
   assert isinstance(word, tuple)
   assert len(word) > 0
 
+  # dragonmapper is imported on first use because loading it is slow
+  # pylint: disable=import-outside-toplevel
+  from dragonmapper import hanzi
+
   word_str = ''.join(word)
   syllable_split_symbol = " "
   hanzi_ipa = hanzi.to_ipa(word_str, delimiter=syllable_split_symbol)
   hanzi_syllables_ipa = hanzi_ipa.split(syllable_split_symbol)
   word_ipa_symbols = []
   for hanzi_syllable_ipa in hanzi_syllables_ipa:
-    syllable_ipa, tone_ipa = split_into_ipa_and_tones(hanzi_syllable_ipa)
-    assert hanzi_syllable_ipa.endswith(tone_ipa)
-    syllable_ipa_symbols = parse_ipa_to_symbols(syllable_ipa)
-    syllable_vowel_count = get_vowel_count(syllable_ipa_symbols)
-    assert tone_ipa == "" or syllable_vowel_count >= 1
-    if syllable_vowel_count == 0:
-      assert hanzi_syllable_ipa == "ɻ"
-
-    if len(tone_ipa) == 0:
-      syllable_ipa_symbols_with_tones = syllable_ipa_symbols
-    else:
-      if syllable_vowel_count <= 1:
-        syllable_ipa_symbols_with_tones = tuple(
-            symbol + tone_ipa if is_vowel(symbol) else symbol for symbol in syllable_ipa_symbols)
-      else:
-        syllable_ipa_symbols_with_tones = [symbol for symbol in syllable_ipa_symbols]
-        for i in range(len(syllable_ipa_symbols)):
-          current_symbol = syllable_ipa_symbols[-i - 1]
-          if is_vowel(current_symbol):
-            syllable_ipa_symbols_with_tones[-i - 1] += tone_ipa
-            break
-        syllable_ipa_symbols_with_tones = tuple(syllable_ipa_symbols_with_tones)
-    word_ipa_symbols.extend(syllable_ipa_symbols_with_tones)
+    word_ipa_symbols.extend(get_chn_syllable_ipa(hanzi_syllable_ipa))
   symbols = tuple(word_ipa_symbols)
   return symbols
 
@@ -103,9 +217,10 @@ def chn_to_ipa(chn_sentence: Symbols, consider_annotations: bool, annotation_spl
     cache=cache,
   )
 
-  symbols = symbols_map(symbols, CHN_PUNCTUATION_MAPPING)
+  symbols = CHN_PUNCTUATION_MAPPER.map(symbols)
 
-  symbols_rejoined = reparse_ipa_symbols_to_symbols(symbols)
-  assert symbols_rejoined == symbols
+  if not is_trusted_mode():
+    symbols_rejoined = reparse_ipa_symbols_to_symbols(symbols)
+    assert symbols_rejoined == symbols
 
   return symbols
@@ -0,0 +1,150 @@
+import json
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple, Union
+
+import numpy as np
+from pronunciation_dict_parser import PronunciationDict
+from text_utils.types import Symbol, Symbols
+
+MAGIC = b"TUPD"
+VERSION = 1
+# magic, version, header length
+PREAMBLE = struct.Struct("<4sII")
+ALIGNMENT = 8
+
+Pronunciations = Tuple[Symbols, ...]
+
+
+def compile_pronunciation_dict(pronunciation_dict: PronunciationDict, path: Path) -> None:
+  """writes the dictionary with upper case keys (like pronunciation_dict_to_tuple_dict) into a binary file which can be memory-mapped with load_compiled_pronunciation_dict"""
+  upper_dict: Dict[bytes, List[Symbols]] = {}
+  for word, pronunciations in pronunciation_dict.items():
+    upper_dict[word.upper().encode("utf-8")] = list(pronunciations)
+
+  phonemes = sorted({phoneme for pronunciations in upper_dict.values()
+                    for pronunciation in pronunciations for phoneme in pronunciation})
+  phoneme_ids = {phoneme: phoneme_id for phoneme_id, phoneme in enumerate(phonemes)}
+  phoneme_dtype = np.uint8 if len(phonemes) <= np.iinfo(np.uint8).max + 1 else np.uint16
+
+  words = sorted(upper_dict.keys())
+  key_offsets = [0]
+  pronunciation_offsets = [0]
+  phoneme_offsets = [0]
+  phoneme_blob: List[int] = []
+  for word in words:
+    key_offsets.append(key_offsets[-1] + len(word))
+    for pronunciation in upper_dict[word]:
+      phoneme_blob.extend(phoneme_ids[phoneme] for phoneme in pronunciation)
+      phoneme_offsets.append(len(phoneme_blob))
+    pronunciation_offsets.append(len(phoneme_offsets) - 1)
+
+  sections = [
+    ("keys", np.frombuffer(b"".join(words), dtype=np.uint8)),
+    ("key_offsets", np.array(key_offsets, dtype=np.uint32)),
+    ("pronunciation_offsets", np.array(pronunciation_offsets, dtype=np.uint32)),
+    ("phoneme_offsets", np.array(phoneme_offsets, dtype=np.uint32)),
+    ("phonemes", np.array(phoneme_blob, dtype=phoneme_dtype)),
+  ]
+
+  header = {
+    "phoneme_inventory": phonemes,
+    "sections": {},
+  }
+  # section positions are relative to the end of the header
+  position = 0
+  for name, array in sections:
+    header["sections"][name] = (position, array.dtype.str, len(array))
+    position = get_aligned(position + array.nbytes)
+  header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+  header_bytes += b" " * (get_aligned(PREAMBLE.size + len(header_bytes)) -
+                          PREAMBLE.size - len(header_bytes))
+
+  # write to a temporary file first, so that other processes never see a partially written file
+  tmp_path = path.parent / f"{path.name}.{os.getpid()}.tmp"
+  with tmp_path.open(mode="wb") as f:
+    f.write(PREAMBLE.pack(MAGIC, VERSION, len(header_bytes)))
+    f.write(header_bytes)
+    for _, array in sections:
+      data = array.tobytes()
+      f.write(data)
+      f.write(b"\0" * (get_aligned(len(data)) - len(data)))
+  os.replace(tmp_path, path)
+
+
+def get_aligned(position: int) -> int:
+  return (position + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class CompiledPronunciationDict(Mapping):
+  """read-only view on a compiled dictionary; the file is memory-mapped, so forked processes share its pages"""
+
+  def __init__(self, path: Path):
+    super().__init__()
+    with path.open(mode="rb") as f:
+      self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, header_length = PREAMBLE.unpack_from(self._mmap, 0)
+    if magic != MAGIC or version != VERSION:
+      raise ValueError(f"\"{path}\" is no compiled pronunciation dictionary of version {VERSION}!")
+    header = json.loads(self._mmap[PREAMBLE.size:PREAMBLE.size + header_length].decode("utf-8"))
+    data_start = PREAMBLE.size + header_length
+    arrays = {
+      name: np.frombuffer(self._mmap, dtype=np.dtype(dtype), count=count, offset=data_start + offset)
+      for name, (offset, dtype, count) in header["sections"].items()
+    }
+    self._phoneme_inventory: List[Symbol] = header["phoneme_inventory"]
+    self._keys: np.ndarray = arrays["keys"]
+    self._key_offsets: np.ndarray = arrays["key_offsets"]
+    self._pronunciation_offsets: np.ndarray = arrays["pronunciation_offsets"]
+    self._phoneme_offsets: np.ndarray = arrays["phoneme_offsets"]
+    self._phonemes: np.ndarray = arrays["phonemes"]
+
+  def _get_key(self, index: int) -> bytes:
+    return self._keys[self._key_offsets[index]:self._key_offsets[index + 1]].tobytes()
+
+  def _get_index(self, word: Union[str, Symbols]) -> int:
+    if isinstance(word, tuple):
+      word = ''.join(word)
+    if not isinstance(word, str):
+      return -1
+    key = word.encode("utf-8")
+    low, high = 0, len(self)
+    while low < high:
+      middle = (low + high) // 2
+      if self._get_key(middle) < key:
+        low = middle + 1
+      else:
+        high = middle
+    if low < len(self) and self._get_key(low) == key:
+      return low
+    return -1
+
+  def _get_pronunciations(self, index: int) -> Pronunciations:
+    result = []
+    for pronunciation_index in range(self._pronunciation_offsets[index], self._pronunciation_offsets[index + 1]):
+      phoneme_ids = self._phonemes[self._phoneme_offsets[pronunciation_index]:self._phoneme_offsets[pronunciation_index + 1]]
+      result.append(tuple(self._phoneme_inventory[phoneme_id] for phoneme_id in phoneme_ids))
+    return tuple(result)
+
+  def __getitem__(self, word: Union[str, Symbols]) -> Pronunciations:
+    index = self._get_index(word)
+    if index == -1:
+      raise KeyError(word)
+    return self._get_pronunciations(index)
+
+  def __contains__(self, word: object) -> bool:
+    return self._get_index(word) != -1
+
+  def __iter__(self) -> Iterator[Symbols]:
+    for index in range(len(self)):
+      yield tuple(self._get_key(index).decode("utf-8"))
+
+  def __len__(self) -> int:
+    return len(self._key_offsets) - 1
+
+
+def load_compiled_pronunciation_dict(path: Path) -> CompiledPronunciationDict:
+  return CompiledPronunciationDict(path)
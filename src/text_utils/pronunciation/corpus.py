@@ -0,0 +1,99 @@
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
+
+from sentence2pronunciation.lookup_cache import LookupCache, get_empty_cache
+from text_utils.language import Language
+from text_utils.pronunciation.main import (EngToIPAMode,
+                                           prepare_symbols_to_ipa,
+                                           symbols_to_ipa)
+from text_utils.symbol_format import SymbolFormat
+from text_utils.types import Symbols
+
+DEFAULT_CHUNKSIZE = 256
+DEFAULT_MAX_PENDING_CHUNKS_PER_JOB = 4
+
+Result = Tuple[Symbols, SymbolFormat]
+
+# state of the worker processes, it is set once per process in init_worker
+WORKER_SETTINGS: Optional[Tuple[SymbolFormat, Language,
+                                Optional[EngToIPAMode], Optional[bool]]] = None
+WORKER_CACHE: Optional[LookupCache] = None
+
+
+def init_worker(symbols_format: SymbolFormat, lang: Language, mode: Optional[EngToIPAMode], consider_annotations: Optional[bool], cache: Optional[LookupCache]) -> None:
+  # pylint: disable=global-statement
+  global WORKER_SETTINGS
+  global WORKER_CACHE
+  prepare_symbols_to_ipa(symbols_format, lang, mode)
+  WORKER_SETTINGS = (symbols_format, lang, mode, consider_annotations)
+  WORKER_CACHE = get_empty_cache() if cache is None else cache
+
+
+def process_chunk(chunk: List[Symbols]) -> List[Result]:
+  assert WORKER_SETTINGS is not None
+  symbols_format, lang, mode, consider_annotations = WORKER_SETTINGS
+  result = [
+    symbols_to_ipa(
+      symbols=symbols,
+      symbols_format=symbols_format,
+      lang=lang,
+      mode=mode,
+      consider_annotations=consider_annotations,
+      cache=WORKER_CACHE,
+    )
+    for symbols in chunk
+  ]
+  return result
+
+
+def get_chunks(corpus: Iterable[Symbols], chunksize: int) -> Iterator[List[Symbols]]:
+  iterator = iter(corpus)
+  while True:
+    chunk = list(islice(iterator, chunksize))
+    if len(chunk) == 0:
+      return
+    yield chunk
+
+
+def symbols_to_ipa_corpus_iterable(corpus: Iterable[Symbols], symbols_format: SymbolFormat, lang: Language, mode: Optional[EngToIPAMode], consider_annotations: Optional[bool], n_jobs: int, chunksize: int = DEFAULT_CHUNKSIZE, max_pending_chunks: Optional[int] = None, cache: Optional[LookupCache] = None) -> Iterator[Result]:
+  """converts the corpus with symbols_to_ipa in n_jobs processes and yields the results in input order; the corpus is read lazily and at most max_pending_chunks chunks are in process at the same time, so the memory is bounded"""
+  assert n_jobs > 0
+  assert chunksize > 0
+  if max_pending_chunks is None:
+    max_pending_chunks = n_jobs * DEFAULT_MAX_PENDING_CHUNKS_PER_JOB
+  assert max_pending_chunks > 0
+
+  initargs = (symbols_format, lang, mode, consider_annotations, cache)
+  chunks = get_chunks(corpus, chunksize)
+
+  if n_jobs == 1:
+    init_worker(*initargs)
+    for chunk in chunks:
+      yield from process_chunk(chunk)
+    return
+
+  with Pool(processes=n_jobs, initializer=init_worker, initargs=initargs) as pool:
+    pending: Deque = deque()
+    for chunk in chunks:
+      pending.append(pool.apply_async(process_chunk, (chunk,)))
+      if len(pending) >= max_pending_chunks:
+        yield from pending.popleft().get()
+    while len(pending) > 0:
+      yield from pending.popleft().get()
+
+
+def symbols_to_ipa_corpus(corpus: Iterable[Symbols], symbols_format: SymbolFormat, lang: Language, mode: Optional[EngToIPAMode], consider_annotations: Optional[bool], n_jobs: int, chunksize: int = DEFAULT_CHUNKSIZE, max_pending_chunks: Optional[int] = None, cache: Optional[LookupCache] = None) -> List[Result]:
+  result = list(symbols_to_ipa_corpus_iterable(
+    corpus=corpus,
+    symbols_format=symbols_format,
+    lang=lang,
+    mode=mode,
+    consider_annotations=consider_annotations,
+    n_jobs=n_jobs,
+    chunksize=chunksize,
+    max_pending_chunks=max_pending_chunks,
+    cache=cache,
+  ))
+  return result
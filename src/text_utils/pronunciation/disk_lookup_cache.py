@@ -0,0 +1,170 @@
+import json
+import os
+import sqlite3
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from sentence2pronunciation.types import Pronunciation
+from text_utils.language import Language
+from text_utils.pronunciation.main import EngToIPAMode
+from text_utils.symbol_format import SymbolFormat
+
+DEFAULT_COMMIT_EVERY = 1000
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_MAX_MEMORY_ENTRIES = 100000
+# is increased if the meaning of the cached pronunciations changes, e.g. version 2 contains only IPA pronunciations for LIBRISPEECH
+LOOKUP_CACHE_VERSION = 2
+
+
+def get_lookup_cache_namespace(symbols_format: SymbolFormat, lang: Language, mode: Optional[EngToIPAMode], ignore_case: bool) -> str:
+  """symbols_format is the format of the cached pronunciations, e.g. PHONEMES_ARPA for eng_to_arpa and PHONEMES_IPA for eng_to_ipa"""
+  mode_str = "" if mode is None else mode.name
+  case_str = "ignore_case" if ignore_case else "match_case"
+  namespace = f"v{LOOKUP_CACHE_VERSION}/{symbols_format.name}/{lang!s}/{mode_str}/{case_str}"
+  return namespace
+
+
+def serialize_pronunciation(pronunciation: Pronunciation) -> str:
+  return json.dumps(pronunciation, ensure_ascii=False, separators=(",", ":"))
+
+
+def deserialize_pronunciation(serialized: str) -> Pronunciation:
+  return tuple(json.loads(serialized))
+
+
+class DiskLookupCache(MutableMapping):
+  """SQLite based LookupCache which persists the pronunciations between runs. It can be read by multiple processes at the same time, writes are committed in blocks of `commit_every` entries and on close (or, as a fallback, when the cache is garbage collected). At most `max_memory_entries` recently used entries are additionally held in memory."""
+
+  def __init__(self, path: Path, namespace: str, commit_every: int = DEFAULT_COMMIT_EVERY, timeout: float = DEFAULT_TIMEOUT, max_memory_entries: int = DEFAULT_MAX_MEMORY_ENTRIES):
+    super().__init__()
+    assert commit_every > 0
+    assert max_memory_entries > 0
+    self._path = path
+    self._namespace = namespace
+    self._commit_every = commit_every
+    self._timeout = timeout
+    self._max_memory_entries = max_memory_entries
+    self._memory: "OrderedDict[Pronunciation, Pronunciation]" = OrderedDict()
+    # serialized word -> serialized pronunciation of the entries which are not committed yet
+    self._pending: Dict[str, str] = {}
+    self._connection: Optional[sqlite3.Connection] = None
+    self._pid: Optional[int] = None
+
+  @property
+  def namespace(self) -> str:
+    return self._namespace
+
+  def _get_connection(self) -> sqlite3.Connection:
+    # connections must not be shared between forked processes
+    if self._connection is None or self._pid != os.getpid():
+      self._connection = sqlite3.connect(str(self._path), timeout=self._timeout)
+      self._pid = os.getpid()
+      self._connection.execute("PRAGMA journal_mode=WAL")
+      self._connection.execute("PRAGMA synchronous=NORMAL")
+      self._connection.execute(
+        "CREATE TABLE IF NOT EXISTS lookup_cache (namespace TEXT NOT NULL, word TEXT NOT NULL, pronunciation TEXT NOT NULL, PRIMARY KEY (namespace, word)) WITHOUT ROWID")
+      self._connection.commit()
+    return self._connection
+
+  def _remember(self, word: Pronunciation, pronunciation: Pronunciation) -> None:
+    self._memory[word] = pronunciation
+    self._memory.move_to_end(word)
+    if len(self._memory) > self._max_memory_entries:
+      self._memory.popitem(last=False)
+
+  def __getitem__(self, word: Pronunciation) -> Pronunciation:
+    if word in self._memory:
+      self._memory.move_to_end(word)
+      return self._memory[word]
+    serialized_word = serialize_pronunciation(word)
+    if serialized_word in self._pending:
+      serialized_pronunciation = self._pending[serialized_word]
+    else:
+      row = self._get_connection().execute(
+        "SELECT pronunciation FROM lookup_cache WHERE namespace = ? AND word = ?",
+        (self._namespace, serialized_word),
+      ).fetchone()
+      if row is None:
+        raise KeyError(word)
+      serialized_pronunciation = row[0]
+    pronunciation = deserialize_pronunciation(serialized_pronunciation)
+    self._remember(word, pronunciation)
+    return pronunciation
+
+  def __contains__(self, word: object) -> bool:
+    try:
+      self[word]
+    except KeyError:
+      return False
+    return True
+
+  def __setitem__(self, word: Pronunciation, pronunciation: Pronunciation) -> None:
+    self._remember(word, pronunciation)
+    self._pending[serialize_pronunciation(word)] = serialize_pronunciation(pronunciation)
+    if len(self._pending) >= self._commit_every:
+      self.flush()
+
+  def __delitem__(self, word: Pronunciation) -> None:
+    self.flush()
+    cursor = self._get_connection().execute(
+      "DELETE FROM lookup_cache WHERE namespace = ? AND word = ?",
+      (self._namespace, serialize_pronunciation(word)),
+    )
+    self._get_connection().commit()
+    was_in_memory = self._memory.pop(word, None) is not None
+    if cursor.rowcount == 0 and not was_in_memory:
+      raise KeyError(word)
+
+  def __iter__(self) -> Iterator[Pronunciation]:
+    self.flush()
+    rows = self._get_connection().execute(
+      "SELECT word FROM lookup_cache WHERE namespace = ?", (self._namespace,)).fetchall()
+    return (deserialize_pronunciation(row[0]) for row in rows)
+
+  def __len__(self) -> int:
+    self.flush()
+    row = self._get_connection().execute(
+      "SELECT COUNT(*) FROM lookup_cache WHERE namespace = ?", (self._namespace,)).fetchone()
+    return row[0]
+
+  def flush(self) -> None:
+    if len(self._pending) == 0:
+      return
+    connection = self._get_connection()
+    connection.executemany(
+      "INSERT OR REPLACE INTO lookup_cache (namespace, word, pronunciation) VALUES (?, ?, ?)",
+      ((self._namespace, word, pronunciation) for word, pronunciation in self._pending.items()),
+    )
+    connection.commit()
+    self._pending.clear()
+
+  def close(self) -> None:
+    self.flush()
+    if self._connection is not None and self._pid == os.getpid():
+      self._connection.close()
+    self._connection = None
+    self._pid = None
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback) -> None:
+    self.close()
+
+  def __del__(self) -> None:
+    # best effort if close was not called; it can fail e.g. at interpreter shutdown
+    try:
+      self.close()
+    except Exception:  # pylint: disable=broad-except
+      pass
+
+  def __getstate__(self):
+    self.flush()
+    state = self.__dict__.copy()
+    state["_connection"] = None
+    state["_pid"] = None
+    state["_pending"] = {}
+    state["_memory"] = OrderedDict()
+    return state
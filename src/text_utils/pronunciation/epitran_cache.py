@@ -1,43 +1,122 @@
-from logging import getLogger
-from typing import Dict
+from collections import OrderedDict
+from logging import WARNING, getLogger
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
-from epitran import Epitran
+if TYPE_CHECKING:
+  from epitran import Epitran
 
 EPITRAN_ENG = 'eng-Latn'
 EPITRAN_GER = 'deu-Latn'
 
-EPITRAN_CACHE: Dict[str, Epitran] = {}
+EPITRAN_LOGGER_NAME = "epitran"
 
+EPITRAN_CACHE: Dict[str, "Epitran"] = {}
+EPITRAN_CACHE_LOCK = Lock()
 
-def get_eng_epitran() -> Epitran:
+DEFAULT_TRANSLITERATION_CACHE_SIZE = 100000
+# maps (code, word) to the transliterated word, the least recently used entries are removed first
+TRANSLITERATION_CACHE: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+TRANSLITERATION_CACHE_SIZE: Optional[int] = DEFAULT_TRANSLITERATION_CACHE_SIZE
+TRANSLITERATION_CACHE_LOCK = Lock()
+
+
+def quiet_epitran_logging() -> None:
+  getLogger(EPITRAN_LOGGER_NAME).setLevel(WARNING)
+
+
+def load_epitran(code: str) -> "Epitran":
+  # epitran is imported on first use because loading it is slow
+  # importing epitran changes the level of the root logger (logging.basicConfig), therefore it is restored
+  root_logger = getLogger()
+  old_level = root_logger.level
+  # pylint: disable=import-outside-toplevel
+  from epitran import Epitran
+  result = Epitran(code)
+  root_logger.setLevel(old_level)
+  # silence the backend once instead of changing the level of the root logger for every word
+  quiet_epitran_logging()
+  return result
+
+
+def get_eng_epitran() -> "Epitran":
   # pylint: disable=global-statement
   global EPITRAN_CACHE
   ensure_eng_epitran_is_loaded()
   return EPITRAN_CACHE[EPITRAN_ENG]
 
 
-def get_ger_epitran() -> Epitran:
+def get_ger_epitran() -> "Epitran":
   # pylint: disable=global-statement
   global EPITRAN_CACHE
   ensure_ger_epitran_is_loaded()
   return EPITRAN_CACHE[EPITRAN_GER]
 
 
+def get_epitran(code: str) -> "Epitran":
+  if code == EPITRAN_ENG:
+    return get_eng_epitran()
+  if code == EPITRAN_GER:
+    return get_ger_epitran()
+  assert False
+
+
 def ensure_eng_epitran_is_loaded() -> None:
   # pylint: disable=global-statement
   global EPITRAN_CACHE
-  if EPITRAN_ENG not in EPITRAN_CACHE.keys():
-    logger = getLogger()
-    logger.info("Loading English Epitran...")
-    EPITRAN_CACHE[EPITRAN_ENG] = Epitran(EPITRAN_ENG)
-    logger.info("Done.")
+  with EPITRAN_CACHE_LOCK:
+    if EPITRAN_ENG not in EPITRAN_CACHE.keys():
+      logger = getLogger()
+      logger.info("Loading English Epitran...")
+      EPITRAN_CACHE[EPITRAN_ENG] = load_epitran(EPITRAN_ENG)
+      logger.info("Done.")
 
 
 def ensure_ger_epitran_is_loaded() -> None:
   # pylint: disable=global-statement
   global EPITRAN_CACHE
-  if EPITRAN_GER not in EPITRAN_CACHE.keys():
-    logger = getLogger()
-    logger.info("Loading German Epitran...")
-    EPITRAN_CACHE[EPITRAN_GER] = Epitran(EPITRAN_GER)
-    logger.info("Done.")
+  with EPITRAN_CACHE_LOCK:
+    if EPITRAN_GER not in EPITRAN_CACHE.keys():
+      logger = getLogger()
+      logger.info("Loading German Epitran...")
+      EPITRAN_CACHE[EPITRAN_GER] = load_epitran(EPITRAN_GER)
+      logger.info("Done.")
+
+
+def set_transliteration_cache_size(size: Optional[int]) -> None:
+  """None means the cache is unbounded and 0 disables it"""
+  # pylint: disable=global-statement
+  global TRANSLITERATION_CACHE_SIZE
+  assert size is None or size >= 0
+  with TRANSLITERATION_CACHE_LOCK:
+    TRANSLITERATION_CACHE_SIZE = size
+    shrink_transliteration_cache()
+
+
+def clear_transliteration_cache() -> None:
+  with TRANSLITERATION_CACHE_LOCK:
+    TRANSLITERATION_CACHE.clear()
+
+
+def shrink_transliteration_cache() -> None:
+  if TRANSLITERATION_CACHE_SIZE is None:
+    return
+  while len(TRANSLITERATION_CACHE) > TRANSLITERATION_CACHE_SIZE:
+    TRANSLITERATION_CACHE.popitem(last=False)
+
+
+def transliterate(code: str, word: str) -> str:
+  """transliterates the word with the Epitran instance of the code; the results are cached, so it can be called from many threads"""
+  key = (code, word)
+  with TRANSLITERATION_CACHE_LOCK:
+    if key in TRANSLITERATION_CACHE:
+      TRANSLITERATION_CACHE.move_to_end(key)
+      return TRANSLITERATION_CACHE[key]
+
+  epi_instance = get_epitran(code)
+  result = epi_instance.transliterate(word)
+
+  with TRANSLITERATION_CACHE_LOCK:
+    TRANSLITERATION_CACHE[key] = result
+    shrink_transliteration_cache()
+  return result
@@ -1,6 +1,5 @@
-from typing import Iterable, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-import numpy as np
 from text_utils.language import Language
 from text_utils.pronunciation.ipa_symbols import (APPENDIX, CHARACTERS,
                                                   CONSONANTS,
@@ -113,14 +112,167 @@ def remove_stress(symbols: Symbols) -> Symbols:
   return new_symbols
 
 
+class IPATransform():
+  """applies remove_arcs, remove_tones, remove_stress and break_n_thongs (in this order) like change_ipa does; the removals are computed once per distinct symbol"""
+
+  def __init__(self, ignore_tones: bool, ignore_arcs: bool, ignore_stress: bool, break_n_thongs: bool):
+    super().__init__()
+    self._ignore_tones = ignore_tones
+    self._ignore_arcs = ignore_arcs
+    self._ignore_stress = ignore_stress
+    self._break_n_thongs = break_n_thongs
+    removed_characters = set()
+    if ignore_arcs:
+      removed_characters |= TIES
+    if ignore_tones:
+      removed_characters |= TONES
+    if ignore_stress:
+      removed_characters |= STRESSES
+    self._removal_table = {ord(character): None for character in removed_characters}
+    self._symbol_cache: Dict[Symbol, Symbols] = {}
+
+  def _transform_symbol(self, symbol: Symbol) -> Symbols:
+    if symbol != "" and symbol.translate(self._removal_table) == symbol:
+      # contains nothing that could be removed
+      return (symbol,)
+    new_symbols = (symbol,)
+    if self._ignore_arcs:
+      new_symbols = remove_arcs(new_symbols)
+    if self._ignore_tones:
+      new_symbols = remove_tones(new_symbols)
+    if self._ignore_stress:
+      new_symbols = remove_stress(new_symbols)
+    return new_symbols
+
+  def __call__(self, symbols: Symbols) -> Symbols:
+    cache = self._symbol_cache
+    new_symbols = []
+    for symbol in symbols:
+      if symbol not in cache:
+        cache[symbol] = self._transform_symbol(symbol)
+      new_symbols.extend(cache[symbol])
+
+    if self._break_n_thongs:
+      return tokenize_ipa(''.join(new_symbols))
+    return tuple(new_symbols)
+
+
+IPA_TRANSFORMS: Dict[Tuple[bool, bool, bool, bool], IPATransform] = {}
+
+
+def get_ipa_transform(ignore_tones: bool, ignore_arcs: bool, ignore_stress: bool, break_n_thongs: bool) -> IPATransform:
+  key = (ignore_tones, ignore_arcs, ignore_stress, break_n_thongs)
+  if key not in IPA_TRANSFORMS:
+    IPA_TRANSFORMS[key] = IPATransform(ignore_tones, ignore_arcs, ignore_stress, break_n_thongs)
+  return IPA_TRANSFORMS[key]
+
+
 def reparse_ipa_symbols_to_symbols(symbols: Symbols) -> Symbols:
   symbols_str = ''.join(symbols)
   return parse_ipa_to_symbols(symbols_str)
 
 
 def parse_ipa_to_symbols(sentence: str) -> Symbols:
-  all_symbols = tuple(sentence)
-  return parse_ipa_symbols_to_symbols(all_symbols)
+  return tokenize_ipa(sentence)
+
+
+CHARACTER_CLASS_OTHER = 0
+CHARACTER_CLASS_TIE = 1
+CHARACTER_CLASS_PUNCTUATION_AND_WHITESPACE = 2
+CHARACTER_CLASS_APPENDIX = 3
+CHARACTER_CLASS_STRESS = 4
+
+
+def get_character_classes() -> Dict[Symbol, int]:
+  classes = {}
+  for character_class, characters in (
+    (CHARACTER_CLASS_TIE, TIES),
+    (CHARACTER_CLASS_PUNCTUATION_AND_WHITESPACE, PUNCTUATION_AND_WHITESPACE),
+    (CHARACTER_CLASS_APPENDIX, APPENDIX),
+    (CHARACTER_CLASS_STRESS, STRESSES),
+  ):
+    for character in characters:
+      assert character not in classes
+      classes[character] = character_class
+  return classes
+
+
+CHARACTER_CLASSES = get_character_classes()
+
+
+def tokenize_ipa(sentence: str) -> Symbols:
+  """does the same as parse_ipa_symbols_to_symbols(tuple(sentence)), i.e. merge_together (TIES), merge_right (APPENDIX) and merge_left (STRESSES), but in one scan over the characters"""
+  # pylint: disable=too-many-branches
+  classes = CHARACTER_CLASSES
+  other = CHARACTER_CLASS_OTHER
+  tie = CHARACTER_CLASS_TIE
+  punctuation = CHARACTER_CLASS_PUNCTUATION_AND_WHITESPACE
+  appendix = CHARACTER_CLASS_APPENDIX
+  stress = CHARACTER_CLASS_STRESS
+
+  result = []
+  # merge_left: stresses which wait for the next symbol
+  pending_stresses = []
+  # merge_right: symbol which takes the following appendix symbols
+  group = None
+  group_class = other
+  length = len(sentence)
+  i = 0
+  while i <= length:
+    if i < length:
+      # merge_together: symbol with all tied symbols
+      token = sentence[i]
+      token_class = classes.get(token, other)
+      i += 1
+      if token_class != tie and token_class != punctuation:
+        while i < length and classes.get(sentence[i], other) == tie:
+          k = i + 1
+          while k < length and classes.get(sentence[k], other) == tie:
+            k += 1
+          if k == length or classes.get(sentence[k], other) in (tie, punctuation):
+            break
+          token += sentence[i:k + 1]
+          token_class = other
+          i = k + 1
+
+      if token_class == appendix and group is not None:
+        group += token
+        group_class = other
+        continue
+    else:
+      token = None
+      token_class = other
+      i += 1
+
+    # the group is complete, merge_left
+    if group is not None:
+      if group_class == stress:
+        pending_stresses.append(group)
+      else:
+        if len(pending_stresses) > 0:
+          group = "".join(pending_stresses) + group
+          pending_stresses.clear()
+        result.append(group)
+      group = None
+
+    if token is None:
+      break
+
+    if token_class == punctuation:
+      result.extend(pending_stresses)
+      pending_stresses.clear()
+      result.append(token)
+    elif token_class == appendix:
+      if len(pending_stresses) > 0:
+        token = "".join(pending_stresses) + token
+        pending_stresses.clear()
+      result.append(token)
+    else:
+      group = token
+      group_class = token_class
+
+  result.extend(pending_stresses)
+  return tuple(result)
 
 
 def parse_ipa_symbols_to_symbols(all_symbols: Symbols) -> Symbols:
@@ -168,10 +320,73 @@ def split_string_to_tuple(string_of_symbols: str, split_symbol: Symbol):
   return tuple(splitted_symbols)
 
 
+TEMPLATE_END = ""
+
+TemplateTrie = Dict[Symbol, "TemplateTrie"]
+
+TEMPLATE_TRIES: Dict[frozenset, TemplateTrie] = {}
+
+
+def get_template_trie(template: Set[Symbol]) -> TemplateTrie:
+  key = frozenset(template)
+  if key not in TEMPLATE_TRIES:
+    trie = {}
+    for temp in template:
+      node = trie
+      for character in temp:
+        node = node.setdefault(character, {})
+      node[TEMPLATE_END] = {}
+    TEMPLATE_TRIES[key] = trie
+  return TEMPLATE_TRIES[key]
+
+
 def merge_template_with_ignore(symbols: Symbols, template: Set[Symbol], ignore: Set[Symbol]) -> Symbols:
   for temp in template:
     for ignore_symbol in ignore:
       assert ignore_symbol not in temp
+  if all(len(ignore_symbol) == 1 for ignore_symbol in ignore):
+    return merge_template_with_ignore_trie(symbols, template, ignore)
+  return merge_template_with_ignore_core(symbols, template, ignore)
+
+
+def merge_template_with_ignore_trie(symbols: Symbols, template: Set[Symbol], ignore: Set[Symbol]) -> Symbols:
+  """same result as merge_template_with_ignore_core but linear in the length of symbols: the templates are found by walking a prefix trie over the symbols without the ignore characters"""
+  trie = get_template_trie(template)
+  longest_template_length = max((len(temp) for temp in template), default=0)
+  strip_table = {ord(ignore_symbol): None for ignore_symbol in ignore}
+  stripped_symbols = [symbol.translate(strip_table) for symbol in symbols]
+  is_ignore_symbol = [symbol in ignore for symbol in symbols]
+  # count of the ignore symbols in symbols[j:] (see get_longest_possible_length)
+  ignore_symbols_count_from = [0] * (len(symbols) + 1)
+  for j in range(len(symbols) - 1, -1, -1):
+    ignore_symbols_count_from[j] = ignore_symbols_count_from[j + 1] + is_ignore_symbol[j]
+
+  j = 0
+  merged_symbols = []
+  while j < len(symbols):
+    end = j + 1
+    if not is_ignore_symbol[j]:
+      longest_possible_length = ignore_symbols_count_from[j] + longest_template_length
+      node = trie
+      k = j
+      while k < len(symbols) and k - j < longest_possible_length:
+        for character in stripped_symbols[k]:
+          node = node.get(character)
+          if node is None:
+            break
+        if node is None:
+          break
+        k += 1
+        if k - j >= 2 and TEMPLATE_END in node:
+          end = k
+    while end - j > 1 and is_ignore_symbol[end - 1]:
+      end -= 1
+    merged_symbols.append("".join(symbols[j:end]))
+    j = end
+  return tuple(merged_symbols)
+
+
+def merge_template_with_ignore_core(symbols: Symbols, template: Set[Symbol], ignore: Set[Symbol]) -> Symbols:
   j = 0
   merged_symbols = []
   while j < len(symbols):
@@ -234,6 +449,26 @@ def merge_template(symbols: Symbols, template: Set[Symbol]) -> Symbols:
 
 
 def merge_fusion_with_ignore(symbols: Symbols, fusion_symbols: Set[Symbol], ignore: Set[Symbol]) -> Symbols:
+  """same result as merge_fusion_with_ignore_core but in one pass over the symbols; whether a symbol can be fused is computed once per distinct symbol"""
+  is_fusable_symbol: Dict[Symbol, bool] = {}
+  for symbol in symbols:
+    if symbol not in is_fusable_symbol:
+      is_fusable_symbol[symbol] = strip_off_ignore(symbol, ignore) in fusion_symbols
+  is_fusable = [is_fusable_symbol[symbol] for symbol in symbols]
+
+  j = 0
+  fused_symbols = []
+  while j < len(symbols):
+    k = j + 1
+    if is_fusable[j]:
+      while k < len(symbols) and is_fusable[k]:
+        k += 1
+    fused_symbols.append("".join(symbols[j:k]))
+    j = k
+  return tuple(fused_symbols)
+
+
+def merge_fusion_with_ignore_core(symbols: Symbols, fusion_symbols: Set[Symbol], ignore: Set[Symbol]) -> Symbols:
   aux_symbols = list(symbols)
   fused_symbols = []
   while len(aux_symbols) != 0:
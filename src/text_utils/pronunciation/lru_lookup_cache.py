@@ -0,0 +1,106 @@
+import sys
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Iterator, NamedTuple, Optional
+
+from sentence2pronunciation.types import Pronunciation
+
+DEFAULT_MAX_ENTRIES = 100000
+
+
+class LookupCacheStatistics(NamedTuple):
+  hits: int
+  misses: int
+  evictions: int
+  entries: int
+  size_bytes: int
+
+
+def get_entry_size(word: Pronunciation, pronunciation: Pronunciation) -> int:
+  """estimated memory of an entry, i.e. both tuples and their symbols"""
+  result = sys.getsizeof(word) + sys.getsizeof(pronunciation)
+  result += sum(sys.getsizeof(symbol) for symbol in word)
+  result += sum(sys.getsizeof(symbol) for symbol in pronunciation)
+  return result
+
+
+class LRULookupCache(MutableMapping):
+  """LookupCache which holds at most `max_entries` entries and (estimated) `max_bytes` bytes; if one of the limits is exceeded, the least recently used entries are removed. Each lookup (`word in cache` or `cache[word]`) counts as exactly one hit or miss, insertions are not counted."""
+
+  def __init__(self, max_entries: Optional[int] = DEFAULT_MAX_ENTRIES, max_bytes: Optional[int] = None):
+    super().__init__()
+    assert max_entries is None or max_entries > 0
+    assert max_bytes is None or max_bytes > 0
+    self._max_entries = max_entries
+    self._max_bytes = max_bytes
+    self._entries: "OrderedDict[Pronunciation, Pronunciation]" = OrderedDict()
+    self._size_bytes = 0
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+
+  @property
+  def size_bytes(self) -> int:
+    return self._size_bytes
+
+  def __getitem__(self, word: Pronunciation) -> Pronunciation:
+    if word not in self._entries:
+      self.misses += 1
+      raise KeyError(word)
+    self.hits += 1
+    self._entries.move_to_end(word)
+    return self._entries[word]
+
+  def __contains__(self, word: object) -> bool:
+    if word in self._entries:
+      self.hits += 1
+      self._entries.move_to_end(word)
+      return True
+    self.misses += 1
+    return False
+
+  def __setitem__(self, word: Pronunciation, pronunciation: Pronunciation) -> None:
+    if word in self._entries:
+      self._size_bytes -= get_entry_size(word, self._entries[word])
+    self._entries[word] = pronunciation
+    self._entries.move_to_end(word)
+    self._size_bytes += get_entry_size(word, pronunciation)
+    self._evict()
+
+  def __delitem__(self, word: Pronunciation) -> None:
+    pronunciation = self._entries.pop(word)
+    self._size_bytes -= get_entry_size(word, pronunciation)
+
+  def __iter__(self) -> Iterator[Pronunciation]:
+    return iter(self._entries)
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def _is_full(self) -> bool:
+    if self._max_entries is not None and len(self._entries) > self._max_entries:
+      return True
+    if self._max_bytes is not None and self._size_bytes > self._max_bytes:
+      return True
+    return False
+
+  def _evict(self) -> None:
+    # the latest entry is kept even if it alone exceeds max_bytes
+    while len(self._entries) > 1 and self._is_full():
+      word, pronunciation = self._entries.popitem(last=False)
+      self._size_bytes -= get_entry_size(word, pronunciation)
+      self.evictions += 1
+
+  def get_statistics(self) -> LookupCacheStatistics:
+    return LookupCacheStatistics(
+      hits=self.hits,
+      misses=self.misses,
+      evictions=self.evictions,
+      entries=len(self._entries),
+      size_bytes=self._size_bytes,
+    )
+
+  def reset_statistics(self) -> None:
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
@@ -1,8 +1,8 @@
 import string
 from enum import Enum
 from functools import partial
-from logging import WARNING, getLogger
-from typing import Callable, Dict, Optional, Set, Tuple
+from logging import getLogger
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from ordered_set import OrderedSet
 from pronunciation_dict_parser import PronunciationDict
@@ -13,25 +13,27 @@ from sentence2pronunciation.types import Pronunciation
 from text_utils.language import Language
 from text_utils.pronunciation.ARPAToIPAMapper import symbols_map_arpa_to_ipa
 from text_utils.pronunciation.chinese_ipa import chn_to_ipa
-from text_utils.pronunciation.epitran_cache import (get_eng_epitran,
-                                                    get_ger_epitran)
+from text_utils.pronunciation.epitran_cache import (EPITRAN_ENG, EPITRAN_GER,
+                                                    get_eng_epitran,
+                                                    get_ger_epitran,
+                                                    transliterate)
+from text_utils.pronunciation.G2p_batch import predict_batch
 from text_utils.pronunciation.G2p_cache import get_eng_g2p
-from text_utils.pronunciation.ipa2symb import add_n_thongs
-from text_utils.pronunciation.ipa2symb import \
-    break_n_thongs as break_n_thongs_method
-from text_utils.pronunciation.ipa2symb import (merge_template, merge_together,
+from text_utils.pronunciation.ipa2symb import (add_n_thongs, get_ipa_transform,
+                                               merge_template, merge_together,
                                                parse_ipa_symbols_to_symbols,
-                                               parse_ipa_to_symbols,
-                                               remove_arcs, remove_stress,
-                                               remove_tones)
+                                               parse_ipa_to_symbols)
 from text_utils.pronunciation.ipa_symbols import (ENG_ARPA_DIPHTONGS,
                                                   PUNCTUATION_AND_WHITESPACE,
                                                   TIES)
-from text_utils.pronunciation.pronunciation_dict_cache import \
-    get_eng_pronunciation_dict_arpa
+from text_utils.pronunciation.oov_collector import (get_oov_collector,
+                                                    is_oov_logging_enabled)
+from text_utils.pronunciation.pronunciation_dict_cache import (
+    arpa_pronunciation_to_ipa, get_eng_pronunciation_dict_arpa,
+    get_eng_pronunciation_dict_ipa)
 from text_utils.symbol_format import SymbolFormat
 from text_utils.types import Symbol, Symbols
-from text_utils.utils import symbols_to_upper
+from text_utils.utils import symbols_split_iterable, symbols_to_upper
 
 DEFAULT_IGNORE_PUNCTUATION: Set[Symbol] = set(string.punctuation)
 DEFAULT_PUNCTUATION_FOR_SPACE_REMOVAL: Set[Symbol] = {".", ",", ";", "?", "!"}
@@ -41,53 +43,111 @@ ANNOTATION_SPLIT_SYMBOL: Symbol = "/"
 def __get_arpa_oov(word: Symbols) -> Symbols:
   model = get_eng_g2p()
   word_str = ''.join(word)
-  oov_arpa = model.predict(word_str)
-  logger = getLogger(__name__)
-  logger.info(f"Transliterated OOV word \"{word_str}\" to \"{' '.join(oov_arpa)}\".")
+  oov_arpa = tuple(model.predict(word_str))
+  report_arpa_oov(word, oov_arpa)
   return oov_arpa
 
 
-def lookup_dict(word: Symbols, dictionary: Dict[Symbols, Symbols]) -> Symbols:
+def report_arpa_oov(word: Symbols, oov_arpa: Symbols) -> None:
+  if is_oov_logging_enabled():
+    logger = getLogger(__name__)
+    logger.info(f"Transliterated OOV word \"{''.join(word)}\" to \"{' '.join(oov_arpa)}\".")
+  collector = get_oov_collector()
+  if collector is not None:
+    collector.add_pronunciation(word, oov_arpa)
+
+
+def get_arpa_oov_words(eng_sentences: Iterable[Symbols], consider_annotations: bool, dictionary: Dict[Symbols, Symbols], cache: LookupCache) -> OrderedSet:
+  """returns the distinct words of the sentences which are not in the dictionary and whose token is not in the cache"""
+  result = OrderedSet()
+  collector = get_oov_collector()
+  for eng_sentence in eng_sentences:
+    sentence_oov_words = OrderedSet()
+    # sentence2pronunciation_cached caches the whole space separated token (incl. punctuation), therefore the cache is probed with it
+    for token in symbols_split_iterable(eng_sentence, {" "}):
+      words = get_non_annotated_words(
+        sentence=token,
+        trim_symbols=DEFAULT_IGNORE_PUNCTUATION,
+        consider_annotation=consider_annotations,
+        annotation_split_symbol=ANNOTATION_SPLIT_SYMBOL,
+        ignore_case=False,
+        split_on_hyphen=True,
+      )
+      oov_words = [word for word in words if symbols_to_upper(word) not in dictionary]
+      if len(oov_words) == 0:
+        continue
+      sentence_oov_words.update(oov_words)
+      if symbols_to_upper(token) in cache:
+        continue
+      result.update(oov_words)
+    if collector is not None:
+      for word in sentence_oov_words:
+        collector.add_occurrence(word)
+  return result
+
+
+def predict_arpa_oovs(words: Iterable[Symbols]) -> Dict[Symbols, Symbols]:
+  words = list(words)
+  if len(words) == 0:
+    return {}
+  model = get_eng_g2p()
+  words_str = [''.join(word) for word in words]
+  oovs_arpa = predict_batch(model, words_str)
+  for word, oov_arpa in zip(words, oovs_arpa):
+    report_arpa_oov(word, oov_arpa)
+  result = dict(zip(words, oovs_arpa))
+  return result
+
+
+def lookup_dict(word: Symbols, dictionary: Dict[Symbols, Symbols], oovs: Optional[Dict[Symbols, Symbols]] = None) -> Symbols:
   word_upper = symbols_to_upper(word)
   if word_upper in dictionary:
     return dictionary[word_upper][0]
+  if oovs is not None and word in oovs:
+    return oovs[word]
   return __get_arpa_oov(word)
 
 
-def get_eng_to_arpa_lookup_method() -> Callable[[Pronunciation], Pronunciation]:
+def get_eng_to_arpa_lookup_method(oovs: Optional[Dict[Symbols, Symbols]] = None) -> Callable[[Pronunciation], Pronunciation]:
   pronunciations = get_eng_pronunciation_dict_arpa()
-  method = partial(lookup_dict, dictionary=pronunciations)
+  method = partial(lookup_dict, dictionary=pronunciations, oovs=oovs)
   return method
 
 
 def eng_to_arpa(eng_sentence: Symbols, consider_annotations: bool, cache: LookupCache) -> Symbols:
-  method = get_eng_to_arpa_lookup_method()
+  result = eng_to_arpa_batch([eng_sentence], consider_annotations, cache)[0]
+  return result
 
-  result = sentence2pronunciation_cached(
-    sentence=eng_sentence,
-    annotation_split_symbol=ANNOTATION_SPLIT_SYMBOL,
-    consider_annotation=consider_annotations,
-    get_pronunciation=method,
-    split_on_hyphen=True,
-    trim_symbols=DEFAULT_IGNORE_PUNCTUATION,
-    ignore_case_in_cache=True,
-    cache=cache,
-  )
+
+def eng_to_arpa_batch(eng_sentences: Iterable[Symbols], consider_annotations: bool, cache: LookupCache) -> List[Symbols]:
+  # all OOV words are predicted at once in a batched pass before the sentences are assembled
+  eng_sentences = list(eng_sentences)
+  pronunciations = get_eng_pronunciation_dict_arpa()
+  oov_words = get_arpa_oov_words(eng_sentences, consider_annotations, pronunciations, cache)
+  oovs = predict_arpa_oovs(oov_words)
+  method = get_eng_to_arpa_lookup_method(oovs)
+
+  result = [
+    sentence2pronunciation_cached(
+      sentence=eng_sentence,
+      annotation_split_symbol=ANNOTATION_SPLIT_SYMBOL,
+      consider_annotation=consider_annotations,
+      get_pronunciation=method,
+      split_on_hyphen=True,
+      trim_symbols=DEFAULT_IGNORE_PUNCTUATION,
+      ignore_case_in_cache=True,
+      cache=cache,
+    )
+    for eng_sentence in eng_sentences
+  ]
 
   return result
 
 
 def __get_eng_ipa(word: Symbols) -> Symbols:
   assert isinstance(word, tuple)
-  main_logger = getLogger()
-  old_level = main_logger.level
-  main_logger.setLevel(WARNING)
-
-  epi_instance = get_eng_epitran()
   word_str = ''.join(word)
-  word_ipa_symbols_str = epi_instance.transliterate(word_str)
-
-  main_logger.setLevel(old_level)
+  word_ipa_symbols_str = transliterate(EPITRAN_ENG, word_str)
 
   word_ipa_symbols = parse_ipa_to_symbols(word_ipa_symbols_str)
 
@@ -107,15 +167,8 @@ def __get_eng_ipa(word: Symbols) -> Symbols:
 
 def __get_ger_ipa(word: Symbols) -> Symbols:
   assert isinstance(word, tuple)
-  main_logger = getLogger()
-  old_level = main_logger.level
-  main_logger.setLevel(WARNING)
-
-  epi_instance = get_ger_epitran()
   word_str = ''.join(word)
-  word_ipa_symbols_str = epi_instance.transliterate(word_str)
-
-  main_logger.setLevel(old_level)
+  word_ipa_symbols_str = transliterate(EPITRAN_GER, word_str)
 
   word_ipa_symbols = parse_ipa_to_symbols(word_ipa_symbols_str)
   return word_ipa_symbols
@@ -138,20 +191,33 @@ def eng_to_ipa_epitran(eng_sentence: Symbols, consider_annotations: bool, cache:
 
 
 def eng_to_ipa_pronunciation_dict(eng_sentence: Symbols, consider_annotations: bool, cache: LookupCache) -> Symbols:
-  #pronunciations = parse_public_dict(PublicDictType.MFA_EN_US_IPA)
-  arpa_symbols = eng_to_arpa(eng_sentence, consider_annotations, cache)
-  result_ipa = symbols_map_arpa_to_ipa(arpa_symbols, ignore={},
-                                       replace_unknown=False, replace_unknown_with=None)
-  mapped_ipa_str = ''.join(result_ipa)
-  reparsed_ipa = parse_ipa_to_symbols(mapped_ipa_str)
-  # if reparsed_ipa != result_ipa:
-  #   logger = getLogger(__name__)
-  #   logger.info(f"Changed parsing of \"{' '.join(result_ipa)}\" to \"{' '.join(reparsed_ipa)}\".")
+  # the words are looked up in the dictionary which is already mapped to IPA, this gives the same result as mapping and reparsing the ARPA sentence because words are separated by punctuation or whitespace; only IPA pronunciations are written into the cache
+  pronunciations = get_eng_pronunciation_dict_ipa()
+  oov_words = get_arpa_oov_words([eng_sentence], consider_annotations, pronunciations, cache)
+  oovs = {
+    word: arpa_pronunciation_to_ipa(oov_arpa)
+    for word, oov_arpa in predict_arpa_oovs(oov_words).items()
+  }
+  method = partial(lookup_dict, dictionary=pronunciations, oovs=oovs)
 
-  # assert parse_ipa_to_symbols(''.join(result_ipa)) == result_ipa
-  # result_ipa = parse_ipa_symbols_to_symbols(result_ipa)
+  result = sentence2pronunciation_cached(
+    sentence=eng_sentence,
+    annotation_split_symbol=ANNOTATION_SPLIT_SYMBOL,
+    consider_annotation=consider_annotations,
+    get_pronunciation=method,
+    split_on_hyphen=True,
+    trim_symbols=DEFAULT_IGNORE_PUNCTUATION,
+    ignore_case_in_cache=True,
+    cache=cache,
+  )
+
+  if consider_annotations and ANNOTATION_SPLIT_SYMBOL in eng_sentence:
+    # annotations contain ARPA symbols which are not cached and need to be mapped, too
+    result = symbols_map_arpa_to_ipa(result, ignore={},
+                                     replace_unknown=False, replace_unknown_with=None)
+    result = parse_ipa_to_symbols(''.join(result))
 
-  return reparsed_ipa
+  return result
 
 
 class EngToIPAMode(Enum):
@@ -203,7 +269,7 @@ def prepare_symbols_to_ipa(symbols_format: SymbolFormat, lang: Language, mode: O
       get_eng_epitran()
     if mode == EngToIPAMode.LIBRISPEECH:
       get_eng_g2p()
-      get_eng_pronunciation_dict_arpa()
+      get_eng_pronunciation_dict_ipa()
   elif lang == Language.GER:
     get_ger_epitran()
   elif lang == Language.CHN:
@@ -258,24 +324,18 @@ def symbols_to_arpa(symbols: Symbols, symbols_format: SymbolFormat, lang: Langua
 
 
 def change_ipa(symbols: Symbols, ignore_tones: bool, ignore_arcs: bool, ignore_stress: bool, break_n_thongs: bool, build_n_thongs: bool, language: Optional[Language]) -> Symbols:
-  new_symbols = symbols
-
-  if ignore_arcs:
-    new_symbols = remove_arcs(new_symbols)
-
-  if ignore_tones:
-    new_symbols = remove_tones(new_symbols)
-
-  if ignore_stress:
-    new_symbols = remove_stress(new_symbols)
-
-  if break_n_thongs:
-    new_symbols = break_n_thongs_method(new_symbols)
-
   if build_n_thongs:
     assert language is not None
-    new_symbols = add_n_thongs(symbols, language)
-
+    # the n-thongs are built from the unchanged symbols
+    return add_n_thongs(symbols, language)
+
+  transform = get_ipa_transform(
+    ignore_tones=ignore_tones,
+    ignore_arcs=ignore_arcs,
+    ignore_stress=ignore_stress,
+    break_n_thongs=break_n_thongs,
+  )
+  new_symbols = transform(symbols)
   return new_symbols
 
 
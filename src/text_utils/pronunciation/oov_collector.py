@@ -0,0 +1,90 @@
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ordered_set import OrderedSet
+from pronunciation_dict_parser import PronunciationDict
+from text_utils.types import Symbols
+
+
+class OOVCollector():
+  """counts the distinct OOV words of a conversion run and keeps their predicted pronunciations"""
+
+  def __init__(self):
+    super().__init__()
+    # number of sentences in which the word occurs as OOV
+    self.counts: Counter = Counter()
+    self.pronunciations: Dict[Symbols, Symbols] = {}
+
+  def add_occurrence(self, word: Symbols) -> None:
+    self.counts[word] += 1
+
+  def add_pronunciation(self, word: Symbols, pronunciation: Symbols) -> None:
+    self.pronunciations[word] = pronunciation
+
+  def get_most_common(self) -> List[Tuple[Symbols, int]]:
+    return self.counts.most_common()
+
+  def get_pronunciation_dict(self) -> PronunciationDict:
+    """returns the predicted pronunciations, most common words first"""
+    words = [word for word, _ in self.get_most_common() if word in self.pronunciations]
+    words.extend(word for word in self.pronunciations if word not in self.counts)
+    result = {
+      ''.join(word): OrderedSet([self.pronunciations[word]]) for word in words
+    }
+    return result
+
+  def save_pronunciation_dict(self, path: Path) -> None:
+    """writes the predicted pronunciations in the format of the public dictionaries, i.e. the word followed by two spaces and the space separated symbols"""
+    lines = [
+      f"{word}  {' '.join(pronunciation)}\n"
+      for word, pronunciations in self.get_pronunciation_dict().items()
+      for pronunciation in pronunciations
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open(mode="w", encoding="utf-8") as f:
+      f.writelines(lines)
+
+  def clear(self) -> None:
+    self.counts.clear()
+    self.pronunciations.clear()
+
+
+LOG_OOVS = True
+# collects the OOVs of this process, it is only set during a collection run
+OOV_COLLECTOR: Optional[OOVCollector] = None
+
+
+def set_oov_logging(enabled: bool) -> None:
+  """enables or disables the logging of every predicted OOV word"""
+  # pylint: disable=global-statement
+  global LOG_OOVS
+  LOG_OOVS = enabled
+
+
+def is_oov_logging_enabled() -> bool:
+  return LOG_OOVS
+
+
+def start_oov_collection(collector: Optional[OOVCollector] = None) -> OOVCollector:
+  # pylint: disable=global-statement
+  global OOV_COLLECTOR
+  if collector is None:
+    collector = OOVCollector()
+  OOV_COLLECTOR = collector
+  return collector
+
+
+def stop_oov_collection(path: Optional[Path] = None) -> Optional[OOVCollector]:
+  """stops the collection and writes the collected OOVs to path if it is given"""
+  # pylint: disable=global-statement
+  global OOV_COLLECTOR
+  collector = OOV_COLLECTOR
+  OOV_COLLECTOR = None
+  if collector is not None and path is not None:
+    collector.save_pronunciation_dict(path)
+  return collector
+
+
+def get_oov_collector() -> Optional[OOVCollector]:
+  return OOV_COLLECTOR
@@ -1,18 +1,113 @@
-from typing import Dict
+from logging import getLogger
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
 
+from ordered_set import OrderedSet
 from pronunciation_dict_parser import (PronunciationDict, PublicDictType,
                                        parse_public_dict)
+from text_utils.cache_dir import get_cache_dir
+from text_utils.pronunciation.ARPAToIPAMapper import symbols_map_arpa_to_ipa
+from text_utils.pronunciation.compiled_pronunciation_dict import (
+    CompiledPronunciationDict, compile_pronunciation_dict,
+    load_compiled_pronunciation_dict)
+from text_utils.pronunciation.ipa2symb import tokenize_ipa
 from text_utils.types import Symbols
 from text_utils.utils import pronunciation_dict_to_tuple_dict
 
-CACHE: Dict[Symbols, Symbols] = None
+CACHE: Union[Dict[Symbols, Symbols], CompiledPronunciationDict] = None
+CACHE_IPA: Union[Dict[Symbols, Symbols], CompiledPronunciationDict] = None
+
+COMPILED_ENG_ARPA_FILENAME = "librispeech_arpa.dict.bin"
+COMPILED_ENG_IPA_FILENAME = "librispeech_ipa.dict.bin"
+
+
+def get_compiled_eng_pronunciation_dict_arpa_path() -> Path:
+  return get_cache_dir() / COMPILED_ENG_ARPA_FILENAME
+
+
+def get_compiled_eng_pronunciation_dict_ipa_path() -> Path:
+  return get_cache_dir() / COMPILED_ENG_IPA_FILENAME
+
+
+def arpa_pronunciation_to_ipa(arpa_symbols: Symbols) -> Symbols:
+  # same as the mapping and reparsing of a word in a sentence, because words are separated by punctuation or whitespace
+  ipa_symbols = symbols_map_arpa_to_ipa(arpa_symbols, ignore={},
+                                        replace_unknown=False, replace_unknown_with=None)
+  return tokenize_ipa(''.join(ipa_symbols))
+
+
+def arpa_pronunciation_dict_to_ipa(arpa_dict: PronunciationDict) -> PronunciationDict:
+  result = {
+    word: OrderedSet(arpa_pronunciation_to_ipa(pronunciation) for pronunciation in pronunciations)
+    for word, pronunciations in arpa_dict.items()
+  }
+  return result
+
+
+def get_eng_pronunciation_dict_arpa_uncompiled() -> PronunciationDict:
+  return parse_public_dict(PublicDictType.LIBRISPEECH_ARPA)
+
+
+def get_eng_pronunciation_dict_ipa_uncompiled() -> PronunciationDict:
+  arpa_dict = parse_public_dict(PublicDictType.LIBRISPEECH_ARPA)
+  return arpa_pronunciation_dict_to_ipa(arpa_dict)
+
+
+def compile_eng_pronunciation_dict(path: Path, get_pronunciation_dict: Callable[[], PronunciationDict]) -> Path:
+  logger = getLogger(__name__)
+  logger.info(f"Compiling LibriSpeech dictionary to \"{path}\"...")
+  pronunciation_dict = get_pronunciation_dict()
+  path.parent.mkdir(parents=True, exist_ok=True)
+  compile_pronunciation_dict(pronunciation_dict, path)
+  logger.info("Done.")
+  return path
+
+
+def compile_eng_pronunciation_dict_arpa(path: Optional[Path] = None) -> Path:
+  if path is None:
+    path = get_compiled_eng_pronunciation_dict_arpa_path()
+  return compile_eng_pronunciation_dict(path, get_eng_pronunciation_dict_arpa_uncompiled)
+
+
+def compile_eng_pronunciation_dict_ipa(path: Optional[Path] = None) -> Path:
+  if path is None:
+    path = get_compiled_eng_pronunciation_dict_ipa_path()
+  return compile_eng_pronunciation_dict(path, get_eng_pronunciation_dict_ipa_uncompiled)
+
+
+def compile_eng_pronunciation_dicts(directory: Optional[Path] = None) -> None:
+  if directory is None:
+    directory = get_cache_dir()
+  compile_eng_pronunciation_dict_arpa(directory / COMPILED_ENG_ARPA_FILENAME)
+  compile_eng_pronunciation_dict_ipa(directory / COMPILED_ENG_IPA_FILENAME)
+
+
+def load_eng_pronunciation_dict(path: Path, get_pronunciation_dict: Callable[[], PronunciationDict]) -> Union[Dict[Symbols, Symbols], CompiledPronunciationDict]:
+  if not path.is_file():
+    try:
+      compile_eng_pronunciation_dict(path, get_pronunciation_dict)
+    except OSError as error:
+      logger = getLogger(__name__)
+      logger.warning(f"Compiling the dictionary failed ({error}), therefore it is kept in memory.")
+      pronunciation_dict = get_pronunciation_dict()
+      return pronunciation_dict_to_tuple_dict(pronunciation_dict)
+  return load_compiled_pronunciation_dict(path)
 
 
 def get_eng_pronunciation_dict_arpa() -> PronunciationDict:
   # pylint: disable=global-statement
   global CACHE
   if CACHE is None:
-    arpa_dict = parse_public_dict(PublicDictType.LIBRISPEECH_ARPA)
-    arpa_dict_tuple_based = pronunciation_dict_to_tuple_dict(arpa_dict)
-    CACHE = arpa_dict_tuple_based
+    CACHE = load_eng_pronunciation_dict(
+      get_compiled_eng_pronunciation_dict_arpa_path(), get_eng_pronunciation_dict_arpa_uncompiled)
   return CACHE
+
+
+def get_eng_pronunciation_dict_ipa() -> PronunciationDict:
+  """LibriSpeech dictionary with the pronunciations already mapped to IPA and parsed to symbols"""
+  # pylint: disable=global-statement
+  global CACHE_IPA
+  if CACHE_IPA is None:
+    CACHE_IPA = load_eng_pronunciation_dict(
+      get_compiled_eng_pronunciation_dict_ipa_path(), get_eng_pronunciation_dict_ipa_uncompiled)
+  return CACHE_IPA
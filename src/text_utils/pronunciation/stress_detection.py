@@ -1,6 +1,7 @@
 from enum import IntEnum
-from typing import Tuple
+from typing import Callable, Dict, Optional, Tuple
 
+import numpy as np
 from text_utils.pronunciation.arpa_symbols import \
     STRESS_NONE as ARPA_STRESS_NONE
 from text_utils.pronunciation.arpa_symbols import \
@@ -17,7 +18,9 @@ from text_utils.pronunciation.ipa_symbols import \
 from text_utils.pronunciation.ipa_symbols import \
     STRESS_SECONDARY as IPA_STRESS_SECONDARY
 from text_utils.pronunciation.ipa_symbols import VOWELS as IPA_VOWELS
-from text_utils.types import Symbol
+from text_utils.symbol_format import SymbolFormat
+from text_utils.symbol_id_dict import SymbolIdDict
+from text_utils.types import Symbol, Symbols
 
 
 class StressType(IntEnum):
@@ -81,3 +84,78 @@ def split_stress_ipa(symbol: Symbol) -> Tuple[Symbol, StressType]:
       return symbol, StressType.NOT_APPLICABLE
 
   return symbol, StressType.NOT_APPLICABLE
+
+
+SplitStress = Callable[[Symbol], Tuple[Symbol, StressType]]
+
+# the results of split_stress_arpa/split_stress_ipa for every distinct symbol
+ARPA_STRESS_CACHE: Dict[Symbol, Tuple[Symbol, StressType]] = {}
+IPA_STRESS_CACHE: Dict[Symbol, Tuple[Symbol, StressType]] = {}
+
+
+def split_stresses(symbols: Symbols, split_stress: SplitStress, cache: Dict[Symbol, Tuple[Symbol, StressType]]) -> Tuple[Symbols, np.ndarray]:
+  base_symbols = []
+  stresses = np.empty(len(symbols), dtype=np.uint8)
+  for i, symbol in enumerate(symbols):
+    result = cache.get(symbol)
+    if result is None:
+      result = split_stress(symbol)
+      cache[symbol] = result
+    base_symbols.append(result[0])
+    stresses[i] = result[1]
+  return tuple(base_symbols), stresses
+
+
+def split_stresses_arpa(symbols: Symbols) -> Tuple[Symbols, np.ndarray]:
+  """returns the symbols without stresses and their StressType values"""
+  return split_stresses(symbols, split_stress_arpa, ARPA_STRESS_CACHE)
+
+
+def split_stresses_ipa(symbols: Symbols) -> Tuple[Symbols, np.ndarray]:
+  """returns the symbols without stresses and their StressType values"""
+  return split_stresses(symbols, split_stress_ipa, IPA_STRESS_CACHE)
+
+
+def get_split_stress_method(symbols_format: SymbolFormat) -> SplitStress:
+  if symbols_format.is_IPA:
+    return split_stress_ipa
+  if symbols_format.is_ARPA:
+    return split_stress_arpa
+  assert False
+
+
+class StressIdSplitter():
+  """splits the stresses of encoded symbols with one NumPy indexing operation per array. If base_symbol_ids is None, it is created from the symbols without stresses."""
+
+  def __init__(self, symbol_ids: SymbolIdDict, symbols_format: SymbolFormat, base_symbol_ids: Optional[SymbolIdDict] = None):
+    super().__init__()
+    split_stress = get_split_stress_method(symbols_format)
+    n_ids = max(symbol_ids.get_all_symbol_ids(), default=-1) + 1
+    splitted = {
+      symbol_id: split_stress(symbol_ids.get_symbol(symbol_id))
+      for symbol_id in range(n_ids) if symbol_ids.id_exists(symbol_id)
+    }
+    if base_symbol_ids is None:
+      base_symbol_ids = SymbolIdDict.init_from_symbols(
+        {base_symbol for base_symbol, _ in splitted.values()})
+    self.base_symbol_ids = base_symbol_ids
+
+    # -1 marks ids which are not in symbol_ids
+    self._base_ids = np.full(n_ids, -1, dtype=np.int64)
+    self._stresses = np.full(n_ids, StressType.NOT_APPLICABLE, dtype=np.uint8)
+    for symbol_id, (base_symbol, stress_type) in splitted.items():
+      if not base_symbol_ids.symbol_exists(base_symbol):
+        raise ValueError(f"The symbol \"{base_symbol}\" is not in base_symbol_ids!")
+      self._base_ids[symbol_id] = base_symbol_ids.get_id(base_symbol)
+      self._stresses[symbol_id] = stress_type
+
+  def split(self, symbol_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """returns the ids of the symbols without stresses and their StressType values"""
+    symbol_ids = np.asarray(symbol_ids, dtype=np.int64)
+    if ((symbol_ids < 0) | (symbol_ids >= len(self._base_ids))).any():
+      raise ValueError("The ids contain unknown ids!")
+    base_ids = self._base_ids[symbol_ids]
+    if (base_ids == -1).any():
+      raise ValueError("The ids contain unknown ids!")
+    stresses = self._stresses[symbol_ids]
+    return base_ids, stresses
@@ -0,0 +1,77 @@
+from logging import getLogger
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+from text_utils.language import Language
+from text_utils.types import Spans
+
+if TYPE_CHECKING:
+  from nltk.tokenize.punkt import PunktSentenceTokenizer
+
+PUNKT_LANGUAGES: Dict[Language, str] = {
+  Language.ENG: "english",
+  Language.GER: "german",
+}
+
+SENTENCE_TOKENIZERS: Dict[Language, "PunktSentenceTokenizer"] = {}
+SENTENCE_TOKENIZERS_LOCK = Lock()
+
+
+def uses_punkt_tab() -> bool:
+  # nltk >= 3.8.2 loads the tokenizers from 'punkt_tab' instead of the pickled 'punkt' models
+  # pylint: disable=import-outside-toplevel
+  from nltk.tokenize import punkt
+  return hasattr(punkt, "PunktTokenizer")
+
+
+def get_punkt_resource_name() -> str:
+  return "punkt_tab" if uses_punkt_tab() else "punkt"
+
+
+def download_sentence_tokenizers() -> None:
+  """downloads the Punkt models; this is the only place where they are downloaded, i.e. it needs to be called once before the sentences are tokenized"""
+  # pylint: disable=import-outside-toplevel
+  from nltk import download
+  resource_name = get_punkt_resource_name()
+  logger = getLogger(__name__)
+  logger.info(f"Downloading '{resource_name}'...")
+  download(resource_name, quiet=True, raise_on_error=True)
+  logger.info("Done.")
+
+
+def load_sentence_tokenizer(lang: Language) -> "PunktSentenceTokenizer":
+  if lang not in PUNKT_LANGUAGES:
+    raise ValueError("Language not supported!")
+  language = PUNKT_LANGUAGES[lang]
+  # nltk is imported on first use because loading it is slow
+  # pylint: disable=import-outside-toplevel
+  if uses_punkt_tab():
+    from nltk.tokenize.punkt import PunktTokenizer
+    return PunktTokenizer(language)
+  from nltk.data import load
+  return load(f"tokenizers/punkt/{language}.pickle")
+
+
+def get_sentence_tokenizer(lang: Language) -> "PunktSentenceTokenizer":
+  """returns the Punkt tokenizer of the language; it is loaded once per process and raises a LookupError if the models were not downloaded with download_sentence_tokenizers"""
+  with SENTENCE_TOKENIZERS_LOCK:
+    if lang not in SENTENCE_TOKENIZERS:
+      SENTENCE_TOKENIZERS[lang] = load_sentence_tokenizer(lang)
+    return SENTENCE_TOKENIZERS[lang]
+
+
+def tokenize_sentences(text: str, lang: Language) -> List[str]:
+  tokenizer = get_sentence_tokenizer(lang)
+  return tokenizer.tokenize(text)
+
+
+def span_tokenize_sentences(text: str, lang: Language) -> Spans:
+  """returns the character spans of the sentences in the text"""
+  tokenizer = get_sentence_tokenizer(lang)
+  return list(tokenizer.span_tokenize(text))
+
+
+def tokenize_many(texts: Iterable[str], lang: Language) -> List[List[str]]:
+  """splits each text into its sentences"""
+  tokenizer = get_sentence_tokenizer(lang)
+  return [tokenizer.tokenize(text) for text in texts]
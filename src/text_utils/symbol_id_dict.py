@@ -10,6 +10,7 @@ from text_utils.utils import (deserialize_list, get_basename,
                               get_entries_ids_dict_order, parse_json,
                               save_json, serialize_list,
                               switch_keys_with_values)
+from text_utils.validation import is_trusted_mode
 
 
 class SymbolIdDict():
@@ -41,7 +42,8 @@ class SymbolIdDict():
     return len(self._ids_to_symbols)
 
   def get_symbol(self, symbol_id: SymbolId):
-    assert symbol_id in self._symbols_to_ids.keys()
+    if not is_trusted_mode():
+      assert symbol_id in self._symbols_to_ids.keys()
     return self._symbols_to_ids[symbol_id]
 
   def id_exists(self, symbol_id: SymbolId) -> bool:
@@ -51,7 +53,8 @@ class SymbolIdDict():
     return symbol in self._ids_to_symbols.keys()
 
   def get_id(self, symbol: Symbol):
-    assert symbol in self._ids_to_symbols.keys()
+    if not is_trusted_mode():
+      assert symbol in self._ids_to_symbols.keys()
     return self._ids_to_symbols[symbol]
 
   def get_all_symbols(self) -> Set[Symbol]:
@@ -0,0 +1,63 @@
+import re
+from typing import Dict, Optional
+
+from text_utils.types import Symbol, Symbols
+
+DEFAULT_MAX_MEMO_SIZE = 100000
+
+
+def can_translate(mapping: Dict[Symbol, Symbol]) -> bool:
+  """checks if applying the mapping entry by entry gives the same result as str.translate, i.e. all keys are single characters and no replacement contains a key which is applied after it"""
+  keys = list(mapping.keys())
+  if any(len(key) != 1 for key in keys):
+    return False
+  for i, key in enumerate(keys):
+    replacement = mapping[key]
+    # the replacements of re.sub are templates
+    if "\\" in replacement:
+      return False
+    if any(later_key in replacement for later_key in keys[i + 1:]):
+      return False
+  return True
+
+
+class SymbolMapper():
+  """maps symbols like symbols_map but is built only once from the mapping: first the symbols which are keys are mapped as a whole (outer), then the keys are replaced inside the symbols entry by entry (inner). The results are memoized per distinct symbol."""
+
+  def __init__(self, mapping: Dict[Symbol, Symbol], max_memo_size: Optional[int] = DEFAULT_MAX_MEMO_SIZE):
+    super().__init__()
+    assert max_memo_size is None or max_memo_size > 0
+    self._mapping = dict(mapping)
+    self._max_memo_size = max_memo_size
+    self._memo: Dict[Symbol, Symbol] = {}
+    self._translation_table = None
+    self._patterns = []
+    if can_translate(self._mapping):
+      self._translation_table = str.maketrans(self._mapping)
+    else:
+      self._patterns = [
+        (key, re.compile(re.escape(key)), replacement) for key, replacement in self._mapping.items()
+      ]
+
+  def map_inner(self, symbol: Symbol) -> Symbol:
+    if self._translation_table is not None:
+      return symbol.translate(self._translation_table)
+    result = symbol
+    for key, pattern, replacement in self._patterns:
+      if key in result:
+        result = pattern.sub(replacement, result)
+    return result
+
+  def map_symbol(self, symbol: Symbol) -> Symbol:
+    if symbol in self._memo:
+      return self._memo[symbol]
+    result = self._mapping.get(symbol, symbol)
+    result = self.map_inner(result)
+    if self._max_memo_size is not None and len(self._memo) >= self._max_memo_size:
+      self._memo.clear()
+    self._memo[symbol] = result
+    return result
+
+  def map(self, symbols: Symbols) -> Symbols:
+    result = tuple(self.map_symbol(symbol) for symbol in symbols)
+    return result
@@ -0,0 +1,94 @@
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from text_utils.types import Symbol, Symbols
+from text_utils.utils import symbols_to_upper
+
+ROOT = 0
+
+
+class SymbolsReplacer():
+  """replaces many symbol sequences at once; it is an Aho-Corasick automaton over the symbols, so the symbols are scanned only once regardless of the number of replacements. The matches are replaced from left to right, the longest one wins if several start at the same position and the inserted symbols are not searched again."""
+
+  def __init__(self, replacements: Iterable[Tuple[Symbols, Symbols]], ignore_case: bool):
+    super().__init__()
+    self.ignore_case = ignore_case
+    self._transitions: List[Dict[Symbol, int]] = [{}]
+    self._fail: List[int] = [ROOT]
+    # length and replacement of the pattern which ends in the node
+    self._pattern_lengths: List[int] = [0]
+    self._replace_with: List[Optional[Symbols]] = [None]
+    # next node on the fail path which ends a pattern
+    self._output_links: List[int] = [ROOT]
+    for search_for, replace_with in replacements:
+      self._add(search_for, replace_with)
+    self._build_links()
+
+  def _get_key(self, symbols: Symbols) -> Symbols:
+    if self.ignore_case:
+      return symbols_to_upper(symbols)
+    return symbols
+
+  def _add(self, search_for: Symbols, replace_with: Symbols) -> None:
+    if len(search_for) == 0:
+      raise ValueError("The symbols to search for must not be empty!")
+    node = ROOT
+    for symbol in self._get_key(search_for):
+      if symbol not in self._transitions[node]:
+        self._transitions.append({})
+        self._fail.append(ROOT)
+        self._pattern_lengths.append(0)
+        self._replace_with.append(None)
+        self._output_links.append(ROOT)
+        self._transitions[node][symbol] = len(self._transitions) - 1
+      node = self._transitions[node][symbol]
+    # the last replacement for the same symbols wins
+    self._pattern_lengths[node] = len(search_for)
+    self._replace_with[node] = tuple(replace_with)
+
+  def _build_links(self) -> None:
+    # the fail links of the children of the root point to the root
+    queue = deque(self._transitions[ROOT].values())
+    while len(queue) > 0:
+      node = queue.popleft()
+      for symbol, child in self._transitions[node].items():
+        fail = self._fail[node]
+        while fail != ROOT and symbol not in self._transitions[fail]:
+          fail = self._fail[fail]
+        fail_child = self._transitions[fail].get(symbol, ROOT)
+        self._fail[child] = fail_child
+        if self._pattern_lengths[fail_child] > 0:
+          self._output_links[child] = fail_child
+        else:
+          self._output_links[child] = self._output_links[fail_child]
+        queue.append(child)
+
+  def _get_longest_matches(self, symbols: Symbols) -> List[int]:
+    # the node of the longest pattern which starts at each position
+    longest: List[int] = [ROOT] * len(symbols)
+    node = ROOT
+    for end, symbol in enumerate(self._get_key(symbols), start=1):
+      while node != ROOT and symbol not in self._transitions[node]:
+        node = self._fail[node]
+      node = self._transitions[node].get(symbol, ROOT)
+      match = node if self._pattern_lengths[node] > 0 else self._output_links[node]
+      while match != ROOT:
+        start = end - self._pattern_lengths[match]
+        if self._pattern_lengths[match] > self._pattern_lengths[longest[start]]:
+          longest[start] = match
+        match = self._output_links[match]
+    return longest
+
+  def replace(self, symbols: Symbols) -> Symbols:
+    longest = self._get_longest_matches(symbols)
+    result: List[Symbol] = []
+    position = 0
+    while position < len(symbols):
+      match = longest[position]
+      if match == ROOT:
+        result.append(symbols[position])
+        position += 1
+      else:
+        result.extend(self._replace_with[match])
+        position += self._pattern_lengths[match]
+    return tuple(result)
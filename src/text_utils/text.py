@@ -1,23 +1,25 @@
-from typing import List, Optional, Set
+import re
+from bisect import bisect_left, bisect_right
+from logging import getLogger
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
 
-from nltk import download
-from nltk.tokenize import sent_tokenize
 from unidecode import unidecode as convert_to_ascii
 
-from text_utils.adjustments import (collapse_whitespace, expand_abbreviations,
-                                    expand_units_of_measure, normalize_numbers,
-                                    replace_at_symbols,
-                                    replace_big_letter_abbreviations,
+from text_utils.adjustments import (MailAddressTracker, collapse_whitespace,
+                                    is_unit_of_measure, normalize_en_word,
+                                    normalize_en_words, replace_at_symbols,
                                     replace_mail_addresses)
 from text_utils.language import Language
 from text_utils.pronunciation import parse_ipa_to_symbols
+from text_utils.sentence_tokenizers import (span_tokenize_sentences,
+                                            tokenize_sentences)
 from text_utils.symbol_format import SymbolFormat
-from text_utils.types import Symbol, Symbols
+from text_utils.types import Spans, Symbol, Symbols
 from text_utils.utils import remove_empty_symbols
 from text_utils.utils import \
     remove_space_around_punctuation as remove_space_around_punctuation_method
-from text_utils.utils import (split_text, symbols_join, symbols_separate,
-                              symbols_split, symbols_strip)
+from text_utils.utils import split_text, symbols_join, symbols_split
 
 ARPA_SENTENCE_SEPARATORS = {"?", "!", "."}
 IPA_SENTENCE_SEPARATORS = {"?", "!", "."}
@@ -44,23 +46,90 @@ def ipa_symbols_to_sentences(symbols: Symbols) -> List[Symbols]:
 
 
 def symbols_to_sentences_core(symbols: Symbols, separators: Set[Symbol]) -> List[Symbols]:
-  sentences = symbols_separate(symbols, separate_symbols=separators)
-  sentences = [symbols_strip(sentence, strip={" "}) for sentence in sentences]
-  sentences = [remove_empty_symbols(sentence) for sentence in sentences]
-  sentences = [sentence for sentence in sentences if len(sentence) > 0]
+  spans = get_sentence_spans_core(symbols, separators)
+  sentences = spans_to_sentences(symbols, spans)
   return sentences
 
 
+def spans_to_sentences(symbols: Symbols, spans: Spans) -> List[Symbols]:
+  """slices the symbols along the spans and removes the empty symbols, therefore a sentence can be shorter than its span"""
+  sentences = [remove_empty_symbols(symbols[start:end]) for start, end in spans]
+  return sentences
+
+
+def spans_to_parallel_sentences(symbols: Symbols, values: Tuple, spans: Spans) -> List[Tuple]:
+  """slices values which are parallel to the symbols (e.g. accent ids) like spans_to_sentences, i.e. the values of empty symbols are removed, too"""
+  assert len(symbols) == len(values)
+  sentences = [
+    tuple(value for symbol, value in zip(symbols[start:end], values[start:end]) if symbol != "")
+    for start, end in spans
+  ]
+  return sentences
+
+
+def get_sentence_spans_core(symbols: Symbols, separators: Set[Symbol]) -> Spans:
+  """returns the spans of the sentences which end with one of the separators; the spaces around the sentences are not part of the spans and sentences that consist only of spaces and empty symbols are skipped"""
+  spans = []
+  start = 0
+  symbols_count = len(symbols)
+  for i, symbol in enumerate(symbols):
+    if symbol in separators or i == symbols_count - 1:
+      end = i + 1
+      while start < end and symbols[start] == " ":
+        start += 1
+      while end > start and symbols[end - 1] == " ":
+        end -= 1
+      if any(current != "" for current in symbols[start:end]):
+        spans.append((start, end))
+      start = i + 1
+  return spans
+
+
+def get_text_sentence_spans(symbols: Symbols, lang: Language) -> Spans:
+  """returns the spans of the sentences which are detected by the Punkt tokenizer on the joined symbols"""
+  text = ''.join(symbols)
+  symbol_starts = []
+  position = 0
+  for symbol in symbols:
+    symbol_starts.append(position)
+    position += len(symbol)
+  spans = []
+  for char_start, char_end in span_tokenize_sentences(text, lang):
+    start = bisect_right(symbol_starts, char_start) - 1
+    end = bisect_left(symbol_starts, char_end)
+    spans.append((start, end))
+  return spans
+
+
+def get_sentence_spans(symbols: Symbols, symbols_format: SymbolFormat, lang: Optional[Language]) -> Spans:
+  """returns the (start, end) spans of the sentences in the symbols; the spans can contain empty symbols, which are removed by spans_to_sentences, therefore parallel sequences (e.g. accent ids) need to be split with spans_to_parallel_sentences"""
+  if symbols_format.is_IPA:
+    return get_sentence_spans_core(symbols, separators=IPA_SENTENCE_SEPARATORS)
+  if symbols_format.is_ARPA:
+    return get_sentence_spans_core(symbols, separators=ARPA_SENTENCE_SEPARATORS)
+
+  assert symbols_format == SymbolFormat.GRAPHEMES
+
+  if lang is None:
+    raise ValueError("Language required!")
+
+  if lang == Language.CHN:
+    return get_sentence_spans_core(symbols, separators=CHN_SENTENCE_SEPARATORS)
+
+  if lang in (Language.ENG, Language.GER):
+    return get_text_sentence_spans(symbols, lang)
+
+  assert False
+
+
 def normalize_en_grapheme_text(text: str) -> str:
   text = convert_to_ascii(text)
   # text = text.lower()
   # TODO datetime conversion
   text = text.strip()
   text = collapse_whitespace(text)
-  text = normalize_numbers(text)
-  text = expand_abbreviations(text)
-  text = expand_units_of_measure(text)
-  text = replace_big_letter_abbreviations(text)
+  # numbers, abbreviations, units and big letters in one pass
+  text = normalize_en_words(text)
   text = replace_mail_addresses(text)
   text = replace_at_symbols(text)
   return text
@@ -107,6 +176,180 @@ def text_normalize(text: str, text_format: SymbolFormat, lang: Optional[Language
   assert False
 
 
+DEFAULT_NORMALIZATION_CHUNK_SIZE = 65536
+DEFAULT_MAX_NORMALIZATION_BUFFER_SIZE = 16 * DEFAULT_NORMALIZATION_CHUNK_SIZE
+
+_whitespace_re = re.compile(r'\s+')
+
+
+# only numbers can be normalized to nothing
+_digit_re = re.compile(r'[0-9]')
+
+
+class ChunkBoundaryScanner():
+  """collects a text which is given in parts and finds the last safe boundary in it, i.e. a whitespace where the text can be cut without changing the result of text_normalize; each part is scanned only once. For English graphemes the whitespace can not be cut before units (e.g. "5 kg"), next to "@" (replace_at_symbols removes the whitespace around it) and inside mail addresses, which are followed with MailAddressTracker."""
+
+  def __init__(self, text_format: SymbolFormat, lang: Optional[Language]):
+    super().__init__()
+    # only the normalization of English graphemes changes text across whitespace
+    self._check_words = text_format == SymbolFormat.GRAPHEMES and lang == Language.ENG
+    self._mail_tracker = MailAddressTracker()
+    self.text = ""
+    self._reset_scan()
+
+  def _reset_scan(self) -> None:
+    # start of the next word which is not scanned
+    self._scan_position = 0
+    # position from which the whitespace after that word is searched
+    self._search_position = 0
+    self._previous_end: Optional[int] = None
+    # the last word which is not normalized to nothing ends with "@"
+    self._ends_with_at = False
+    # boundary which is safe if the next word which is not normalized to nothing does not start with "@"
+    self._candidate_boundary: Optional[int] = None
+    # boundary after an "@" which is safe if the text up to the next "@" is not replaced by replace_mail_addresses
+    self._pending_boundary: Optional[int] = None
+    self.last_boundary: Optional[int] = None
+    self._mail_tracker.reset()
+
+  def append(self, text: str) -> None:
+    self.text += text
+    while True:
+      match = _whitespace_re.search(self.text, self._search_position)
+      if match is None:
+        self._search_position = len(self.text)
+        return
+      if match.end() == len(self.text):
+        # the whitespace can be continued by the next part
+        self._search_position = match.start()
+        return
+      self._add_word(self.text[self._scan_position:match.start()], match.start())
+      self._scan_position = match.end()
+      self._search_position = match.end()
+
+  def _add_word(self, word: str, end: int) -> None:
+    if word == "":
+      # whitespace at the start of the text
+      return
+    if not self._check_words:
+      if self._previous_end is not None:
+        self.last_boundary = self._previous_end
+      self._previous_end = end
+      return
+
+    is_first = self._previous_end is None
+    normalized_word = self._normalize_word(word, is_first)
+    # units are only expanded after whitespace
+    if not is_first and not is_unit_of_measure(word) and not self._ends_with_at:
+      self._candidate_boundary = self._previous_end
+    if normalized_word != "":
+      if self._candidate_boundary is not None and not normalized_word.startswith("@"):
+        self._add_boundary(self._candidate_boundary)
+      self._candidate_boundary = None
+      self._ends_with_at = normalized_word.endswith("@")
+    self._track_mail_addresses(normalized_word if is_first else f" {normalized_word}")
+    self._previous_end = end
+
+  def _normalize_word(self, word: str, is_first: bool) -> str:
+    if "@" in word or _digit_re.search(word) is not None or self._mail_tracker.can_be_replaced:
+      # replace_mail_addresses is applied on the normalized words, e.g. "1.5" -> "one point five"
+      return normalize_en_word(word, is_first)
+    # the word is not empty and contains no "@" after the normalization, nothing else matters
+    return word
+
+  def _add_boundary(self, boundary: int) -> None:
+    if not self._mail_tracker.can_be_replaced:
+      self.last_boundary = boundary
+    elif not self._mail_tracker.is_replaced:
+      self._pending_boundary = boundary
+
+  def _track_mail_addresses(self, text: str) -> None:
+    parts = text.split("@")
+    self._mail_tracker.add_text(parts[0])
+    for part in parts[1:]:
+      was_replaced = self._mail_tracker.add_at()
+      if self._pending_boundary is not None and not was_replaced:
+        self.last_boundary = self._pending_boundary
+      self._pending_boundary = None
+      self._mail_tracker.add_text(part)
+    if self._mail_tracker.is_replaced:
+      self._pending_boundary = None
+
+  def cut_at_last_boundary(self) -> str:
+    """removes and returns the text before the last safe boundary"""
+    assert self.last_boundary is not None
+    position = self.last_boundary
+    result = self.text[:position]
+    self.text = self.text[position:]
+    self._scan_position -= position
+    self._search_position -= position
+    self._previous_end -= position
+    if self._candidate_boundary is not None:
+      self._candidate_boundary -= position
+    if self._pending_boundary is not None:
+      self._pending_boundary -= position
+    self.last_boundary = None
+    return result
+
+  def cut_after_last_word(self) -> str:
+    """removes and returns the text up to the whitespace after the last complete word, regardless of whether the boundary is safe"""
+    if self._previous_end is None:
+      raise ValueError("The text can not be cut because it contains no whitespace after a word!")
+    result = self.text[:self._previous_end]
+    self.text = self.text[self._previous_end:]
+    self._reset_scan()
+    return result
+
+
+def find_chunk_boundary(text: str) -> Optional[int]:
+  """returns the position of the last safe boundary in the English grapheme text, the text before it can be normalized separately"""
+  scanner = ChunkBoundaryScanner(SymbolFormat.GRAPHEMES, Language.ENG)
+  scanner.append(text)
+  return scanner.last_boundary
+
+
+def text_normalize_iterable(texts: Iterable[str], text_format: SymbolFormat, lang: Optional[Language], chunk_size: int = DEFAULT_NORMALIZATION_CHUNK_SIZE, max_buffer_size: int = DEFAULT_MAX_NORMALIZATION_BUFFER_SIZE) -> Iterator[str]:
+  """normalizes a long text which is given in parts (e.g. the lines of a file) chunk by chunk; a chunk is cut at the last safe boundary as soon as at least chunk_size characters are collected, concatenating the chunks gives the same result as text_normalize on the whole text. If more than max_buffer_size characters are collected without a safe boundary (e.g. a mail address whose text continues up to the next "@"), the text is cut after the last complete word, which can change the result, and a warning is logged; a ValueError is raised if there is no complete word."""
+  assert chunk_size > 0
+  assert max_buffer_size >= chunk_size
+  # unidecode can insert whitespace (e.g. "½" -> " 1/2"), therefore the boundaries are chosen on the converted text; it converts each character on its own, so the parts can be converted separately
+  convert_parts_to_ascii = text_format == SymbolFormat.GRAPHEMES and lang == Language.ENG
+  scanner = ChunkBoundaryScanner(text_format, lang)
+  is_first = True
+  for text in texts:
+    if convert_parts_to_ascii:
+      text = convert_to_ascii(text)
+    scanner.append(text)
+    while True:
+      if len(scanner.text) >= chunk_size and scanner.last_boundary is not None:
+        chunk = scanner.cut_at_last_boundary()
+      elif len(scanner.text) > max_buffer_size:
+        logger = getLogger(__name__)
+        logger.warning(
+          f"The text contains no safe boundary in {len(scanner.text)} characters, therefore it is cut after the last word and the result can differ from the normalization of the whole text.")
+        chunk = scanner.cut_after_last_word()
+      else:
+        break
+      # the chunk contains at least one word, even if it is normalized to nothing (e.g. too large numbers) it is separated by a space like in the whole text
+      chunk = text_normalize(chunk, text_format, lang)
+      result = chunk if is_first else f" {chunk}"
+      is_first = False
+      if result != "":
+        yield result
+
+  if scanner.text.strip() != "":
+    chunk = text_normalize(scanner.text, text_format, lang)
+    result = chunk if is_first else f" {chunk}"
+    if result != "":
+      yield result
+
+
+def text_normalize_file(path: Path, text_format: SymbolFormat, lang: Optional[Language], chunk_size: int = DEFAULT_NORMALIZATION_CHUNK_SIZE, encoding: str = "utf-8", max_buffer_size: int = DEFAULT_MAX_NORMALIZATION_BUFFER_SIZE) -> Iterator[str]:
+  """normalizes the text of the file line by line without loading it completely"""
+  with path.open(mode="r", encoding=encoding) as f:
+    yield from text_normalize_iterable(f, text_format, lang, chunk_size, max_buffer_size)
+
+
 def text_to_symbols(text: str, text_format: SymbolFormat, lang: Optional[Language]) -> Symbols:
   if text_format.is_IPA:
     return parse_ipa_to_symbols(text)
@@ -171,26 +414,9 @@ def text_to_sentences(text: str, text_format: SymbolFormat, lang: Optional[Langu
 
 
 def symbols_to_sentences(symbols: Symbols, symbols_format: SymbolFormat, lang: Optional[Language]) -> List[Symbols]:
-  if symbols_format.is_IPA:
-    return ipa_symbols_to_sentences(symbols)
-  if symbols_format.is_ARPA:
-    return arpa_symbols_to_sentences(symbols)
-
-  assert symbols_format == SymbolFormat.GRAPHEMES
-
-  if lang is None:
-    raise ValueError("Language required!")
-
-  if lang == Language.CHN:
-    return split_chn_graphemes_symbols(symbols)
-
-  if lang == Language.ENG:
-    return split_en_graphemes_symbols(symbols)
-
-  if lang == Language.GER:
-    return split_ger_graphemes_symbols(symbols)
-
-  assert False
+  spans = get_sentence_spans(symbols, symbols_format, lang)
+  sentences = spans_to_sentences(symbols, spans)
+  return sentences
 
 
 def symbols_to_words(symbols: Symbols) -> List[Symbols]:
@@ -212,26 +438,20 @@ def split_chn_graphemes_symbols(symbols: Symbols) -> List[Symbols]:
 
 
 def split_en_graphemes_symbols(symbols: Symbols) -> List[Symbols]:
-  res = split_en_graphemes_text(''.join(symbols))
-  sentence_symbols = [text_to_symbols(
-    sentence, text_format=SymbolFormat.GRAPHEMES, lang=Language.ENG) for sentence in res]
-  return sentence_symbols
+  spans = get_text_sentence_spans(symbols, Language.ENG)
+  return spans_to_sentences(symbols, spans)
 
 
 def split_en_graphemes_text(text: str) -> List[str]:
-  download('punkt', quiet=True)
-  res = sent_tokenize(text, language="english")
+  res = tokenize_sentences(text, Language.ENG)
   return res
 
 
 def split_ger_graphemes_symbols(symbols: Symbols) -> List[Symbols]:
-  res = split_ger_graphemes_text(''.join(symbols))
-  sentence_symbols = [text_to_symbols(
-    sentence, text_format=SymbolFormat.GRAPHEMES, lang=Language.GER) for sentence in res]
-  return sentence_symbols
+  spans = get_text_sentence_spans(symbols, Language.GER)
+  return spans_to_sentences(symbols, spans)
 
 
 def split_ger_graphemes_text(text: str) -> List[str]:
-  download('punkt', quiet=True)
-  res = sent_tokenize(text, language="german")
+  res = tokenize_sentences(text, Language.GER)
   return res
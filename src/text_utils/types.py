@@ -3,6 +3,10 @@ from typing import List, Optional, Tuple
 Symbol = str
 Symbols = Tuple[Symbol, ...]
 
+# start (inclusive) and end (exclusive) index into a sequence
+Span = Tuple[int, int]
+Spans = List[Span]
+
 SymbolId = int
 SymbolIds = Tuple[Optional[SymbolId], ...]
 
@@ -0,0 +1,23 @@
+import os
+
+TRUSTED_MODE_ENV = "TEXT_UTILS_TRUSTED_MODE"
+TRUE_VALUES = {"1", "true", "yes", "on"}
+
+
+def get_trusted_mode_from_env() -> bool:
+  value = os.environ.get(TRUSTED_MODE_ENV, "")
+  return value.strip().lower() in TRUE_VALUES
+
+
+# in trusted mode the inputs are not validated on hot paths; the default is strict
+TRUSTED_MODE = get_trusted_mode_from_env()
+
+
+def set_trusted_mode(enabled: bool) -> None:
+  # pylint: disable=global-statement
+  global TRUSTED_MODE
+  TRUSTED_MODE = enabled
+
+
+def is_trusted_mode() -> bool:
+  return TRUSTED_MODE
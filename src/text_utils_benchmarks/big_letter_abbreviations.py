@@ -0,0 +1,32 @@
+import re
+import timeit
+
+from text_utils.adjustments import replace_big_letter_abbreviations
+
+NUMBER = 5
+_big_letter_re = re.compile(r'([A-Z])([A-Z])')
+
+INPUTS = {
+  "shouted headlines": "BREAKING NEWS: THE GOVERNMENT ANNOUNCED NEW MEASURES TODAY " * 2000,
+  "id strings": " ".join(f"ID{i:08d}XQZTRBKLMN" for i in range(10000)),
+  "one uppercase run": "A" * 200000,
+  "alternating case": "aB" * 100000,
+}
+
+
+def replace_big_letter_abbreviations_loop(text: str) -> str:
+  # previous implementation for comparison
+  while len(re.findall(_big_letter_re, text)) > 0:
+    text = re.sub(_big_letter_re, r'\1 \2', text)
+  return text
+
+
+if __name__ == "__main__":
+  for name, text in INPUTS.items():
+    assert replace_big_letter_abbreviations(text) == replace_big_letter_abbreviations_loop(text)
+    loop = timeit.timeit(lambda: replace_big_letter_abbreviations_loop(text), number=NUMBER) / NUMBER
+    single = timeit.timeit(lambda: replace_big_letter_abbreviations(text), number=NUMBER) / NUMBER
+    print(f"{name} ({len(text)} characters), {NUMBER} runs")
+    print(f"loop: {loop * 1000:.3f}ms")
+    print(f"single pass: {single * 1000:.3f}ms")
+    print(f"speedup: {loop / single:.1f}x")
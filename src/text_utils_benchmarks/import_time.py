@@ -0,0 +1,19 @@
+import statistics
+import subprocess
+import sys
+import time
+
+RUNS = 10
+
+
+def measure_import_time(module: str) -> float:
+  start = time.perf_counter()
+  subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+  return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+  baseline = [measure_import_time("sys") for _ in range(RUNS)]
+  durations = [measure_import_time("text_utils") for _ in range(RUNS)]
+  print(f"interpreter start: {statistics.median(baseline) * 1000:.1f}ms (median of {RUNS} runs)")
+  print(f"import text_utils: {(statistics.median(durations) - statistics.median(baseline)) * 1000:.1f}ms (median of {RUNS} runs, without interpreter start)")
@@ -0,0 +1,63 @@
+import timeit
+
+from text_utils.pronunciation.ipa2symb import (
+    merge_fusion_with_ignore, merge_fusion_with_ignore_core,
+    merge_template_with_ignore_core, merge_template_with_ignore_trie,
+    parse_ipa_symbols_to_symbols, tokenize_ipa)
+from text_utils.pronunciation.ipa_symbols import (APPENDIX, ENG_ARPA_DIPHTONGS,
+                                                  SCHWAS, STRESSES, VOWELS)
+
+SENTENCE = "ðɪs ɪz ə ˈtɛst ˌwɪð ˈt͡ʃaɪniz peɪ˧˩˧ fɤ˥ŋ, ˈaːbʰ t̪͡s ɪ̯ː! " * 20
+NUMBER = 200
+# a paragraph level English utterance
+ENG_SYMBOLS = tokenize_ipa("ðɪs ɪz ə ˈlɔŋ ˈtɛst ˈwɪð ˈmɛni ˈdaɪfθɔŋz ˈlaɪk ˈbɔɪ, ˈnaʊ ənd ˈoʊnli. " * 20)
+
+# a paragraph level Chinese utterance
+CHN_SYMBOLS = tokenize_ipa("peɪ˧˩˧ fɤ˥ŋ kən˥ tʰaɪ˥˩ jɑŋ˧˥ tʂɤŋ˥ tsaɪ˥˩ naɪ˥˩ ɻ˧˥ tʂɤŋ˥ lwən˥˩, " * 50)
+
+
+def benchmark_tokenize_ipa() -> None:
+  assert tokenize_ipa(SENTENCE) == parse_ipa_symbols_to_symbols(tuple(SENTENCE))
+  three_passes = timeit.timeit(lambda: parse_ipa_symbols_to_symbols(tuple(SENTENCE)), number=NUMBER)
+  single_pass = timeit.timeit(lambda: tokenize_ipa(SENTENCE), number=NUMBER)
+  print(f"sentence with {len(SENTENCE)} characters, {NUMBER} runs")
+  print(f"parse_ipa_symbols_to_symbols (three passes): {three_passes / NUMBER * 1000:.3f}ms")
+  print(f"tokenize_ipa (single pass): {single_pass / NUMBER * 1000:.3f}ms")
+  print(f"speedup: {three_passes / single_pass:.1f}x")
+
+
+def benchmark_merge_template_with_ignore() -> None:
+  ignore = STRESSES | APPENDIX
+  number = 5
+  assert merge_template_with_ignore_trie(ENG_SYMBOLS, ENG_ARPA_DIPHTONGS, ignore) == \
+      merge_template_with_ignore_core(ENG_SYMBOLS, ENG_ARPA_DIPHTONGS, ignore)
+  core = timeit.timeit(lambda: merge_template_with_ignore_core(
+    ENG_SYMBOLS, ENG_ARPA_DIPHTONGS, ignore), number=number)
+  trie = timeit.timeit(lambda: merge_template_with_ignore_trie(
+    ENG_SYMBOLS, ENG_ARPA_DIPHTONGS, ignore), number=number)
+  print(f"utterance with {len(ENG_SYMBOLS)} symbols, {number} runs")
+  print(f"merge_template_with_ignore_core: {core / number * 1000:.3f}ms")
+  print(f"merge_template_with_ignore_trie: {trie / number * 1000:.3f}ms")
+  print(f"speedup: {core / trie:.1f}x")
+
+
+def benchmark_merge_fusion_with_ignore() -> None:
+  fusion_symbols = VOWELS | SCHWAS
+  ignore = STRESSES | APPENDIX
+  number = 5
+  assert merge_fusion_with_ignore(CHN_SYMBOLS, fusion_symbols, ignore) == \
+      merge_fusion_with_ignore_core(CHN_SYMBOLS, fusion_symbols, ignore)
+  core = timeit.timeit(lambda: merge_fusion_with_ignore_core(
+    CHN_SYMBOLS, fusion_symbols, ignore), number=number)
+  single_pass = timeit.timeit(lambda: merge_fusion_with_ignore(
+    CHN_SYMBOLS, fusion_symbols, ignore), number=number)
+  print(f"utterance with {len(CHN_SYMBOLS)} symbols, {number} runs")
+  print(f"merge_fusion_with_ignore_core: {core / number * 1000:.3f}ms")
+  print(f"merge_fusion_with_ignore: {single_pass / number * 1000:.3f}ms")
+  print(f"speedup: {core / single_pass:.1f}x")
+
+
+if __name__ == "__main__":
+  benchmark_tokenize_ipa()
+  benchmark_merge_template_with_ignore()
+  benchmark_merge_fusion_with_ignore()
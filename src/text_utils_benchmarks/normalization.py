@@ -0,0 +1,60 @@
+import timeit
+
+from unidecode import unidecode as convert_to_ascii
+
+from text_utils.adjustments import (clear_en_word_cache, collapse_whitespace,
+                                    expand_abbreviations,
+                                    expand_units_of_measure, normalize_numbers,
+                                    replace_at_symbols,
+                                    replace_big_letter_abbreviations,
+                                    replace_mail_addresses)
+from text_utils.text import normalize_en_grapheme_text
+
+NUMBER = 5
+ENG_TEXT = (
+  "Mr. Smith paid $3.50 for 5 kg of apples on the 3rd of May in 1987. "
+  "The USA has about 330,000,000 inhabitants and an area of 9.8e6 square kilometers. "
+  "Please write to Dr. Miller at the address info@example.com if you have questions. "
+  "It was a bright cold day in April, and the clocks were striking thirteen. "
+) * 500
+
+
+def normalize_en_grapheme_text_sequentially(text: str) -> str:
+  text = convert_to_ascii(text)
+  text = text.strip()
+  text = collapse_whitespace(text)
+  text = normalize_numbers(text)
+  text = expand_abbreviations(text)
+  text = expand_units_of_measure(text)
+  text = replace_big_letter_abbreviations(text)
+  text = replace_mail_addresses(text)
+  text = replace_at_symbols(text)
+  return text
+
+
+def run_sequentially() -> None:
+  normalize_en_grapheme_text_sequentially(ENG_TEXT)
+
+
+def run_word_by_word() -> None:
+  clear_en_word_cache()
+  normalize_en_grapheme_text(ENG_TEXT)
+
+
+def run_word_by_word_cached() -> None:
+  normalize_en_grapheme_text(ENG_TEXT)
+
+
+def benchmark(name: str, method) -> float:
+  duration = timeit.timeit(method, number=NUMBER) / NUMBER
+  print(f"{name}: {len(ENG_TEXT) / duration:,.0f} chars/s")
+  return duration
+
+
+if __name__ == "__main__":
+  assert normalize_en_grapheme_text(ENG_TEXT) == normalize_en_grapheme_text_sequentially(ENG_TEXT)
+  print(f"normalize_en_grapheme_text with {len(ENG_TEXT)} characters, {NUMBER} runs")
+  sequential = benchmark("one pass per rule", run_sequentially)
+  word_by_word = benchmark("word by word", run_word_by_word)
+  cached = benchmark("word by word with filled cache", run_word_by_word_cached)
+  print(f"speedup: {sequential / word_by_word:.1f}x, with filled cache: {sequential / cached:.1f}x")
@@ -0,0 +1,34 @@
+import timeit
+
+from text_utils.adjustments.numbers import (DEFAULT_NUMBER_WORDS_CACHE_SIZE,
+                                            clear_number_words_cache,
+                                            normalize_numbers,
+                                            set_number_words_cache_size)
+
+NUMBER = 5
+FINANCIAL_TEXT = (
+  "Shares of the company rose 3.5 percent to $1,254.30 on Tuesday after it reported revenue of $25,300,000 for 2021. "
+  "In 1999 the stock traded at $12, and 21 analysts expect earnings of $4.75 per share in the 4th quarter of 2022. "
+  "The index closed 1,200 points higher at 34,500, its 3rd gain in 5 sessions and the best day since 2008. "
+) * 300
+
+
+def run() -> None:
+  normalize_numbers(FINANCIAL_TEXT)
+
+
+def benchmark(name: str) -> float:
+  duration = timeit.timeit(run, number=NUMBER) / NUMBER
+  print(f"{name}: {duration * 1000:.3f}ms, {len(FINANCIAL_TEXT) / duration:,.0f} chars/s")
+  return duration
+
+
+if __name__ == "__main__":
+  print(f"normalize_numbers with {len(FINANCIAL_TEXT)} characters, {NUMBER} runs")
+  set_number_words_cache_size(0)
+  uncached = benchmark("without cache")
+  set_number_words_cache_size(DEFAULT_NUMBER_WORDS_CACHE_SIZE)
+  clear_number_words_cache()
+  run()
+  cached = benchmark("with filled cache")
+  print(f"speedup: {uncached / cached:.1f}x")
@@ -0,0 +1,28 @@
+import timeit
+
+from text_utils.pronunciation.chinese_ipa import CHN_PUNCTUATION_MAPPING
+from text_utils.symbol_mapper import SymbolMapper
+from text_utils.utils import symbols_map
+
+NUMBER = 20
+SYMBOLS = tuple("北风和太阳在争论谁的本事大，「谁」？后来！") * 500
+
+
+def run_symbols_map() -> None:
+  symbols_map(SYMBOLS, CHN_PUNCTUATION_MAPPING)
+
+
+def run_symbol_mapper() -> None:
+  MAPPER.map(SYMBOLS)
+
+
+MAPPER = SymbolMapper(CHN_PUNCTUATION_MAPPING)
+
+if __name__ == "__main__":
+  assert MAPPER.map(SYMBOLS) == symbols_map(SYMBOLS, CHN_PUNCTUATION_MAPPING)
+  print(f"CHN_PUNCTUATION_MAPPING on {len(SYMBOLS)} symbols, {NUMBER} runs")
+  loop = timeit.timeit(run_symbols_map, number=NUMBER) / NUMBER
+  mapper = timeit.timeit(run_symbol_mapper, number=NUMBER) / NUMBER
+  print(f"symbols_map: {loop * 1000:.3f}ms")
+  print(f"SymbolMapper: {mapper * 1000:.3f}ms")
+  print(f"speedup: {loop / mapper:.1f}x")
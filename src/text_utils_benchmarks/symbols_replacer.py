@@ -0,0 +1,37 @@
+import random
+import timeit
+
+from text_utils.symbols_replacer import SymbolsReplacer
+from text_utils.utils import symbols_replace
+
+NUMBER = 5
+random.seed(1234)
+LETTERS = tuple("abcdefghijklmnopqrstuvwxyz")
+# lexicon fixes: a word (between spaces) is replaced with another word
+REPLACEMENTS = [
+  ((" ",) + tuple(random.choices(LETTERS, k=6)) + (" ",), (" ",) + tuple(random.choices(LETTERS, k=5)) + (" ",))
+  for _ in range(300)
+]
+SYMBOLS = tuple(symbol for _ in range(200)
+                for symbol in random.choice(REPLACEMENTS)[0] + tuple(random.choices(LETTERS, k=4)))
+
+
+def run_symbols_replace() -> None:
+  result = SYMBOLS
+  for search_for, replace_with in REPLACEMENTS:
+    result = symbols_replace(result, search_for, replace_with, ignore_case=True)
+
+
+def run_symbols_replacer() -> None:
+  REPLACER.replace(SYMBOLS)
+
+
+REPLACER = SymbolsReplacer(REPLACEMENTS, ignore_case=True)
+
+if __name__ == "__main__":
+  print(f"{len(REPLACEMENTS)} replacements in {len(SYMBOLS)} symbols, {NUMBER} runs")
+  sequential = timeit.timeit(run_symbols_replace, number=NUMBER) / NUMBER
+  automaton = timeit.timeit(run_symbols_replacer, number=NUMBER) / NUMBER
+  print(f"symbols_replace per replacement: {sequential * 1000:.3f}ms")
+  print(f"SymbolsReplacer: {automaton * 1000:.3f}ms")
+  print(f"speedup: {sequential / automaton:.1f}x")
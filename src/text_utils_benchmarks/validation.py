@@ -0,0 +1,51 @@
+import timeit
+
+from sentence2pronunciation.lookup_cache import get_empty_cache
+from text_utils.accent_symbols import get_accent_symbol_ids
+from text_utils.pronunciation.chinese_ipa import chn_to_ipa
+from text_utils.string_format import StringFormat, convert_string_to_symbols
+from text_utils.symbol_id_dict import SymbolIdDict
+from text_utils.validation import is_trusted_mode, set_trusted_mode
+
+NUMBER = 20
+CHN_SENTENCE = tuple("北风 和 太阳 在 争论 谁 的 本事 大。 " * 20)
+SYMBOLS_STRING = "ð ɪ s  ɪ z  ə  t ɛ s t" * 200
+
+
+def run_chn_to_ipa() -> None:
+  # the cache is filled, so mainly the validation at the end is measured
+  chn_to_ipa(CHN_SENTENCE, consider_annotations=False, annotation_split_symbol=None, cache=CACHE)
+
+
+def run_symbol_ids() -> None:
+  symbols = convert_string_to_symbols(SYMBOLS_STRING, StringFormat.SYMBOLS)
+  symbol_ids = SYMBOL_IDS.get_ids(symbols)
+  get_accent_symbol_ids(symbol_ids, [0] * len(symbol_ids), len(SYMBOL_IDS),
+                        accents_use_own_symbols=True, shared_symbol_count=1)
+  SYMBOL_IDS.get_symbols(symbol_ids)
+
+
+CACHE = get_empty_cache()
+run_chn_to_ipa()
+SYMBOL_IDS = SymbolIdDict.init_from_symbols(
+  set(convert_string_to_symbols(SYMBOLS_STRING, StringFormat.SYMBOLS)))
+
+
+def benchmark(name: str, method) -> None:
+  old_mode = is_trusted_mode()
+  try:
+    set_trusted_mode(False)
+    strict = timeit.timeit(method, number=NUMBER)
+    set_trusted_mode(True)
+    trusted = timeit.timeit(method, number=NUMBER)
+  finally:
+    set_trusted_mode(old_mode)
+  print(f"{name}, {NUMBER} runs")
+  print(f"strict: {strict / NUMBER * 1000:.3f}ms")
+  print(f"trusted: {trusted / NUMBER * 1000:.3f}ms")
+  print(f"speedup: {strict / trusted:.1f}x")
+
+
+if __name__ == "__main__":
+  benchmark(f"chn_to_ipa with {len(CHN_SENTENCE)} characters", run_chn_to_ipa)
+  benchmark(f"symbols string with {len(SYMBOLS_STRING)} characters to ids", run_symbol_ids)
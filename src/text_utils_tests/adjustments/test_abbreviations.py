@@ -17,3 +17,8 @@ def test_expand_abbreviations():
 def test_expand_units_of_measure():
   res = expand_units_of_measure("g kg mm cm m S s he's min.")
   assert res == "g kilograms millimeters centimeters meters S seconds he's minutes."
+
+
+def test_replace_big_letter_abbreviations__long_run():
+  res = replace_big_letter_abbreviations("ABCDE xABCx")
+  assert res == "A B C D E xA B Cx"
@@ -1,4 +1,8 @@
-from text_utils.adjustments.emails import (replace_at_symbols,
+import random
+import re
+
+from text_utils.adjustments.emails import (MailAddressTracker,
+                                           replace_at_symbols,
                                            replace_mail_addresses)
 
 
@@ -45,3 +49,22 @@ def test_replace_at_symbols_both_space():
 def test_replace_at_symbols_double_at():
   res = replace_at_symbols("abc@@def")
   assert res == "abc at  at def"
+
+
+def test_mail_address_tracker__follows_replace_mail_addresses():
+  rng = random.Random(0)
+  for _ in range(1000):
+    text = "".join(rng.choice(["a", ".", "@", " "]) for _ in range(rng.randint(0, 12)))
+    parts = text.split("@")
+    tracker = MailAddressTracker()
+    tracker.add_text(parts[0])
+    res = parts[0]
+    for part in parts[1:]:
+      tracker.add_at()
+      tracker.add_text(part)
+      if tracker.is_replaced:
+        res += " at " + re.sub(r"(.+)\.(.+)", r"\1 dot \2", part)
+      else:
+        res += "@" + part
+
+    assert res == replace_mail_addresses(text)
@@ -0,0 +1,49 @@
+from text_utils.adjustments.abbreviations import (
+    expand_abbreviations, expand_units_of_measure,
+    replace_big_letter_abbreviations)
+from text_utils.adjustments.english import (WORD_CACHE, clear_en_word_cache,
+                                            normalize_en_word,
+                                            normalize_en_words)
+from text_utils.adjustments.numbers import normalize_numbers
+
+
+def normalize_sequentially(text: str) -> str:
+  text = normalize_numbers(text)
+  text = expand_abbreviations(text)
+  text = expand_units_of_measure(text)
+  text = replace_big_letter_abbreviations(text)
+  return text
+
+
+def test_normalize_en_words__same_as_sequential_rules():
+  texts = [
+    "BC BC BCab abBC BC",
+    "Mrs. Mr. Dr. St. Co. Jr. Maj. Gen. Drs. Rev. Lt. Hon. Sgt. Capt. Esq. Ltd. Col. Ft. MRS. mrs gen",
+    "g kg mm cm m S s he's min.",
+    "$5654 -54 5e-21 test $300,000.40",
+    "e-5654 e5654 45e5654 45e-5654 x-5 -5",
+    "It weighs 5 kg and costs $1,000.25 on the 3rd of May",
+    "",
+  ]
+
+  for text in texts:
+    assert normalize_en_words(text) == normalize_sequentially(text)
+
+
+def test_normalize_en_word__unit_at_start_is_not_expanded():
+  assert normalize_en_word("kg", is_first=True) == "kg"
+  assert normalize_en_word("kg", is_first=False) == "kilograms"
+
+
+def test_normalize_en_word__without_rules_returns_word():
+  res = normalize_en_word("test", is_first=False)
+  assert res == "test"
+
+
+def test_clear_en_word_cache():
+  normalize_en_word("5th", is_first=False)
+  assert "5th" in WORD_CACHE
+
+  clear_en_word_cache()
+
+  assert len(WORD_CACHE) == 0
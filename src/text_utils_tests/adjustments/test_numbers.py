@@ -1,8 +1,15 @@
 import re
 
-from text_utils.adjustments.numbers import (__expand_number, __number_re,
+from text_utils.adjustments.numbers import (DEFAULT_NUMBER_WORDS_CACHE_SIZE,
+                                            NUMBER_STYLE_ORDINAL,
+                                            NUMBER_STYLE_YEAR,
+                                            NUMBER_WORDS_CACHE,
+                                            __expand_number, __number_re,
                                             __replace_e_to_the_power_of,
-                                            __replace_minus, normalize_numbers)
+                                            __replace_minus,
+                                            clear_number_words_cache,
+                                            normalize_numbers, number_to_words,
+                                            set_number_words_cache_size)
 
 
 def test_replace_e_to_the_power_of__e_minus():
@@ -119,3 +126,37 @@ def test_expand_number__number_greater_than_undecillion__return_empty_string():
   m = re.match(__number_re, str(10**36 + 5))
   res = __expand_number(m)
   assert res == ""
+
+
+def test_number_to_words__is_cached_per_style():
+  clear_number_words_cache()
+
+  res_year = number_to_words(1987, NUMBER_STYLE_YEAR)
+  res_ordinal = number_to_words("3rd", NUMBER_STYLE_ORDINAL)
+
+  assert res_year == "nineteen eighty-seven"
+  assert res_ordinal == "third"
+  assert NUMBER_WORDS_CACHE == {
+    (1987, NUMBER_STYLE_YEAR): "nineteen eighty-seven",
+    ("3rd", NUMBER_STYLE_ORDINAL): "third",
+  }
+  clear_number_words_cache()
+
+
+def test_set_number_words_cache_size__is_bounded():
+  set_number_words_cache_size(2)
+
+  normalize_numbers("1 2 3")
+
+  assert len(NUMBER_WORDS_CACHE) <= 2
+  set_number_words_cache_size(DEFAULT_NUMBER_WORDS_CACHE_SIZE)
+
+
+def test_set_number_words_cache_size__zero_disables_cache():
+  set_number_words_cache_size(0)
+
+  res = normalize_numbers("1 1")
+
+  assert res == "one one"
+  assert len(NUMBER_WORDS_CACHE) == 0
+  set_number_words_cache_size(DEFAULT_NUMBER_WORDS_CACHE_SIZE)
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from text_utils.pronunciation.stress_detection import (StressIdSplitter,
+                                                       StressType)
+from text_utils.symbol_format import SymbolFormat
+from text_utils.symbol_id_dict import SymbolIdDict
+
+
+def test_ipa():
+  symbol_ids = SymbolIdDict.init_from_symbols({"ˈɑ", "ɑ", "b", "ˌeɪ"})
+  splitter = StressIdSplitter(symbol_ids, SymbolFormat.PHONEMES_IPA)
+  ids = np.array(symbol_ids.get_ids(("b", "ˈɑ", "ɑ", "ˌeɪ")))
+
+  base_ids, stresses = splitter.split(ids)
+
+  assert splitter.base_symbol_ids.get_symbols(tuple(base_ids.tolist())) == ("b", "ɑ", "ɑ", "eɪ")
+  assert stresses.tolist() == [StressType.NOT_APPLICABLE,
+                               StressType.PRIMARY, StressType.UNSTRESSED, StressType.SECONDARY]
+
+
+def test_arpa__given_base_symbol_ids():
+  symbol_ids = SymbolIdDict.init_from_symbols({"AA1", "AA0", "B"})
+  base_symbol_ids = SymbolIdDict.init_from_symbols({"AA", "B", "C"})
+  splitter = StressIdSplitter(symbol_ids, SymbolFormat.PHONEMES_ARPA, base_symbol_ids)
+  ids = np.array(symbol_ids.get_ids(("AA1", "B", "AA0")))
+
+  base_ids, stresses = splitter.split(ids)
+
+  assert base_symbol_ids.get_symbols(tuple(base_ids.tolist())) == ("AA", "B", "AA")
+  assert stresses.tolist() == [StressType.PRIMARY,
+                               StressType.NOT_APPLICABLE, StressType.UNSTRESSED]
+
+
+def test_base_symbol_missing__raises_value_error():
+  symbol_ids = SymbolIdDict.init_from_symbols({"AA1"})
+  base_symbol_ids = SymbolIdDict.init_from_symbols({"B"})
+
+  with pytest.raises(ValueError):
+    StressIdSplitter(symbol_ids, SymbolFormat.PHONEMES_ARPA, base_symbol_ids)
+
+
+def test_unknown_id__raises_value_error():
+  symbol_ids = SymbolIdDict.init_from_symbols({"AA1"})
+  splitter = StressIdSplitter(symbol_ids, SymbolFormat.PHONEMES_ARPA)
+
+  with pytest.raises(ValueError):
+    splitter.split(np.array([1]))
@@ -0,0 +1,30 @@
+from text_utils.pronunciation.stress_detection import (StressType,
+                                                       split_stress_arpa,
+                                                       split_stresses_arpa)
+
+
+def test_empty__returns_empty():
+  base_symbols, stresses = split_stresses_arpa(tuple())
+  assert base_symbols == tuple()
+  assert stresses.tolist() == []
+
+
+def test_sentence():
+  base_symbols, stresses = split_stresses_arpa(('DH', 'IH0', 'S', ' ', 'AA1', 'EY2', 'AH'))
+  assert base_symbols == ('DH', 'IH', 'S', ' ', 'AA', 'EY', 'AH')
+  assert stresses.tolist() == [
+    StressType.NOT_APPLICABLE,
+    StressType.UNSTRESSED,
+    StressType.NOT_APPLICABLE,
+    StressType.NOT_APPLICABLE,
+    StressType.PRIMARY,
+    StressType.SECONDARY,
+    StressType.UNSTRESSED,
+  ]
+
+
+def test_equals_split_stress_arpa():
+  symbols = ('AA1', 'B', 'AA1', 'AO0', '', 'K')
+  base_symbols, stresses = split_stresses_arpa(symbols)
+  expected = [split_stress_arpa(symbol) for symbol in symbols]
+  assert list(zip(base_symbols, stresses.tolist())) == expected
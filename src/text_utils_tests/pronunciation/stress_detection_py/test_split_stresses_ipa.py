@@ -0,0 +1,30 @@
+from text_utils.pronunciation.stress_detection import (StressType,
+                                                       split_stress_ipa,
+                                                       split_stresses_ipa)
+
+
+def test_empty__returns_empty():
+  base_symbols, stresses = split_stresses_ipa(tuple())
+  assert base_symbols == tuple()
+  assert stresses.tolist() == []
+
+
+def test_sentence():
+  base_symbols, stresses = split_stresses_ipa(('ð', 'ɪ', 's', ' ', 'ˈɑ', 'ˌeɪ', 'ə'))
+  assert base_symbols == ('ð', 'ɪ', 's', ' ', 'ɑ', 'eɪ', 'ə')
+  assert stresses.tolist() == [
+    StressType.NOT_APPLICABLE,
+    StressType.UNSTRESSED,
+    StressType.NOT_APPLICABLE,
+    StressType.NOT_APPLICABLE,
+    StressType.PRIMARY,
+    StressType.SECONDARY,
+    StressType.UNSTRESSED,
+  ]
+
+
+def test_equals_split_stress_ipa():
+  symbols = ('ˈɑː', 'b', 'ˈɑː', 'ɔ', '', 'ˈk')
+  base_symbols, stresses = split_stresses_ipa(symbols)
+  expected = [split_stress_ipa(symbol) for symbol in symbols]
+  assert list(zip(base_symbols, stresses.tolist())) == expected
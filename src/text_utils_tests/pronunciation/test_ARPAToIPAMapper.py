@@ -1,7 +1,10 @@
+import numpy as np
+import pytest
 from text_utils.pronunciation.arpa_symbols import ALL_ARPA_INCL_STRESSES
 from text_utils.pronunciation.ARPAToIPAMapper import (
-    __ARPABET_IPA_MAP, symbol_map_arpa_to_ipa, symbols_map_arpa_to_ipa,
-    symbols_remove_non_arpa_symbols)
+    __ARPABET_IPA_MAP, ARPAToIPAIdMapper, symbol_map_arpa_to_ipa,
+    symbols_map_arpa_to_ipa, symbols_remove_non_arpa_symbols)
+from text_utils.symbol_id_dict import SymbolIdDict
 
 
 def test_symbols_remove_non_arpa_symbols():
@@ -107,3 +110,62 @@ def test_symbol_map_arpa_to_ipa__replace_unknown_is_None():
   )
 
   assert result is None
+
+
+def test_arpa_to_ipa_id_mapper__equals_symbols_map_arpa_to_ipa():
+  arpa_symbols = ('DH', 'IH0', 'S', ' ', 'IH0', 'Z', ' ', 'AH0', ' ', 'T', 'EH1', 'S', 'T', 'AY2', 'UH')
+  arpa_symbol_ids = SymbolIdDict.init_from_symbols(ALL_ARPA_INCL_STRESSES | {" "})
+  mapper = ARPAToIPAIdMapper(arpa_symbol_ids, None, ignore={" "},
+                             replace_unknown=False, replace_unknown_with=None)
+
+  result = mapper.map_ids(np.array(arpa_symbol_ids.get_ids(arpa_symbols)))
+
+  expected = symbols_map_arpa_to_ipa(arpa_symbols, ignore={" "},
+                                     replace_unknown=False, replace_unknown_with=None)
+  assert mapper.ipa_symbol_ids.get_symbols(tuple(result.tolist())) == expected
+
+
+def test_arpa_to_ipa_id_mapper__replace_unknown_with_symbol():
+  arpa_symbol_ids = SymbolIdDict.init_from_symbols({"AA1", "B", "."})
+  ipa_symbol_ids = SymbolIdDict.init_from_symbols({"ˈɑ", "b", "_"})
+  mapper = ARPAToIPAIdMapper(arpa_symbol_ids, ipa_symbol_ids, ignore=set(),
+                             replace_unknown=True, replace_unknown_with="_")
+
+  result = mapper.map_ids(np.array([arpa_symbol_ids.get_id("B"), arpa_symbol_ids.get_id("."), 100]))
+
+  assert ipa_symbol_ids.get_symbols(tuple(result.tolist())) == ("b", "_", "_")
+
+
+def test_arpa_to_ipa_id_mapper__replace_unknown_with_symbol__without_ipa_symbol_ids():
+  arpa_symbol_ids = SymbolIdDict.init_from_symbols({"AA1", "B"})
+  mapper = ARPAToIPAIdMapper(arpa_symbol_ids, None, ignore=set(),
+                             replace_unknown=True, replace_unknown_with="_")
+
+  result = mapper.map_ids(np.array([arpa_symbol_ids.get_id("B"), 100, -1]))
+
+  assert mapper.ipa_symbol_ids.symbol_exists("_")
+  assert mapper.ipa_symbol_ids.get_symbols(tuple(result.tolist())) == ("b", "_", "_")
+
+
+def test_arpa_to_ipa_id_mapper__replace_unknown_with_none__drops():
+  arpa_symbol_ids = SymbolIdDict.init_from_symbols({"AA1", "B", "."})
+  mapper = ARPAToIPAIdMapper(arpa_symbol_ids, None, ignore=set(),
+                             replace_unknown=True, replace_unknown_with=None)
+
+  result = mapper.map_ids(np.array(
+    [arpa_symbol_ids.get_id("AA1"), arpa_symbol_ids.get_id("."), -1, arpa_symbol_ids.get_id("B")]))
+
+  assert mapper.ipa_symbol_ids.get_symbols(tuple(result.tolist())) == ("ˈɑ", "b")
+
+
+def test_arpa_to_ipa_id_mapper__not_replace_unknown__raises_value_error():
+  arpa_symbol_ids = SymbolIdDict.init_from_symbols({"AA1", "B"})
+  ipa_symbol_ids = SymbolIdDict.init_from_symbols({"ˈɑ"})
+  mapper = ARPAToIPAIdMapper(arpa_symbol_ids, ipa_symbol_ids, ignore=set(),
+                             replace_unknown=False, replace_unknown_with=None)
+
+  assert mapper.map_ids(np.array([arpa_symbol_ids.get_id("AA1")])).tolist() == [0]
+  with pytest.raises(ValueError):
+    mapper.map_ids(np.array([arpa_symbol_ids.get_id("B")]))
+  with pytest.raises(ValueError):
+    mapper.map_ids(np.array([5]))
@@ -0,0 +1,17 @@
+from text_utils.pronunciation.G2p_batch import predict_batch
+from text_utils.pronunciation.G2p_cache import get_eng_g2p
+
+
+def test_predict_batch__empty():
+  result = predict_batch(get_eng_g2p(), [])
+
+  assert result == []
+
+
+def test_predict_batch__equals_predict():
+  model = get_eng_g2p()
+  words = ["test", "xyzzyq", "a", "activationist", "test"]
+
+  result = predict_batch(model, words, batch_size=2)
+
+  assert result == [tuple(model.predict(word)) for word in words]
@@ -1,20 +1,92 @@
+import json
+
 from sentence2pronunciation.lookup_cache import get_empty_cache
-from text_utils.pronunciation.chinese_ipa import (__get_chn_ipa, chn_to_ipa,
-                                                  get_vowel_count)
+from text_utils.pronunciation import chinese_ipa
+from text_utils.pronunciation.chinese_ipa import (__get_chn_ipa,
+                                                  build_chn_syllables,
+                                                  chn_to_ipa,
+                                                  get_chn_syllable_ipa,
+                                                  get_chn_syllables,
+                                                  get_vowel_count,
+                                                  load_chn_syllables,
+                                                  save_chn_syllables)
+
 
+def use_tmp_cache_dir(tmp_path, monkeypatch) -> None:
+  monkeypatch.setenv("TEXT_UTILS_CACHE_DIR", str(tmp_path))
+  monkeypatch.setattr(chinese_ipa, "CHN_SYLLABLES", None)
+  monkeypatch.setattr(chinese_ipa, "CHN_UNKNOWN_SYLLABLES", {})
 
-def test_get_chn_ipa():
+
+def test_get_chn_ipa(tmp_path, monkeypatch):
+  use_tmp_cache_dir(tmp_path, monkeypatch)
   result = __get_chn_ipa(tuple("堡包"))
 
   assert result == ('p', 'ɑ', 'ʊ˧˩˧', 'p', 'ɑ', 'ʊ˥')
 
 
-def test_get_chn_ipa__syllable_without_vowel():
+def test_get_chn_ipa__syllable_without_vowel(tmp_path, monkeypatch):
+  use_tmp_cache_dir(tmp_path, monkeypatch)
   result = __get_chn_ipa(tuple("儿"))
 
   assert result == ('ɻ',)
 
 
+def test_build_chn_syllables():
+  result = build_chn_syllables()
+
+  assert result["peɪ˧˩˧"] == ('p', 'e', 'ɪ˧˩˧')
+  assert result["fɤŋ˥"] == ('f', 'ɤ˥', 'ŋ')
+  assert result["ɻ"] == ('ɻ',)
+  assert "ŋ˥" not in result
+
+
+def test_save_chn_syllables__load_chn_syllables(tmp_path):
+  path = tmp_path / "sub" / "syllables.json"
+
+  save_chn_syllables({"peɪ˧˩˧": ('p', 'e', 'ɪ˧˩˧')}, path)
+  result = load_chn_syllables(path)
+
+  assert result == {"peɪ˧˩˧": ('p', 'e', 'ɪ˧˩˧')}
+
+
+def test_load_chn_syllables__other_dragonmapper_version__returns_none(tmp_path):
+  path = tmp_path / "syllables.json"
+  path.write_text(json.dumps({"dragonmapper_version": "0.0.0", "syllables": {}}), encoding="utf-8")
+
+  result = load_chn_syllables(path)
+
+  assert result is None
+
+
+def test_get_chn_syllables__is_saved(tmp_path, monkeypatch):
+  use_tmp_cache_dir(tmp_path, monkeypatch)
+
+  result = get_chn_syllables()
+
+  assert load_chn_syllables(tmp_path / "chn_syllables_ipa.json") == result
+
+
+def test_get_chn_syllable_ipa__unknown_syllable(tmp_path, monkeypatch):
+  use_tmp_cache_dir(tmp_path, monkeypatch)
+
+  result = get_chn_syllable_ipa("abc")
+
+  assert result == ('a', 'b', 'c')
+  assert "abc" not in get_chn_syllables()
+  assert chinese_ipa.CHN_UNKNOWN_SYLLABLES == {"abc": ('a', 'b', 'c')}
+
+
+def test_get_chn_syllable_ipa__unknown_syllables_are_bounded(tmp_path, monkeypatch):
+  use_tmp_cache_dir(tmp_path, monkeypatch)
+  monkeypatch.setattr(chinese_ipa, "DEFAULT_MAX_UNKNOWN_SYLLABLES", 2)
+
+  for syllable in ("abc", "abd", "abf", "abg", "abh"):
+    get_chn_syllable_ipa(syllable)
+
+  assert len(chinese_ipa.CHN_UNKNOWN_SYLLABLES) <= 2
+
+
 def test_get_vowel_count__two():
   result = get_vowel_count(
     symbols=("a", "b", "aa",),
@@ -47,7 +119,8 @@ def test_get_vowel_count__zero():
   assert result == 0
 
 
-def test_chn_to_ipa():
+def test_chn_to_ipa(tmp_path, monkeypatch):
+  use_tmp_cache_dir(tmp_path, monkeypatch)
   result = chn_to_ipa(
     chn_sentence=tuple("石头 北 冷。"),
     consider_annotations=False,
@@ -58,7 +131,8 @@ def test_chn_to_ipa():
   assert result == ('ʂ', 'ɨ˧˥', 'tʰ', 'o','ʊ', ' ', 'p', 'e','ɪ˧˩˧', ' ', 'l', 'ɤ˧˩˧', 'ŋ', '.')
 
 
-def test_chn_to_ipa__only_vowels():
+def test_chn_to_ipa__only_vowels(tmp_path, monkeypatch):
+  use_tmp_cache_dir(tmp_path, monkeypatch)
   result = chn_to_ipa(
     chn_sentence=tuple("阿阿"),
     consider_annotations=False,
@@ -69,7 +143,8 @@ def test_chn_to_ipa__only_vowels():
   assert result == ('a˥', 'a˥')
 
 
-def test_chn_to_ipa__with_multiple_same_words():
+def test_chn_to_ipa__with_multiple_same_words(tmp_path, monkeypatch):
+  use_tmp_cache_dir(tmp_path, monkeypatch)
   result = chn_to_ipa(
     chn_sentence=tuple("！石 石？ 石。"),
     consider_annotations=False,
@@ -80,7 +155,8 @@ def test_chn_to_ipa__with_multiple_same_words():
   assert result == ('!', 'ʂ', 'ɨ˧˥', ' ', 'ʂ', 'ɨ˧˥', '?', ' ', 'ʂ', 'ɨ˧˥', '.')
 
 
-def test_chn_to_ipa__replaces_punctuation():
+def test_chn_to_ipa__replaces_punctuation(tmp_path, monkeypatch):
+  use_tmp_cache_dir(tmp_path, monkeypatch)
   result = chn_to_ipa(
     chn_sentence=tuple("石头！ 北： 冷。 ？"),
     consider_annotations=False,
@@ -92,7 +168,8 @@ def test_chn_to_ipa__replaces_punctuation():
                     ':', ' ', 'l', 'ɤ˧˩˧', 'ŋ', '.', ' ', '?')
 
 
-def test_chn_to_ipa__sentence():
+def test_chn_to_ipa__sentence(tmp_path, monkeypatch):
+  use_tmp_cache_dir(tmp_path, monkeypatch)
   result = chn_to_ipa(
     chn_sentence=tuple("仅 绘画 而论 齐白石 是 巍巍 昆仑 可 这位 附庸风雅 的 门外汉 连 一块 石头 都 不是"),
     consider_annotations=False,
@@ -0,0 +1,53 @@
+import pytest
+from ordered_set import OrderedSet
+from text_utils.pronunciation.compiled_pronunciation_dict import (
+    compile_pronunciation_dict, load_compiled_pronunciation_dict)
+
+
+def test_compile_pronunciation_dict__lookup(tmp_path):
+  path = tmp_path / "dict.bin"
+  compile_pronunciation_dict({
+    "test": OrderedSet([("T", "EH1", "S", "T")]),
+    "a": OrderedSet([("AH0",), ("EY1",)]),
+    "ärger": OrderedSet([("EH1", "R", "G", "ER0")]),
+  }, path)
+
+  result = load_compiled_pronunciation_dict(path)
+
+  assert len(result) == 3
+  assert result[tuple("TEST")] == (("T", "EH1", "S", "T"),)
+  assert result["A"] == (("AH0",), ("EY1",))
+  assert result[tuple("ÄRGER")][0] == ("EH1", "R", "G", "ER0")
+  assert tuple("TEST") in result
+  assert tuple("test") not in result
+  assert tuple("TES") not in result
+  assert tuple("TESTS") not in result
+  assert set(result) == {tuple("A"), tuple("TEST"), tuple("ÄRGER")}
+
+
+def test_compile_pronunciation_dict__empty(tmp_path):
+  path = tmp_path / "dict.bin"
+  compile_pronunciation_dict({}, path)
+
+  result = load_compiled_pronunciation_dict(path)
+
+  assert len(result) == 0
+  assert tuple("A") not in result
+
+
+def test_load_compiled_pronunciation_dict__missing_key__raises_key_error(tmp_path):
+  path = tmp_path / "dict.bin"
+  compile_pronunciation_dict({"a": OrderedSet([("AH0",)])}, path)
+
+  result = load_compiled_pronunciation_dict(path)
+
+  with pytest.raises(KeyError):
+    _ = result[tuple("B")]
+
+
+def test_load_compiled_pronunciation_dict__no_compiled_dict__raises_value_error(tmp_path):
+  path = tmp_path / "dict.bin"
+  path.write_bytes(b"abcdefghijklmnopq")
+
+  with pytest.raises(ValueError):
+    load_compiled_pronunciation_dict(path)
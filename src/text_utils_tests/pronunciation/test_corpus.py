@@ -0,0 +1,91 @@
+from text_utils.language import Language
+from text_utils.pronunciation import chinese_ipa
+from text_utils.pronunciation import corpus as corpus_module
+from text_utils.pronunciation.corpus import (get_chunks, symbols_to_ipa_corpus,
+                                             symbols_to_ipa_corpus_iterable)
+from text_utils.symbol_format import SymbolFormat
+
+
+def test_get_chunks():
+  result = list(get_chunks(iter([("a",), ("b",), ("c",)]), chunksize=2))
+
+  assert result == [[("a",), ("b",)], [("c",)]]
+
+
+def test_symbols_to_ipa_corpus__keeps_order():
+  corpus = [tuple(str(i)) for i in range(100)]
+
+  result = symbols_to_ipa_corpus(
+    corpus=corpus,
+    symbols_format=SymbolFormat.PHONEMES_IPA,
+    lang=Language.ENG,
+    mode=None,
+    consider_annotations=False,
+    n_jobs=2,
+    chunksize=3,
+  )
+
+  assert result == [(symbols, SymbolFormat.PHONEMES_IPA) for symbols in corpus]
+
+
+def test_symbols_to_ipa_corpus__passes_max_pending_chunks(monkeypatch):
+  arguments = {}
+
+  def symbols_to_ipa_corpus_iterable_mock(corpus, **kwargs):
+    arguments.update(kwargs)
+    return iter(())
+
+  monkeypatch.setattr(corpus_module, "symbols_to_ipa_corpus_iterable",
+                      symbols_to_ipa_corpus_iterable_mock)
+
+  symbols_to_ipa_corpus(
+    corpus=[("a",)],
+    symbols_format=SymbolFormat.PHONEMES_IPA,
+    lang=Language.ENG,
+    mode=None,
+    consider_annotations=False,
+    n_jobs=2,
+    max_pending_chunks=1,
+  )
+
+  assert arguments["max_pending_chunks"] == 1
+
+
+def test_symbols_to_ipa_corpus_iterable__single_job__is_lazy():
+  def get_corpus():
+    yield ("a",)
+    raise AssertionError()
+
+  result = symbols_to_ipa_corpus_iterable(
+    corpus=get_corpus(),
+    symbols_format=SymbolFormat.PHONEMES_IPA,
+    lang=Language.ENG,
+    mode=None,
+    consider_annotations=False,
+    n_jobs=1,
+    chunksize=1,
+  )
+
+  assert next(result) == (("a",), SymbolFormat.PHONEMES_IPA)
+
+
+def test_symbols_to_ipa_corpus_iterable__chinese(tmp_path, monkeypatch):
+  monkeypatch.setenv("TEXT_UTILS_CACHE_DIR", str(tmp_path))
+  monkeypatch.setattr(chinese_ipa, "CHN_SYLLABLES", None)
+  corpus = [tuple("堡包"), tuple("儿")] * 5
+
+  result = list(symbols_to_ipa_corpus_iterable(
+    corpus=corpus,
+    symbols_format=SymbolFormat.GRAPHEMES,
+    lang=Language.CHN,
+    mode=None,
+    consider_annotations=False,
+    n_jobs=2,
+    chunksize=1,
+    max_pending_chunks=2,
+  ))
+
+  assert result == [
+    (('p', 'ɑ', 'ʊ˧˩˧', 'p', 'ɑ', 'ʊ˥'), SymbolFormat.PHONEMES_IPA),
+    (('ɻ',), SymbolFormat.PHONEMES_IPA),
+  ] * 5
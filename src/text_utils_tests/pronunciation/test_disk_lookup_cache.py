@@ -0,0 +1,107 @@
+import gc
+import pickle
+
+from text_utils.language import Language
+from text_utils.pronunciation.disk_lookup_cache import (
+    DiskLookupCache, get_lookup_cache_namespace)
+from text_utils.pronunciation.main import EngToIPAMode
+from text_utils.symbol_format import SymbolFormat
+
+
+def test_get_lookup_cache_namespace():
+  result = get_lookup_cache_namespace(
+    symbols_format=SymbolFormat.PHONEMES_IPA,
+    lang=Language.ENG,
+    mode=EngToIPAMode.EPITRAN,
+    ignore_case=True,
+  )
+
+  assert result == "v2/PHONEMES_IPA/ENG/EPITRAN/ignore_case"
+
+
+def test_get_lookup_cache_namespace__no_mode():
+  result = get_lookup_cache_namespace(
+    symbols_format=SymbolFormat.PHONEMES_IPA,
+    lang=Language.GER,
+    mode=None,
+    ignore_case=False,
+  )
+
+  assert result == "v2/PHONEMES_IPA/GER//match_case"
+
+
+def test_disk_lookup_cache__persists_between_instances(tmp_path):
+  path = tmp_path / "cache.sqlite"
+  with DiskLookupCache(path, namespace="a") as cache:
+    cache[("T", "E", "S", "T")] = ("t", "ɛ", "s", "t")
+
+  with DiskLookupCache(path, namespace="a") as cache:
+    assert ("T", "E", "S", "T") in cache
+    assert cache[("T", "E", "S", "T")] == ("t", "ɛ", "s", "t")
+    assert len(cache) == 1
+    assert list(cache) == [("T", "E", "S", "T")]
+
+
+def test_disk_lookup_cache__namespaces_are_separated(tmp_path):
+  path = tmp_path / "cache.sqlite"
+  with DiskLookupCache(path, namespace="a") as cache:
+    cache[("A",)] = ("a",)
+
+  with DiskLookupCache(path, namespace="b") as cache:
+    assert ("A",) not in cache
+    assert len(cache) == 0
+
+
+def test_disk_lookup_cache__unflushed_entries_are_visible(tmp_path):
+  path = tmp_path / "cache.sqlite"
+  cache = DiskLookupCache(path, namespace="a", commit_every=100)
+  cache[("A",)] = ("a",)
+
+  assert cache[("A",)] == ("a",)
+  assert len(cache) == 1
+  cache.close()
+
+
+def test_disk_lookup_cache__delete(tmp_path):
+  path = tmp_path / "cache.sqlite"
+  with DiskLookupCache(path, namespace="a") as cache:
+    cache[("A",)] = ("a",)
+    del cache[("A",)]
+
+    assert ("A",) not in cache
+
+
+def test_disk_lookup_cache__pickle(tmp_path):
+  path = tmp_path / "cache.sqlite"
+  cache = DiskLookupCache(path, namespace="a")
+  cache[("A",)] = ("a",)
+
+  unpickled_cache = pickle.loads(pickle.dumps(cache))
+
+  assert unpickled_cache[("A",)] == ("a",)
+  cache.close()
+  unpickled_cache.close()
+
+
+def test_disk_lookup_cache__unclosed_cache_is_flushed_when_collected(tmp_path):
+  path = tmp_path / "cache.sqlite"
+  cache = DiskLookupCache(path, namespace="a", commit_every=100)
+  cache[("A",)] = ("a",)
+  del cache
+  gc.collect()
+
+  with DiskLookupCache(path, namespace="a") as cache:
+    assert cache[("A",)] == ("a",)
+
+
+def test_disk_lookup_cache__memory_is_bounded(tmp_path):
+  path = tmp_path / "cache.sqlite"
+  with DiskLookupCache(path, namespace="a", commit_every=100, max_memory_entries=2) as cache:
+    cache[("A",)] = ("a",)
+    cache[("B",)] = ("b",)
+    cache[("C",)] = ("c",)
+
+    assert len(cache._memory) == 2
+    # the evicted entry is not committed yet
+    assert cache[("A",)] == ("a",)
+    assert len(cache._memory) == 2
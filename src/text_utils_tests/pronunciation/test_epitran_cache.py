@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+from logging import INFO, WARNING, getLogger
+
+from text_utils.pronunciation.epitran_cache import (
+    DEFAULT_TRANSLITERATION_CACHE_SIZE, EPITRAN_GER, EPITRAN_LOGGER_NAME,
+    TRANSLITERATION_CACHE, clear_transliteration_cache, get_ger_epitran,
+    set_transliteration_cache_size, transliterate)
+
+
+def test_get_ger_epitran__keeps_root_logger_level():
+  root_logger = getLogger()
+  old_level = root_logger.level
+  root_logger.setLevel(INFO)
+
+  get_ger_epitran()
+
+  assert root_logger.level == INFO
+  assert getLogger(EPITRAN_LOGGER_NAME).level == WARNING
+  root_logger.setLevel(old_level)
+
+
+def test_transliterate():
+  clear_transliteration_cache()
+
+  result = transliterate(EPITRAN_GER, "Hallo")
+
+  assert result == get_ger_epitran().transliterate("Hallo")
+  assert TRANSLITERATION_CACHE[(EPITRAN_GER, "Hallo")] == result
+
+
+def test_transliterate__is_bounded():
+  clear_transliteration_cache()
+  set_transliteration_cache_size(2)
+
+  transliterate(EPITRAN_GER, "a")
+  transliterate(EPITRAN_GER, "b")
+  transliterate(EPITRAN_GER, "a")
+  transliterate(EPITRAN_GER, "c")
+
+  assert list(TRANSLITERATION_CACHE.keys()) == [(EPITRAN_GER, "a"), (EPITRAN_GER, "c")]
+  set_transliteration_cache_size(0)
+  assert len(TRANSLITERATION_CACHE) == 0
+  transliterate(EPITRAN_GER, "a")
+  assert len(TRANSLITERATION_CACHE) == 0
+  set_transliteration_cache_size(DEFAULT_TRANSLITERATION_CACHE_SIZE)
+
+
+def test_transliterate__threads():
+  clear_transliteration_cache()
+  words = ["Hallo", "Welt", "Test", "Haus"] * 50
+
+  with ThreadPoolExecutor(max_workers=4) as executor:
+    result = list(executor.map(lambda word: transliterate(EPITRAN_GER, word), words))
+
+  assert result == [get_ger_epitran().transliterate(word) for word in words]
@@ -2,15 +2,19 @@ import pytest
 from text_utils.language import Language
 from text_utils.pronunciation.ipa2symb import (
     add_n_thongs, break_n_thongs, get_all_next_consecutive_merge_symbols,
-    get_longest_possible_length, get_longest_template_with_ignore,
+    get_ipa_transform, get_longest_possible_length,
+    get_longest_template_with_ignore,
     get_next_consecutive_fusion_symbols_and_index,
     get_next_fused_symbols_and_index, get_next_merged_left_symbol_and_index,
     get_next_merged_right_symbol_and_index,
     get_next_merged_together_symbol_and_index, is_n_thong,
-    merge_fusion_with_ignore, merge_left, merge_left_core, merge_right,
-    merge_right_core, merge_template, merge_template_with_ignore,
-    merge_together, remove_arcs, remove_ignore_at_end, split_string_to_tuple,
-    strip_off_ignore, try_update_longest_template)
+    merge_fusion_with_ignore, merge_fusion_with_ignore_core, merge_left,
+    merge_left_core, merge_right, merge_right_core, merge_template,
+    merge_template_with_ignore, merge_template_with_ignore_core,
+    merge_template_with_ignore_trie, merge_together,
+    parse_ipa_symbols_to_symbols, remove_arcs, remove_ignore_at_end,
+    remove_stress, remove_tones, split_string_to_tuple, strip_off_ignore,
+    tokenize_ipa, try_update_longest_template)
 
 
 def test_remove_arcs__empty_input():
@@ -144,6 +148,26 @@ def test_merge_template_with_ignore():
   assert res == ("ab:c", "d")
 
 
+def test_merge_template_with_ignore_trie__takes_longest_template():
+  result = merge_template_with_ignore_trie(
+    symbols=("a", "b", "ˈc", "d", "ˌ", "a"),
+    template={"ab", "abc", "abcde"},
+    ignore={"ˈ", "ˌ"},
+  )
+
+  assert result == ("abˈc", "d", "ˌ", "a")
+
+
+def test_merge_template_with_ignore_trie__equals_core():
+  symbols = ("b", "a", "ˈa", "ɪ\u031D", "a", "ˌ", "ʊ", "ˌ", "o", "ʊ", "ɪ", "e", "ɪ", "ˈ") * 10
+  template = {"aʊ", "aɪ", "eɪ", "oʊ", "ɔɪ"}
+  ignore = {"ˈ", "ˌ", "\u031D"}
+
+  result = merge_template_with_ignore_trie(symbols, template, ignore)
+
+  assert result == merge_template_with_ignore_core(symbols, template, ignore)
+
+
 def test_merge_template_with_ignore__ignore_symbol_is_also_part_of_template__raise_assertion_error():
   symbols = ("aba", "c", "d")
   template = {"abc", "def"}
@@ -492,6 +516,16 @@ def test_merge_fusion_with_ignore__empty_ignore_set():
 # region get_next_fused_symbols_and_index
 
 
+def test_merge_fusion_with_ignore__equals_core():
+  symbols = ("p", "e", "ɪ˧˩˧", " ", "ˈa", "ʊ", "ː", "ɪ", "x", "a", "ˌ", "o", "ɤ˥", "ŋ") * 10
+  fusion_symbols = {"a", "e", "ɪ", "ʊ", "o", "ɤ"}
+  ignore = {"ˈ", "ˌ", "˧", "˩", "˥", "ː"}
+
+  result = merge_fusion_with_ignore(symbols, fusion_symbols, ignore)
+
+  assert result == merge_fusion_with_ignore_core(symbols, fusion_symbols, ignore)
+
+
 def test_get_next_fused_symbols_and_index__first_symbol_is_not_fusion_symbol():
   symbols = ("c", "b:")
   fusion_symbols = {"a", "b"}
@@ -1129,3 +1163,82 @@ def test_get_next_merged_right_symbol_and_index__index_is_zero__first_symbol_is_
 #   result = ipa_str_to_list(ipa_str, ignore_tones=False, ignore_arcs=False, merge_stress=False)
 
 #   assert result == ["ˌ", "ˈ"]
+
+
+def test_tokenize_ipa__empty():
+  result = tokenize_ipa("")
+
+  assert result == ()
+
+
+def test_tokenize_ipa__merges_ties_appendix_and_stresses():
+  result = tokenize_ipa("ˈt͡ʃaː ˌˈbɪ˧˩˧.")
+
+  assert result == ("ˈt͡ʃ", "aː", " ", "ˌˈb", "ɪ˧˩˧", ".")
+
+
+def test_tokenize_ipa__stresses_before_punctuation_are_not_merged():
+  result = tokenize_ipa("aˈ ˌ")
+
+  assert result == ("a", "ˈ", " ", "ˌ")
+
+
+def test_tokenize_ipa__appendix_after_punctuation_takes_stress():
+  result = tokenize_ipa("ˈ ːˈː")
+
+  assert result == ("ˈ", " ", "ː", "ˈː")
+
+
+def test_tokenize_ipa__ties_without_following_symbol_are_not_merged():
+  result = tokenize_ipa("t͡ ͡ʃ͡")
+
+  assert result == ("t", "͡", " ", "͡", "ʃ", "͡")
+
+
+def test_tokenize_ipa__equals_parse_ipa_symbols_to_symbols():
+  sentences = [
+    "ðɪs ɪz ə ˈtɛst.",
+    "peɪ˧˩˧ fɤ˥ŋ",
+    "ˈˈaːː͡͡bʰ,͡ˌ",
+    "t̪͡s ͜ʃ ˌa͡ɪ̯ː!",
+  ]
+
+  for sentence in sentences:
+    assert tokenize_ipa(sentence) == parse_ipa_symbols_to_symbols(tuple(sentence))
+
+
+def test_get_ipa_transform__is_cached():
+  result = get_ipa_transform(ignore_tones=True, ignore_arcs=False,
+                             ignore_stress=False, break_n_thongs=False)
+
+  assert result is get_ipa_transform(ignore_tones=True, ignore_arcs=False,
+                                     ignore_stress=False, break_n_thongs=False)
+
+
+def test_ipa_transform__nothing_to_do__returns_symbols():
+  transform = get_ipa_transform(ignore_tones=False, ignore_arcs=False,
+                                ignore_stress=False, break_n_thongs=False)
+
+  result = transform(("ˈt͡ʃ", "a˧", "", " "))
+
+  assert result == ("ˈt͡ʃ", "a˧", "", " ")
+
+
+def test_ipa_transform__removes_arcs_tones_and_stress():
+  symbols = ("ˈt͡ʃ", "a˧˩", "˧", "˧ˈ", "ˈ", " ", "", "͡", "ˌa͡ɪ")
+  transform = get_ipa_transform(ignore_tones=True, ignore_arcs=True,
+                                ignore_stress=True, break_n_thongs=False)
+
+  result = transform(symbols)
+
+  assert result == remove_stress(remove_tones(remove_arcs(symbols)))
+  assert result == ("t", "ʃ", "a", " ", "a", "ɪ")
+
+
+def test_ipa_transform__break_n_thongs():
+  transform = get_ipa_transform(ignore_tones=False, ignore_arcs=False,
+                                ignore_stress=True, break_n_thongs=True)
+
+  result = transform(("ˈaɪ", "t͡ʃ", "ɪ˧"))
+
+  assert result == ("a", "ɪ", "t͡ʃ", "ɪ˧")
@@ -0,0 +1,147 @@
+import pickle
+
+from sentence2pronunciation.core import sentence2pronunciation_cached
+from text_utils.pronunciation.lru_lookup_cache import (LookupCacheStatistics,
+                                                       LRULookupCache,
+                                                       get_entry_size)
+
+
+def test_statistics__failed_lookups_of_same_word():
+  cache = LRULookupCache()
+  for _ in range(3):
+    assert cache.get(tuple("TEST")) is None
+
+  assert cache.hits == 0
+  assert cache.misses == 3
+
+
+def test_statistics__lookup_after_insertion():
+  cache = LRULookupCache()
+  cache[tuple("TEST")] = tuple("TEST")
+
+  assert cache[tuple("TEST")] == tuple("TEST")
+  assert cache.hits == 1
+  assert cache.misses == 0
+
+
+def test_statistics__insertion_is_not_counted():
+  cache = LRULookupCache()
+  cache[tuple("TEST")] = tuple("TEST")
+  cache[tuple("ABC")] = tuple("ABC")
+
+  assert cache.hits == 0
+  assert cache.misses == 0
+
+
+def test_statistics__contains():
+  cache = LRULookupCache()
+  cache[tuple("TEST")] = tuple("TEST")
+
+  assert tuple("TEST") in cache
+  assert tuple("ABC") not in cache
+  assert cache.hits == 1
+  assert cache.misses == 1
+
+
+def test_statistics__sentence2pronunciation_cached():
+  cache = LRULookupCache()
+
+  result = sentence2pronunciation_cached(
+    sentence=tuple("ab ab cd"),
+    annotation_split_symbol=None,
+    consider_annotation=False,
+    get_pronunciation=lambda word: word,
+    split_on_hyphen=False,
+    trim_symbols=set(),
+    ignore_case_in_cache=True,
+    cache=cache,
+  )
+
+  assert result == tuple("ab ab cd")
+  # the first lookups of "ab" and "cd" miss, the second "ab" is found
+  assert cache.misses == 2
+  assert cache.hits >= 1
+
+
+def test_setitem__max_entries__evicts_least_recently_used():
+  cache = LRULookupCache(max_entries=2)
+  cache[("a",)] = ("A",)
+  cache[("b",)] = ("B",)
+  assert cache[("a",)] == ("A",)
+  cache[("c",)] = ("C",)
+
+  assert list(cache) == [("a",), ("c",)]
+  assert cache.evictions == 1
+
+
+def test_setitem__contains_counts_as_use():
+  cache = LRULookupCache(max_entries=2)
+  cache[("a",)] = ("A",)
+  cache[("b",)] = ("B",)
+  assert ("a",) in cache
+  cache[("c",)] = ("C",)
+
+  assert list(cache) == [("a",), ("c",)]
+
+
+def test_setitem__max_bytes():
+  size = get_entry_size(("a",), ("A",))
+  cache = LRULookupCache(max_entries=None, max_bytes=2 * size)
+  cache[("a",)] = ("A",)
+  cache[("b",)] = ("B",)
+  cache[("c",)] = ("C",)
+
+  assert list(cache) == [("b",), ("c",)]
+  assert cache.size_bytes == 2 * size
+  assert cache.evictions == 1
+
+
+def test_setitem__max_bytes__keeps_latest_entry():
+  cache = LRULookupCache(max_entries=None, max_bytes=1)
+  cache[("a",)] = ("A",)
+  cache[("b",)] = ("B",)
+
+  assert list(cache) == [("b",)]
+
+
+def test_setitem__overwrite__updates_size():
+  cache = LRULookupCache()
+  cache[("a",)] = ("A",)
+  cache[("a",)] = ("A", "B")
+
+  assert len(cache) == 1
+  assert cache.size_bytes == get_entry_size(("a",), ("A", "B"))
+
+
+def test_delitem__updates_size():
+  cache = LRULookupCache()
+  cache[("a",)] = ("A",)
+  del cache[("a",)]
+
+  assert len(cache) == 0
+  assert cache.size_bytes == 0
+
+
+def test_get_statistics():
+  cache = LRULookupCache(max_entries=1)
+  cache[("a",)] = ("A",)
+  cache[("b",)] = ("B",)
+  assert cache[("b",)] == ("B",)
+  assert cache.get(("b",)) == ("B",)
+  assert cache.get(("a",)) is None
+
+  result = cache.get_statistics()
+
+  assert result == LookupCacheStatistics(
+    hits=2, misses=1, evictions=1, entries=1, size_bytes=get_entry_size(("b",), ("B",)))
+  cache.reset_statistics()
+  assert cache.get_statistics().hits == 0
+
+
+def test_pickle():
+  cache = LRULookupCache(max_entries=2)
+  cache[("a",)] = ("A",)
+
+  result = pickle.loads(pickle.dumps(cache))
+
+  assert dict(result) == {("a",): ("A",)}
@@ -3,14 +3,18 @@ import pytest
 from ordered_set import OrderedSet
 from sentence2pronunciation.lookup_cache import get_empty_cache
 from text_utils.language import Language
+from text_utils.pronunciation import main
 from text_utils.pronunciation.main import (EngToIPAMode, __get_arpa_oov,
                                            __get_eng_ipa, __get_ger_ipa,
-                                           eng_to_arpa, eng_to_ipa,
-                                           eng_to_ipa_epitran,
+                                           eng_to_arpa, eng_to_arpa_batch,
+                                           eng_to_ipa, eng_to_ipa_epitran,
                                            eng_to_ipa_pronunciation_dict,
-                                           ger_to_ipa, symbols_to_arpa,
+                                           ger_to_ipa, get_arpa_oov_words,
+                                           symbols_to_arpa,
                                            symbols_to_arpa_pronunciation_dict,
                                            symbols_to_ipa)
+from text_utils.pronunciation.oov_collector import (start_oov_collection,
+                                                    stop_oov_collection)
 from text_utils.symbol_format import SymbolFormat
 from text_utils.types import Symbol
 
@@ -25,6 +29,70 @@ def test_eng_to_arpa():
   assert result == ('DH', 'IH0', 'S', ' ', 'IH0', 'Z', ' ', 'AH0', ' ', 'T', 'EH1', 'S', 'T', ".",)
 
 
+def test_eng_to_arpa_batch():
+  cache = get_empty_cache()
+  result = eng_to_arpa_batch(
+    eng_sentences=[tuple("This is a test."), tuple("A test.")],
+    consider_annotations=False,
+    cache=cache,
+  )
+
+  assert result == [
+    ('DH', 'IH0', 'S', ' ', 'IH0', 'Z', ' ', 'AH0', ' ', 'T', 'EH1', 'S', 'T', ".",),
+    ('AH0', ' ', 'T', 'EH1', 'S', 'T', ".",),
+  ]
+
+
+def test_eng_to_arpa_batch__oov_words_are_predicted_once():
+  cache = get_empty_cache()
+  result = eng_to_arpa_batch(
+    eng_sentences=[tuple("xyzzyq test"), tuple("xyzzyq.")],
+    consider_annotations=False,
+    cache=cache,
+  )
+
+  assert result[0][:-5] == result[1][:-1]
+  assert result[0][-5:] == (' ', 'T', 'EH1', 'S', 'T')
+
+
+def test_get_arpa_oov_words__collector_counts_occurrences():
+  collector = start_oov_collection()
+  cache = {tuple("ABC."): ("AH0",)}
+  dictionary = {tuple("TEST"): (("T", "EH1", "S", "T"),)}
+
+  result = get_arpa_oov_words(
+    eng_sentences=[tuple("xyz test abc."), tuple("xyz abc. xyz")],
+    consider_annotations=False,
+    dictionary=dictionary,
+    cache=cache,
+  )
+  stop_oov_collection()
+
+  assert result == OrderedSet([tuple("xyz")])
+  assert collector.get_most_common() == [(tuple("xyz"), 2), (tuple("abc"), 2)]
+
+
+def test_eng_to_arpa_batch__cached_oov_words_are_not_predicted_again(monkeypatch):
+  predicted_words = []
+
+  def predict_batch(_, words):
+    predicted_words.extend(words)
+    return [("Z", "IH1", "Z")] * len(words)
+
+  monkeypatch.setattr(main, "get_eng_pronunciation_dict_arpa", lambda: {
+    tuple("TEST"): OrderedSet([("T", "EH1", "S", "T")]),
+  })
+  monkeypatch.setattr(main, "get_eng_g2p", lambda: None)
+  monkeypatch.setattr(main, "predict_batch", predict_batch)
+  cache = {}
+
+  result1 = eng_to_arpa_batch([tuple("xyz, test.")], consider_annotations=False, cache=cache)
+  result2 = eng_to_arpa_batch([tuple("xyz, test.")], consider_annotations=False, cache=cache)
+
+  assert predicted_words == ["xyz"]
+  assert result1 == result2 == [("Z", "IH1", "Z", ",", " ", "T", "EH1", "S", "T", ".")]
+
+
 def test_get_arpa_oov():
   result = __get_arpa_oov(tuple("test"))
 
@@ -89,6 +157,34 @@ def test_eng_to_ipa_pronunciation_dict__dont_merge_diphtongs():
   assert result == ('ɪ', 'm', 'ˈi', 'd', 'i', 'ʌ', 't', 'l', 'i')
 
 
+def test_eng_to_ipa__librispeech__annotations_dont_change_cache(monkeypatch):
+  monkeypatch.setattr(main, "get_eng_pronunciation_dict_ipa", lambda: {
+    tuple("A"): OrderedSet([("ʌ",)]),
+    tuple("TEST"): OrderedSet([("t", "ˈɛ", "s", "t")]),
+  })
+  cache = {}
+
+  result_annotated = eng_to_ipa(
+    eng_sentence=("a", " ", "/", "T", "/", " ", "t", "e", "s", "t"),
+    consider_annotations=True,
+    mode=EngToIPAMode.LIBRISPEECH,
+    cache=cache,
+  )
+  result = eng_to_ipa(
+    eng_sentence=tuple("a test"),
+    consider_annotations=True,
+    mode=EngToIPAMode.LIBRISPEECH,
+    cache=cache,
+  )
+
+  assert result_annotated == ('ʌ', ' ', 't', ' ', 't', 'ˈɛ', 's', 't')
+  assert result == ('ʌ', ' ', 't', 'ˈɛ', 's', 't')
+  assert cache == {
+    tuple("A"): ("ʌ",),
+    tuple("TEST"): ("t", "ˈɛ", "s", "t"),
+  }
+
+
 def test_eng_to_ipa__epitran():
   result = eng_to_ipa(
     eng_sentence=tuple("This is a test."),
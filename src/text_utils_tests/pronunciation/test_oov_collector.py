@@ -0,0 +1,73 @@
+from ordered_set import OrderedSet
+from text_utils.pronunciation.oov_collector import (OOVCollector,
+                                                    get_oov_collector,
+                                                    start_oov_collection,
+                                                    stop_oov_collection)
+
+
+def test_get_pronunciation_dict__most_common_first():
+  collector = OOVCollector()
+  collector.add_occurrence(tuple("abc"))
+  collector.add_occurrence(tuple("xyz"))
+  collector.add_occurrence(tuple("xyz"))
+  collector.add_pronunciation(tuple("abc"), ("AE1", "B", "K"))
+  collector.add_pronunciation(tuple("xyz"), ("Z", "IH1"))
+  collector.add_pronunciation(tuple("def"), ("D", "EH1", "F"))
+
+  result = collector.get_pronunciation_dict()
+
+  assert list(result.items()) == [
+    ("xyz", OrderedSet([("Z", "IH1")])),
+    ("abc", OrderedSet([("AE1", "B", "K")])),
+    ("def", OrderedSet([("D", "EH1", "F")])),
+  ]
+
+
+def test_get_pronunciation_dict__counted_only_is_ignored():
+  collector = OOVCollector()
+  collector.add_occurrence(tuple("abc"))
+
+  result = collector.get_pronunciation_dict()
+
+  assert result == {}
+
+
+def test_save_pronunciation_dict(tmp_path):
+  collector = OOVCollector()
+  collector.add_pronunciation(tuple("abc"), ("AE1", "B", "K"))
+  collector.add_pronunciation(tuple("xyz"), ("Z", "IH1"))
+  path = tmp_path / "sub" / "oov.dict"
+
+  collector.save_pronunciation_dict(path)
+
+  assert path.read_text(encoding="utf-8") == "abc  AE1 B K\nxyz  Z IH1\n"
+
+
+def test_clear():
+  collector = OOVCollector()
+  collector.add_occurrence(tuple("abc"))
+  collector.add_pronunciation(tuple("abc"), ("AE1", "B", "K"))
+
+  collector.clear()
+
+  assert collector.get_most_common() == []
+  assert collector.get_pronunciation_dict() == {}
+
+
+def test_start_stop_oov_collection(tmp_path):
+  collector = start_oov_collection()
+  assert get_oov_collector() is collector
+  collector.add_pronunciation(tuple("abc"), ("AE1", "B", "K"))
+  path = tmp_path / "oov.dict"
+
+  result = stop_oov_collection(path)
+
+  assert result is collector
+  assert get_oov_collector() is None
+  assert path.read_text(encoding="utf-8") == "abc  AE1 B K\n"
+
+
+def test_stop_oov_collection__not_started__returns_none():
+  result = stop_oov_collection()
+
+  assert result is None
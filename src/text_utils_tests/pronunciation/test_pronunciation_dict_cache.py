@@ -0,0 +1,41 @@
+from ordered_set import OrderedSet
+from text_utils.pronunciation.compiled_pronunciation_dict import \
+    load_compiled_pronunciation_dict
+from text_utils.pronunciation.pronunciation_dict_cache import (
+    arpa_pronunciation_dict_to_ipa, arpa_pronunciation_to_ipa,
+    compile_eng_pronunciation_dict)
+
+
+def test_arpa_pronunciation_to_ipa():
+  result = arpa_pronunciation_to_ipa(("T", "EH1", "S", "T"))
+
+  assert result == ("t", "ˈɛ", "s", "t")
+
+
+def test_arpa_pronunciation_to_ipa__is_reparsed():
+  result = arpa_pronunciation_to_ipa(("AY1",))
+
+  assert result == ("ˈa", "ɪ")
+
+
+def test_arpa_pronunciation_dict_to_ipa__merges_equal_pronunciations():
+  result = arpa_pronunciation_dict_to_ipa({
+    "test": OrderedSet([("T", "EH1", "S", "T")]),
+    "a": OrderedSet([("AH0",), ("AH",), ("EY1",)]),
+  })
+
+  assert result == {
+    "test": OrderedSet([("t", "ˈɛ", "s", "t")]),
+    "a": OrderedSet([("ʌ",), ("ˈe", "ɪ")]),
+  }
+
+
+def test_compile_eng_pronunciation_dict(tmp_path):
+  path = tmp_path / "sub" / "dict.bin"
+
+  result = compile_eng_pronunciation_dict(path, lambda: arpa_pronunciation_dict_to_ipa({
+    "test": OrderedSet([("T", "EH1", "S", "T")]),
+  }))
+
+  assert result == path
+  assert load_compiled_pronunciation_dict(path)[tuple("TEST")] == (("t", "ˈɛ", "s", "t"),)
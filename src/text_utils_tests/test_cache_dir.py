@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from text_utils.cache_dir import get_cache_dir
+
+
+def test_get_cache_dir__env(tmp_path, monkeypatch):
+  monkeypatch.setenv("TEXT_UTILS_CACHE_DIR", str(tmp_path))
+
+  result = get_cache_dir()
+
+  assert result == tmp_path
+
+
+def test_get_cache_dir__xdg_cache_home(tmp_path, monkeypatch):
+  monkeypatch.delenv("TEXT_UTILS_CACHE_DIR", raising=False)
+  monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+  result = get_cache_dir()
+
+  assert result == Path(tmp_path) / "text_utils"
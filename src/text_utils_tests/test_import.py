@@ -0,0 +1,12 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ["g2p_en", "epitran", "nltk", "dragonmapper", "inflect"]
+
+
+def test_import__does_not_load_heavy_modules():
+  code = f"import sys; import text_utils; print(','.join(module for module in {HEAVY_MODULES!r} if module in sys.modules))"
+
+  result = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+
+  assert result.stdout.strip() == ""
@@ -0,0 +1,46 @@
+import pytest
+from text_utils.language import Language
+from text_utils.sentence_tokenizers import (SENTENCE_TOKENIZERS,
+                                            get_punkt_resource_name,
+                                            get_sentence_tokenizer,
+                                            load_sentence_tokenizer,
+                                            tokenize_many)
+
+
+class DotTokenizer():
+  def __init__(self):
+    super().__init__()
+    self.calls = 0
+
+  def tokenize(self, text: str):
+    self.calls += 1
+    return [f"{sentence.strip()}." for sentence in text.split(".") if sentence.strip() != ""]
+
+
+def test_get_punkt_resource_name():
+  res = get_punkt_resource_name()
+  assert res in ("punkt", "punkt_tab")
+
+
+def test_load_sentence_tokenizer__chn__raises_value_error():
+  with pytest.raises(ValueError):
+    load_sentence_tokenizer(Language.CHN)
+
+
+def test_get_sentence_tokenizer__is_cached(monkeypatch):
+  tokenizer = DotTokenizer()
+  monkeypatch.setitem(SENTENCE_TOKENIZERS, Language.ENG, tokenizer)
+
+  res = get_sentence_tokenizer(Language.ENG)
+
+  assert res is tokenizer
+
+
+def test_tokenize_many(monkeypatch):
+  tokenizer = DotTokenizer()
+  monkeypatch.setitem(SENTENCE_TOKENIZERS, Language.GER, tokenizer)
+
+  res = tokenize_many(["Das ist. Ein Test.", "Hallo."], Language.GER)
+
+  assert res == [["Das ist.", "Ein Test."], ["Hallo."]]
+  assert tokenizer.calls == 2
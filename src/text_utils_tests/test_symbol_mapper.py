@@ -0,0 +1,63 @@
+from text_utils.symbol_mapper import SymbolMapper, can_translate
+from text_utils.utils import symbols_map
+
+
+def test_can_translate__single_characters():
+  assert can_translate({"。": ".", "？": "?"})
+
+
+def test_can_translate__multiple_characters__false():
+  assert not can_translate({"ab": "c"})
+
+
+def test_can_translate__replacement_contains_later_key__false():
+  assert not can_translate({"a": "b", "b": "c"})
+
+
+def test_can_translate__replacement_contains_earlier_key():
+  assert can_translate({"b": "c", "a": "b"})
+
+
+def test_map__outer_then_inner():
+  mapping = {"ab": "x", "b": "y"}
+  mapper = SymbolMapper(mapping)
+
+  res = mapper.map(("ab", "abc", "b", "c"))
+
+  assert res == ("x", "xc", "y", "c")
+  assert res == symbols_map(("ab", "abc", "b", "c"), mapping)
+
+
+def test_map__inner_is_applied_entry_by_entry():
+  mapping = {"a": "b", "b": "c"}
+  mapper = SymbolMapper(mapping)
+
+  res = mapper.map(("a", "xa", "b"))
+
+  assert res == ("c", "xc", "c")
+  assert res == symbols_map(("a", "xa", "b"), mapping)
+
+
+def test_map__translate():
+  mapping = {"。": ".", "，": ","}
+  mapper = SymbolMapper(mapping)
+
+  res = mapper.map(("a", "。", "b，", "，"))
+
+  assert res == ("a", ".", "b,", ",")
+  assert res == symbols_map(("a", "。", "b，", "，"), mapping)
+
+
+def test_map__memo_is_bounded():
+  mapper = SymbolMapper({"a": "b"}, max_memo_size=2)
+
+  res = mapper.map(("a", "c", "d", "a"))
+
+  assert res == ("b", "c", "d", "b")
+  assert len(mapper._memo) <= 2
+
+
+def test_map__empty():
+  mapper = SymbolMapper({"a": "b"})
+  res = mapper.map(())
+  assert res == ()
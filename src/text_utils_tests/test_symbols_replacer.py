@@ -0,0 +1,78 @@
+import pytest
+from text_utils.symbols_replacer import SymbolsReplacer
+
+
+def test_replace__only_one_occurence():
+  replacer = SymbolsReplacer([(("def", "hij",), ("123",))], ignore_case=True)
+  res = replacer.replace(("abc", "def", "hij", "klm",))
+  assert res == ("abc", "123", "klm",)
+
+
+def test_replace__two_occurences():
+  replacer = SymbolsReplacer([(("def", "hij",), ("123",))], ignore_case=True)
+  res = replacer.replace(("abc", "def", "hij", "klm", "def", "hij",))
+  assert res == ("abc", "123", "klm", "123",)
+
+
+def test_replace__no_occurence():
+  replacer = SymbolsReplacer([(("deF", "hij",), ("123",))], ignore_case=False)
+  res = replacer.replace(("abc", "def", "hij", "klm",))
+  assert res == ("abc", "def", "hij", "klm",)
+
+
+def test_replace__ignore_case():
+  replacer = SymbolsReplacer([(("deF", "hij",), ("123",))], ignore_case=True)
+  res = replacer.replace(("abc", "DEF", "hij", "klm",))
+  assert res == ("abc", "123", "klm",)
+
+
+def test_replace__replace_whole_list():
+  replacer = SymbolsReplacer([(("abc", "def", "hij", "klm",), ("abcdefg", "hijklmnop",))], ignore_case=False)
+  res = replacer.replace(("abc", "def", "hij", "klm",))
+  assert res == ("abcdefg", "hijklmnop",)
+
+
+def test_replace__many_replacements():
+  replacer = SymbolsReplacer([
+    (("a",), ("1",)),
+    (("b", "c",), ("2", "3",)),
+    (("d",), ()),
+  ], ignore_case=False)
+  res = replacer.replace(("a", "b", "c", "d", "e",))
+  assert res == ("1", "2", "3", "e",)
+
+
+def test_replace__longest_match_wins():
+  replacer = SymbolsReplacer([
+    (("a", "b",), ("1",)),
+    (("a", "b", "c",), ("2",)),
+    (("b", "c", "d",), ("3",)),
+  ], ignore_case=False)
+  res = replacer.replace(("a", "b", "c", "d",))
+  assert res == ("2", "d",)
+
+
+def test_replace__overlapping_suffix():
+  replacer = SymbolsReplacer([
+    (("a", "b", "c", "e",), ("1",)),
+    (("b", "c", "d",), ("2",)),
+  ], ignore_case=False)
+  res = replacer.replace(("a", "b", "c", "d",))
+  assert res == ("a", "2",)
+
+
+def test_replace__replacement_is_not_searched_again():
+  replacer = SymbolsReplacer([(("a",), ("a", "a",))], ignore_case=False)
+  res = replacer.replace(("a", "b", "a",))
+  assert res == ("a", "a", "b", "a", "a",)
+
+
+def test_replace__empty_symbols():
+  replacer = SymbolsReplacer([(("a",), ("b",))], ignore_case=False)
+  res = replacer.replace(())
+  assert res == ()
+
+
+def test_init__empty_search_for__raises_value_error():
+  with pytest.raises(ValueError):
+    SymbolsReplacer([((), ("b",))], ignore_case=False)
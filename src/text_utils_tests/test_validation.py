@@ -0,0 +1,56 @@
+import pytest
+from text_utils import validation
+from text_utils.symbol_id_dict import SymbolIdDict
+from text_utils.validation import (TRUSTED_MODE_ENV, get_trusted_mode_from_env,
+                                   is_trusted_mode, set_trusted_mode)
+
+
+def test_get_trusted_mode_from_env__not_set__is_strict(monkeypatch):
+  monkeypatch.delenv(TRUSTED_MODE_ENV, raising=False)
+
+  result = get_trusted_mode_from_env()
+
+  assert not result
+
+
+def test_get_trusted_mode_from_env__set(monkeypatch):
+  monkeypatch.setenv(TRUSTED_MODE_ENV, "True")
+
+  result = get_trusted_mode_from_env()
+
+  assert result
+
+
+def test_get_trusted_mode_from_env__zero__is_strict(monkeypatch):
+  monkeypatch.setenv(TRUSTED_MODE_ENV, "0")
+
+  result = get_trusted_mode_from_env()
+
+  assert not result
+
+
+def test_set_trusted_mode(monkeypatch):
+  # the mode is restored after the test
+  monkeypatch.setattr(validation, "TRUSTED_MODE", is_trusted_mode())
+
+  set_trusted_mode(True)
+  assert is_trusted_mode()
+  set_trusted_mode(False)
+  assert not is_trusted_mode()
+
+
+def test_get_id__strict__unknown_symbol_raises_assertion(monkeypatch):
+  monkeypatch.setattr(validation, "TRUSTED_MODE", False)
+  symbol_ids = SymbolIdDict.init_from_symbols({"a"})
+
+  with pytest.raises(AssertionError):
+    symbol_ids.get_id("b")
+
+
+def test_get_id__trusted__unknown_symbol_raises_key_error(monkeypatch):
+  monkeypatch.setattr(validation, "TRUSTED_MODE", True)
+  symbol_ids = SymbolIdDict.init_from_symbols({"a"})
+
+  with pytest.raises(KeyError):
+    symbol_ids.get_id("b")
+  assert symbol_ids.get_id("a") == 0